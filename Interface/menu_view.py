@@ -1,19 +1,66 @@
-from peewee import IntegrityError
-import random
+from bisect import bisect_left
+from functools import partial
+from peewee import DatabaseError, IntegrityError
 import re
+import time
 from textual.app import App, ComposeResult
 from textual.containers import Vertical
+from textual.message import Message
 from textual.widgets import Button, DataTable, Footer, Header, Input, Label, Static
+from textual.worker import get_current_worker
 
-from Interface.view_components import MenuPanel, VocabularyTablePanel, WordCapturePanel
+from Interface.view_components import MenuPanel, VocabularyTable, VocabularyTablePanel, WordCapturePanel
 from Interface.view_texts import RULES_TEXT, TENSES_TEXT
 from Services.storage.dictionary_pos_rules import build_dictionary_pos_mapping_help_text
-from Services.storage.vocabulary_service import InvalidEnglishExampleError, VocabularyService
+from Services.storage.vocabulary_service import (
+    VOCABULARY_PAGE_SIZE,
+    InvalidEnglishExampleError,
+    SaveCancelledError,
+    VocabularyService,
+)
+from Services.validation.rule_engine import LiveValidation
 from Services.validation.spanish_feedback import format_issue_es, format_suggestion_es
 
 
 class LearnEnglishApp(App):
+    class SaveFinished(Message):
+        """Result of a save run by `_save_word_in_thread`; `error` is set when nothing was saved."""
+
+        def __init__(
+            self,
+            request_id: int,
+            editing_entry,
+            entry,
+            validation,
+            error: Exception | None,
+            catalog_match,
+            example_english: str,
+        ) -> None:
+            super().__init__()
+            self.request_id = request_id
+            self.editing_entry = editing_entry
+            self.entry = entry
+            self.validation = validation
+            self.error = error
+            self.catalog_match = catalog_match
+            self.example_english = example_english
+
+    class LexiconWarmUp(Message):
+        """Progress of the rule engine warm-up: "dictionary", "rules", "ready" or "failed"."""
+
+        def __init__(self, phase: str) -> None:
+            super().__init__()
+            self.phase = phase
+
     TITLE = "Learn English Terminal"
+    WARM_UP_STATUS = {
+        "dictionary": "Validacion: cargando diccionario...",
+        "rules": "Validacion: preparando reglas...",
+        "ready": "Validacion: lista",
+        "failed": "Validacion: no se pudo precargar el diccionario; se cargara al guardar",
+    }
+    # Quiet period after the last keystroke before the example is re-checked.
+    LIVE_FEEDBACK_DELAY_SECONDS = 0.3
     BINDINGS = [
         ("up", "menu_up", "Menu arriba"),
         ("down", "menu_down", "Menu abajo"),
@@ -197,6 +244,19 @@ class LearnEnglishApp(App):
         margin-bottom: 1;
     }
 
+    #status_bar {
+        height: 1;
+        padding: 0 1;
+        background: #101813;
+        color: #b9cfbf;
+    }
+
+    #live_feedback {
+        color: #b9cfbf;
+        padding: 0 1;
+        margin-bottom: 1;
+    }
+
     #message_scroll {
         margin-top: 1;
         min-height: 6;
@@ -218,9 +278,15 @@ class LearnEnglishApp(App):
         super().__init__()
         self.vocabulary_service = VocabularyService()
         self._table_entries = []
-        self._editing_word_id: str | None = None
+        self._table_columns = []
+        self._table_has_more = False
+        self._editing_entry = None
+        self._save_request_id = 0
+        self._live_validation = LiveValidation(self.vocabulary_service.rule_engine)
+        self._live_feedback_timer = None
         self._game_current_entry = None
         self._game_current_tense: str | None = None
+        self._game_current_reviewed = False
         self._game_score = 0
         self._game_rounds = 0
 
@@ -230,38 +296,125 @@ class LearnEnglishApp(App):
             yield MenuPanel()
             yield VocabularyTablePanel()
             yield WordCapturePanel()
+        yield Static("", id="status_bar")
         yield Footer()
 
     def on_mount(self) -> None:
         self.vocabulary_service.initialize_database()
+        self._start_lexicon_warm_up()
+        self._build_catalog_cache()
         self._setup_table()
         self._refresh_table()
+        self._build_game_round_pool()
         self._set_game_mode(False)
         try:
             self._focus_menu_button(0)
         except Exception:
             pass
 
+    def _start_lexicon_warm_up(self) -> None:
+        # Loads the dictionary lexicon off the event loop; a save made before it finishes
+        # just waits for the remainder. post_message is safe from the warm-up thread.
+        self.query_one("#status_bar", Static).update(self.WARM_UP_STATUS["dictionary"])
+        warm_up = self.vocabulary_service.rule_engine.start_warm_up(
+            progress=lambda phase: self.post_message(self.LexiconWarmUp(phase))
+        )
+        warm_up.add_done_callback(
+            lambda done: self.post_message(self.LexiconWarmUp("failed" if done.exception() else "ready"))
+        )
+
+    def on_learn_english_app_lexicon_warm_up(self, message: "LearnEnglishApp.LexiconWarmUp") -> None:
+        self.query_one("#status_bar", Static).update(self.WARM_UP_STATUS[message.phase])
+        if message.phase == "ready":
+            # Feedback for anything typed while the dictionary was loading.
+            self._schedule_live_feedback()
+
+    def _build_catalog_cache(self) -> None:
+        self.run_worker(self._load_catalog_cache, thread=True, exclusive=True, group="catalog_cache")
+
+    def _load_catalog_cache(self) -> None:
+        # Worker thread: reading the whole dictionary catalog must not block typing.
+        try:
+            self.vocabulary_service.load_catalog_cache()
+        finally:
+            # Only closes this thread's connection; the UI thread keeps its own.
+            self.vocabulary_service.close_database()
+        self.call_from_thread(self._on_catalog_cache_loaded)
+
+    def _on_catalog_cache_loaded(self) -> None:
+        english_input = self.query_one("#english_word_input", Input)
+        if english_input.has_focus and english_input.value.strip():
+            # Suggestions for anything typed while the catalog was loading.
+            self._show_catalog_suggestions(english_input.value)
+
     def on_unmount(self) -> None:
         self.vocabulary_service.close_database()
 
     def _setup_table(self) -> None:
         table = self.query_one("#words_table", DataTable)
         table.clear(columns=True)
-        table.add_columns("Ingles", "Espanol", "Ejemplo EN", "Ejemplo ES")
+        self._table_columns = table.add_columns("Ingles", "Espanol", "Ejemplo EN", "Ejemplo ES")
         table.cursor_type = "row"
 
+    @staticmethod
+    def _table_row(entry) -> tuple[str, str, str, str]:
+        return (entry.english_word, entry.spanish_meaning, entry.example_english, entry.example_spanish)
+
     def _refresh_table(self) -> None:
         table = self.query_one("#words_table", DataTable)
         table.clear()
-        self._table_entries = self.vocabulary_service.list_vocabulary_entries()
-        for entry in self._table_entries:
-            table.add_row(
-                entry.english_word,
-                entry.spanish_meaning,
-                entry.example_english,
-                entry.example_spanish,
-            )
+        self._table_entries = []
+        self._table_has_more = True
+        self._load_next_table_page()
+
+    def _load_next_table_page(self) -> None:
+        # Keyset paging: the table only holds the pages the user has scrolled through.
+        if not self._table_has_more:
+            return
+        after = self._table_entries[-1] if self._table_entries else None
+        page = self.vocabulary_service.list_vocabulary_page(after=after)
+        self._table_has_more = len(page) == VOCABULARY_PAGE_SIZE
+        table = self.query_one("#words_table", DataTable)
+        for entry in page:
+            table.add_row(*self._table_row(entry), key=entry.word_id)
+        self._table_entries.extend(page)
+
+    def on_vocabulary_table_near_end(self, event: VocabularyTable.NearEnd) -> None:
+        # Several requests can be queued before the first page lands; re-check before loading.
+        if self.query_one("#words_table", VocabularyTable).is_near_end():
+            self._load_next_table_page()
+
+    @staticmethod
+    def _table_sort_key(entry) -> tuple[str, str]:
+        # Same order as VocabularyService.list_vocabulary_page.
+        return (entry.english_word, entry.word_id)
+
+    def _table_position(self, sort_key: tuple[str, str]) -> int:
+        return bisect_left(self._table_entries, sort_key, key=self._table_sort_key)
+
+    def _apply_saved_entry(self, entry) -> None:
+        """Insert, move or patch the saved entry's row without reloading the table."""
+        table = self.query_one("#words_table", DataTable)
+        if entry.word_id in table.rows:
+            # Locate the row by its current key; it may already reflect an earlier save.
+            position = self._table_position((table.get_cell(entry.word_id, self._table_columns[0]), entry.word_id))
+            if self._table_sort_key(self._table_entries[position]) == self._table_sort_key(entry):
+                self._table_entries[position] = entry
+                for column_key, value in zip(self._table_columns, self._table_row(entry)):
+                    table.update_cell(entry.word_id, column_key, value)
+                return
+            del self._table_entries[position]
+            table.remove_row(entry.word_id)
+
+        position = self._table_position(self._table_sort_key(entry))
+        if position == len(self._table_entries) and self._table_has_more:
+            # Sorts after the loaded pages; it arrives with its own page when the user scrolls there.
+            return
+        self._table_entries.insert(position, entry)
+        table.add_row(*self._table_row(entry), key=entry.word_id)
+        if position < len(self._table_entries) - 1:
+            # DataTable only appends; the rows are already in order, so this is a single merge pass.
+            table.sort(self._table_columns[0])
 
     def _set_message(self, text: str) -> None:
         try:
@@ -307,18 +460,6 @@ class LearnEnglishApp(App):
             except Exception:
                 pass
 
-    @staticmethod
-    def _map_primary_tense_to_game_label(primary_tense: str | None) -> str | None:
-        if not primary_tense:
-            return None
-        if primary_tense.startswith("present"):
-            return "presente"
-        if primary_tense.startswith("past"):
-            return "pasado"
-        if primary_tense.startswith("future"):
-            return "futuro"
-        return None
-
     @staticmethod
     def _normalize_text_answer(value: str) -> str:
         return re.sub(r"\s+", " ", value.strip().lower())
@@ -337,24 +478,33 @@ class LearnEnglishApp(App):
         ]
         return normalized_answer in options
 
-    def _game_candidates(self):
-        candidates = []
-        analyzer = self.vocabulary_service.rule_engine.sentence_analyzer
-        for entry in self._table_entries:
-            if not entry.english_word or not entry.spanish_meaning or not entry.example_english:
-                continue
-            analysis = analyzer.analyze_english(entry.example_english)
-            tense_label = self._map_primary_tense_to_game_label(analysis.primary_tense_guess)
-            if tense_label is None:
-                continue
-            candidates.append((entry, tense_label, analysis.primary_tense_guess))
-        return candidates
+    def _build_game_round_pool(self) -> None:
+        self.run_worker(self._load_game_round_pool, thread=True, exclusive=True, group="game_round_pool")
+
+    def _load_game_round_pool(self) -> None:
+        # Worker thread: analyzing every saved example must not block the UI.
+        try:
+            rounds = self.vocabulary_service.list_game_rounds()
+            due_by_word = self.vocabulary_service.list_review_due_dates()
+        finally:
+            # Only closes this thread's connection; the UI thread keeps its own.
+            self.vocabulary_service.close_database()
+        self.call_from_thread(self._on_game_round_pool_loaded, rounds, due_by_word)
+
+    def _on_game_round_pool_loaded(self, rounds, due_by_word) -> None:
+        self.vocabulary_service.game_round_pool.load(rounds, due_by_word)
+        if self.query_one("#game-view", Vertical).has_class("visible") and self._game_current_entry is None:
+            self._start_next_game_round()
 
     def _start_next_game_round(self) -> None:
-        if not self._table_entries:
-            self._refresh_table()
-        candidates = self._game_candidates()
-        if not candidates:
+        pool = self.vocabulary_service.game_round_pool
+        if not pool.loaded:
+            self.query_one("#game_status", Static).update("Preparando las rondas del juego...")
+            return
+        # Next word due for review; skip the one just played so "Siguiente" never repeats it.
+        current_word_id = self._game_current_entry.word_id if self._game_current_entry is not None else None
+        game_round = pool.next_round(skip_word_id=current_word_id)
+        if game_round is None:
             self.query_one("#game_status", Static).update(
                 "No hay suficientes palabras con ejemplo y tiempo detectable. Agrega ejemplos en presente/pasado/futuro."
             )
@@ -364,9 +514,10 @@ class LearnEnglishApp(App):
             self._game_current_tense = None
             return
 
-        entry, tense_label, raw_tense = random.choice(candidates)
+        entry = game_round.entry
         self._game_current_entry = entry
-        self._game_current_tense = tense_label
+        self._game_current_tense = game_round.tense_label
+        self._game_current_reviewed = False
         self.query_one("#game_translation_input", Input).value = ""
         self.query_one("#game_tense_input", Input).value = ""
         self.query_one("#game_word_prompt", Static).update(f"Palabra: {entry.english_word}")
@@ -385,10 +536,17 @@ class LearnEnglishApp(App):
         translation_ok = self._translation_matches(self._game_current_entry.spanish_meaning, translation_input)
         tense_ok = self._normalize_text_answer(tense_input) == self._game_current_tense
         self._game_rounds += 1
+        review_note = ""
+        if not self._game_current_reviewed:
+            schedule = self.vocabulary_service.record_game_review(
+                self._game_current_entry.word_id, translation_ok, tense_ok
+            )
+            self._game_current_reviewed = True
+            review_note = f" | Proximo repaso {self._format_review_delay(schedule.due_at - time.time())}"
         if translation_ok and tense_ok:
             self._game_score += 1
             self.query_one("#game_status", Static).update(
-                f"Correcto. Puntaje {self._game_score}/{self._game_rounds}"
+                f"Correcto. Puntaje {self._game_score}/{self._game_rounds}{review_note}"
             )
         else:
             parts = []
@@ -397,9 +555,18 @@ class LearnEnglishApp(App):
             if not tense_ok:
                 parts.append(f"tiempo esperado: {self._game_current_tense}")
             self.query_one("#game_status", Static).update(
-                f"Incorrecto ({'; '.join(parts)}). Puntaje {self._game_score}/{self._game_rounds}"
+                f"Incorrecto ({'; '.join(parts)}). Puntaje {self._game_score}/{self._game_rounds}{review_note}"
             )
 
+    @staticmethod
+    def _format_review_delay(seconds: float) -> str:
+        if seconds < 60 * 60:
+            return f"en {max(1, round(seconds / 60))} min"
+        hours = round(seconds / 3600)
+        if hours < 24:
+            return f"en {hours} h"
+        return f"en {round(seconds / 86400)} dia(s)"
+
     def _show_document_text(self, text: str) -> None:
         try:
             self._toggle_form(False)
@@ -531,7 +698,7 @@ class LearnEnglishApp(App):
             form.remove_class("visible")
 
     def _clear_form(self) -> None:
-        self._editing_word_id = None
+        self._editing_entry = None
         for input_id in (
             "#english_word_input",
             "#spanish_meaning_input",
@@ -542,7 +709,7 @@ class LearnEnglishApp(App):
         self.query_one("#catalog_match_info", Static).update("Catalogo: sin busqueda")
 
     def _prefill_form_for_entry(self, entry) -> None:
-        self._editing_word_id = entry.word_id
+        self._editing_entry = entry
         self.query_one("#english_word_input", Input).value = entry.english_word
         self.query_one("#spanish_meaning_input", Input).value = entry.spanish_meaning
         self.query_one("#example_english_input", Input).value = entry.example_english
@@ -575,6 +742,57 @@ class LearnEnglishApp(App):
             f"ES={match.spanish_translation or '(sin traduccion)'} | fuente={match.source}"
         )
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "example_english_input":
+            self._schedule_live_feedback()
+            return
+        if event.input.id != "english_word_input" or not event.input.has_focus:
+            return
+        if not event.value.strip():
+            self.query_one("#catalog_match_info", Static).update("Catalogo: sin busqueda")
+            return
+        self._show_catalog_suggestions(event.value)
+
+    def _show_catalog_suggestions(self, prefix: str) -> None:
+        if not self.vocabulary_service.catalog_cache.loaded:
+            self.query_one("#catalog_match_info", Static).update("Catalogo: cargando sugerencias...")
+            return
+        # Served from the in-memory catalog cache, so this is cheap on every keystroke.
+        suggestions = self.vocabulary_service.suggest_catalog_words(prefix)
+        if not suggestions:
+            self.query_one("#catalog_match_info", Static).update("Catalogo: sin sugerencias")
+            return
+        self.query_one("#catalog_match_info", Static).update(
+            "Sugerencias: "
+            + " | ".join(f"{match.english_word} ({match.spanish_translation or '-'})" for match in suggestions)
+        )
+
+    def _schedule_live_feedback(self) -> None:
+        # Debounced: only the last edit of a burst of keystrokes gets checked.
+        if self._live_feedback_timer is not None:
+            self._live_feedback_timer.stop()
+        self._live_feedback_timer = self.set_timer(self.LIVE_FEEDBACK_DELAY_SECONDS, self._update_live_feedback)
+
+    def _update_live_feedback(self) -> None:
+        self._live_feedback_timer = None
+        feedback = self.query_one("#live_feedback", Static)
+        text = self.query_one("#example_english_input", Input).value.strip()
+        if not text:
+            feedback.update("Revision: escribe una oracion")
+            return
+        if not self.vocabulary_service.rule_engine.dictionary_lexicon_ready:
+            # Loading here would block the UI; the warm-up schedules another check when done.
+            feedback.update("Revision: esperando el diccionario...")
+            return
+        validation = self._live_validation.validate(text)
+        issues = [*validation.errors, *validation.warnings]
+        if not issues:
+            feedback.update("Revision: sin errores ni avisos")
+            return
+        lines = [f"Revision: errores={len(validation.errors)} | avisos={len(validation.warnings)}"]
+        lines.extend(f"- {format_issue_es(issue.rule_id, text)}" for issue in issues[:3])
+        feedback.update("\n".join(lines))
+
     def action_menu_up(self) -> None:
         self._move_menu_focus(-1)
 
@@ -587,7 +805,7 @@ class LearnEnglishApp(App):
         if button_id == "show_words":
             self._set_game_mode(False)
             self._toggle_form(False)
-            self._editing_word_id = None
+            self._editing_entry = None
             self._set_results_document_mode(False)
             try:
                 subtitles = self.query(".panel-subtitle")
@@ -661,50 +879,101 @@ class LearnEnglishApp(App):
         spanish_meaning = self.query_one("#spanish_meaning_input", Input).value.strip()
         example_english = self.query_one("#example_english_input", Input).value.strip()
         example_spanish = self.query_one("#example_spanish_input", Input).value.strip()
-        editing_word_id = self._editing_word_id
+        editing_entry = self._editing_entry
+
+        self._save_request_id += 1
+        self._set_message("Guardando...")
+        # Validation (and the first dictionary lexicon load) runs off the event loop. A newer
+        # save cancels the previous worker, which then stops before writing if it still can.
+        self.run_worker(
+            partial(
+                self._save_word_in_thread,
+                self._save_request_id,
+                editing_entry,
+                english_word,
+                spanish_meaning,
+                example_english,
+                example_spanish,
+            ),
+            thread=True,
+            exclusive=True,
+            group="save_word",
+        )
 
+    def _save_word_in_thread(
+        self,
+        request_id: int,
+        editing_entry,
+        english_word: str,
+        spanish_meaning: str,
+        example_english: str,
+        example_spanish: str,
+    ) -> None:
+        worker = get_current_worker()
+        catalog_match = entry = validation = error = None
         try:
             catalog_match = self.vocabulary_service.lookup_catalog_word(english_word) if english_word else None
-            if editing_word_id:
-                word, validation = self.vocabulary_service.update_vocabulary_entry(
-                    word_id=editing_word_id,
+            if editing_entry is not None:
+                entry, validation = self.vocabulary_service.update_vocabulary_entry(
+                    word_id=editing_entry.word_id,
                     english_word=english_word,
                     spanish_meaning=spanish_meaning,
                     example_english=example_english,
                     example_spanish=example_spanish,
+                    is_cancelled=lambda: worker.is_cancelled,
                 )
             else:
-                word, validation = self.vocabulary_service.create_vocabulary_entry(
+                entry, validation = self.vocabulary_service.create_vocabulary_entry(
                     english_word=english_word,
                     spanish_meaning=spanish_meaning,
                     example_english=example_english,
                     example_spanish=example_spanish,
+                    is_cancelled=lambda: worker.is_cancelled,
                 )
-        except InvalidEnglishExampleError as exc:
+        except SaveCancelledError:
+            return
+        except (ValueError, DatabaseError) as exc:
+            # DatabaseError covers IntegrityError and e.g. "database is locked" after the busy timeout.
+            error = exc
+        finally:
+            # Only closes this thread's connection; the UI thread keeps its own.
+            self.vocabulary_service.close_database()
+        self.post_message(
+            self.SaveFinished(request_id, editing_entry, entry, validation, error, catalog_match, example_english)
+        )
+
+    def on_learn_english_app_save_finished(self, message: "LearnEnglishApp.SaveFinished") -> None:
+        if message.entry is not None:
+            # Committed, so the table follows even if a newer save superseded this one.
+            self._apply_saved_entry(message.entry)
+        if message.request_id != self._save_request_id:
+            return
+
+        if isinstance(message.error, InvalidEnglishExampleError):
             lines = ["No se guardo la palabra: la oracion en ingles tiene errores o avisos criticos."]
-            lines.extend(self._format_validation_feedback(exc.validation_result, example_english))
+            lines.extend(self._format_validation_feedback(message.error.validation_result, message.example_english))
             self._set_message("\n".join(lines))
             return
-        except ValueError as exc:
-            self._set_message(f"Error: {exc}")
+        if isinstance(message.error, ValueError):
+            self._set_message(f"Error: {message.error}")
             return
-        except IntegrityError:
+        if isinstance(message.error, IntegrityError):
             self._set_message("Error de base de datos: revisa datos duplicados o llaves.")
             return
 
-        self._refresh_table()
         self._clear_form()
         self._toggle_form(False)
         self._set_results_document_mode(False)
 
-        action_label = "Actualizado" if editing_word_id else "Guardado"
-        lines = [f"{action_label}: {word.word} -> {word.traduction}"]
-        if catalog_match is not None:
+        entry = message.entry
+        action_label = "Actualizado" if message.editing_entry is not None else "Guardado"
+        lines = [f"{action_label}: {entry.english_word} -> {entry.spanish_meaning}"]
+        if message.catalog_match is not None:
             lines.append(
-                f"Catalogo: POS={catalog_match.pos_normalized or 'unknown'} | fuente={catalog_match.source}"
+                f"Catalogo: POS={message.catalog_match.pos_normalized or 'unknown'} | fuente={message.catalog_match.source}"
             )
         lines.append("")
-        lines.extend(self._format_validation_feedback(validation, example_english))
+        lines.extend(self._format_validation_feedback(message.validation, message.example_english))
 
         self._set_message("\n".join(lines))
 
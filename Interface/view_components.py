@@ -1,5 +1,6 @@
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Button, DataTable, Input, Label, Static
 
@@ -20,12 +21,37 @@ class MenuPanel(Widget):
                 yield Button("Salir", id="exit", variant="error")
 
 
+class VocabularyTable(DataTable):
+    """DataTable holding a window of the vocabulary; asks for the next page near its end."""
+
+    # Rows left below the viewport (or the cursor) when the next page is requested.
+    LOAD_MARGIN = 20
+
+    class NearEnd(Message):
+        pass
+
+    def is_near_end(self) -> bool:
+        last_visible_row = self.scroll_y + self.size.height
+        return bool(self.row_count) and max(self.cursor_row, last_visible_row) >= self.row_count - self.LOAD_MARGIN
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self.is_near_end():
+            self.post_message(self.NearEnd())
+
+    def watch_cursor_coordinate(self, old_coordinate, new_coordinate) -> None:
+        super().watch_cursor_coordinate(old_coordinate, new_coordinate)
+        # Also called with an unchanged cursor whenever rows are added.
+        if new_coordinate.row != old_coordinate.row and self.is_near_end():
+            self.post_message(self.NearEnd())
+
+
 class VocabularyTablePanel(Widget):
     def compose(self) -> ComposeResult:
         with Vertical(id="center-panel", classes="panel"):
             yield Label("Vocabulario", classes="panel-title")
             yield Static("Entradas guardadas", classes="panel-subtitle")
-            yield DataTable(id="words_table")
+            yield VocabularyTable(id="words_table")
 
 
 class WordCapturePanel(Widget):
@@ -42,6 +68,7 @@ class WordCapturePanel(Widget):
                     yield Static("Catalogo: sin busqueda", id="catalog_match_info")
                     yield Input(placeholder="Significado en espanol", id="spanish_meaning_input")
                     yield Input(placeholder="Oracion de ejemplo en ingles", id="example_english_input")
+                    yield Static("Revision: escribe una oracion", id="live_feedback")
                     yield Input(placeholder="Oracion de ejemplo en espanol", id="example_spanish_input")
                     yield Button("Guardar palabra", id="save_word", variant="success")
             with Vertical(id="game-view"):
@@ -1,10 +1,11 @@
 from peewee import Model, SqliteDatabase
 
+from Models.connection_profile import BUSY_TIMEOUT_SECONDS, DATABASE_PATH, SQLITE_PRAGMAS
+
 db = SqliteDatabase(
-    "app.db",
-    pragmas={
-        "foreign_keys": 1,
-    },
+    DATABASE_PATH,
+    pragmas=SQLITE_PRAGMAS,
+    timeout=BUSY_TIMEOUT_SECONDS,
 )
 
 class BaseModel(Model):
@@ -0,0 +1,37 @@
+"""
+SQLite connection profile shared by the peewee database and raw `sqlite3` connections.
+
+In WAL mode readers (lexicon loading, batch validation workers) keep reading the last
+committed state while the app writes, instead of waiting on the writer's lock.
+"""
+
+import sqlite3
+
+
+DATABASE_PATH = "app.db"
+BUSY_TIMEOUT_SECONDS = 5.0
+
+# Persistent, database-wide settings. Only the app's own (peewee) connection sets them, so
+# read-only helpers never rewrite the header of a database they merely read.
+DATABASE_PRAGMAS = {
+    "journal_mode": "wal",
+}
+
+# Per-connection settings applied to every connection.
+CONNECTION_PRAGMAS = {
+    "foreign_keys": 1,
+    # Durable across application crashes in WAL mode; only a power loss can drop the last commits.
+    "synchronous": "normal",
+    "cache_size": -16 * 1024,  # negative = KiB
+    "mmap_size": 64 * 1024 * 1024,
+    "temp_store": "memory",
+}
+
+SQLITE_PRAGMAS = {**DATABASE_PRAGMAS, **CONNECTION_PRAGMAS}
+
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    con = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS)
+    for name, value in CONNECTION_PRAGMAS.items():
+        con.execute(f"PRAGMA {name} = {value}")
+    return con
@@ -26,3 +26,19 @@ class DictionaryEntry(BaseModel):
             (("source_name", "direction", "source_page", "raw_line"), True),
             (("headword_normalized", "pos_normalized"), False),
         )
+
+
+# Catalog lookups (VocabularyService.lookup_catalog_word) filter on direction + headword and
+# sort by translation_primary DESC, source_page. Keys in that order plus the selected columns
+# let SQLite answer from this index alone, without a temp sort or table lookups.
+DictionaryEntry.add_index(
+    DictionaryEntry.direction,
+    DictionaryEntry.headword_normalized,
+    DictionaryEntry.translation_primary.desc(),
+    DictionaryEntry.source_page,
+    DictionaryEntry.headword,
+    DictionaryEntry.translation_text,
+    DictionaryEntry.pos_normalized,
+    DictionaryEntry.pos_raw,
+    name="dictionaryentry_catalog_lookup",
+)
@@ -0,0 +1,20 @@
+from peewee import IntegerField, TextField
+
+from Models.base_model import BaseModel
+
+
+class DictionaryImportBatch(BaseModel):
+    """
+    Progress of one dictionary import (`DictionaryEntry.import_batch`).
+
+    `lines_done` is updated in the same transaction as each inserted batch, so an
+    interrupted import resumes after the last committed line.
+    """
+    id = TextField(primary_key=True)
+    source_name = TextField(default="superdiccionario")
+    direction = TextField(default="en_es")
+    source_path = TextField(default="")
+    lines_done = IntegerField(default=0)
+    entries_written = IntegerField(default=0)
+    examples_written = IntegerField(default=0)
+    status = TextField(default="running")
@@ -0,0 +1,20 @@
+from peewee import ForeignKeyField, TextField
+
+from Models.base_model import BaseModel
+from Models.oration_model import Oration
+
+
+class OrationAnalysis(BaseModel):
+    """
+    Persisted analysis summary for an example sentence (Oration).
+
+    Rows are stamped with a hash of the analyzed text and the engine version, and are
+    recomputed when either no longer matches.
+    """
+    oration = ForeignKeyField(Oration, primary_key=True, backref="analysis_summary", on_delete="CASCADE")
+    text_hash = TextField()
+    engine_version = TextField()
+    sentence_type = TextField(default="")
+    primary_tense = TextField(default="")
+    tense_guesses = TextField(default="[]")
+    rule_hits = TextField(default="[]")
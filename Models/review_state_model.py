@@ -0,0 +1,23 @@
+from peewee import FloatField, ForeignKeyField, IntegerField
+
+from Models.base_model import BaseModel
+from Models.word_model import Word
+
+
+class ReviewState(BaseModel):
+    """
+    Spaced-repetition state of a word in the game (SM-2, see Services/storage/review_scheduler.py).
+
+    Times are Unix timestamps. Words without a row have never been reviewed.
+    """
+    word = ForeignKeyField(Word, primary_key=True, backref="review_state", on_delete="CASCADE")
+    due_at = FloatField()
+    interval_days = FloatField(default=0.0)
+    ease = FloatField(default=2.5)
+    repetitions = IntegerField(default=0)
+    lapses = IntegerField(default=0)
+    last_reviewed_at = FloatField(null=True)
+
+
+# The review queue is loaded in due order; keys plus the word id answer that from the index alone.
+ReviewState.add_index(ReviewState.due_at, ReviewState.word, name="reviewstate_due")
@@ -0,0 +1,94 @@
+"""Bounded LRU cache for sentence analyses.
+
+Entries are keyed by (cleaned text, lexicon version) so a dictionary merge that changes
+the analyzer lexicons never serves stale analyses. The cache is bounded both by entry
+count and by the total number of tokens held, so a few very long sentences cannot
+crowd out everything else. Analyses run on several threads (UI, save and game-pool
+workers), so every operation takes a lock.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from typing import Generic, Hashable, TypeVar
+
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_MAX_TOKENS = 64 * 1024
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class AnalysisCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    tokens: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class AnalysisCache(Generic[V]):
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_tokens: int = DEFAULT_MAX_TOKENS) -> None:
+        self.max_entries = max_entries
+        self.max_tokens = max_tokens
+        self._entries: OrderedDict[Hashable, tuple[V, int]] = OrderedDict()
+        self._tokens = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: Hashable) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: V, weight: int = 1) -> None:
+        if not self.enabled:
+            return
+        weight = max(1, weight)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._tokens -= previous[1]
+            self._entries[key] = (value, weight)
+            self._tokens += weight
+            while self._entries and (len(self._entries) > self.max_entries or self._tokens > self.max_tokens):
+                _, (_, evicted_weight) = self._entries.popitem(last=False)
+                self._tokens -= evicted_weight
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens = 0
+
+    def stats(self) -> AnalysisCacheStats:
+        with self._lock:
+            return AnalysisCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                tokens=self._tokens,
+            )
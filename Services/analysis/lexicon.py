@@ -0,0 +1,121 @@
+"""Immutable, versioned vocabulary used by the sentence analyzer and the grammar rules.
+
+The module-level word sets in `sentence_analyzer` and `english_rules.shared` are the base
+vocabulary and are never mutated. Dictionary data is merged copy-on-write into a new
+`Lexicon` with its own version, so caches can key on `lexicon.version` and several engines
+with different vocabularies can live in one process.
+
+The analyzer receives its lexicon explicitly. Rules read it through `active_lexicon()`,
+which the rule engine sets with `use_lexicon()` while it evaluates a sentence.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import count
+from types import MappingProxyType
+
+
+PhrasalVerbMap = Mapping[str, frozenset[str]]
+
+_versions = count(1)
+
+
+def _next_version() -> int:
+    return next(_versions)
+
+
+def _freeze_phrasal(phrasal: Mapping[str, Iterable[str]]) -> PhrasalVerbMap:
+    return MappingProxyType({base: frozenset(particles) for base, particles in phrasal.items()})
+
+
+@dataclass(frozen=True)
+class Lexicon:
+    verbs: frozenset[str]
+    base_verbs: frozenset[str]
+    adjectives: frozenset[str]
+    prepositions: frozenset[str]
+    relative_nouns: frozenset[str]
+    passive_transitive_bases: frozenset[str]
+    reporting_verbs: frozenset[str]
+    gerund_verbs: frozenset[str]
+    to_infinitive_verbs: frozenset[str]
+    phrasal_basic: PhrasalVerbMap
+    phrasal_advanced: PhrasalVerbMap
+    version: int = field(default_factory=_next_version, compare=False)
+
+    def merged(
+        self,
+        phrasal_verbs: Mapping[str, Iterable[str]] | None = None,
+        **additions: Iterable[str],
+    ) -> Lexicon:
+        """
+        Return a new lexicon (with a new version) that adds words to this one.
+
+        Returns `self` when every word is already present, and word sets that gain nothing
+        are shared with the result, so callers can detect changes by identity.
+        """
+        changes: dict[str, object] = {}
+        for name, words in additions.items():
+            current = getattr(self, name, None)
+            if not isinstance(current, frozenset):
+                raise ValueError(f"Unknown lexicon word set: {name}")
+            added = frozenset(words).difference(current)
+            if added:
+                changes[name] = current | added
+
+        if phrasal_verbs:
+            buckets = {"phrasal_basic": dict(self.phrasal_basic), "phrasal_advanced": dict(self.phrasal_advanced)}
+            for base, particles in phrasal_verbs.items():
+                # Unknown bases default to the "basic" bucket so severity does not change.
+                name = "phrasal_advanced" if base in self.phrasal_advanced else "phrasal_basic"
+                current = buckets[name].get(base, frozenset())
+                added = frozenset(particles).difference(current)
+                if added:
+                    buckets[name][base] = current | added
+                    changes[name] = MappingProxyType(buckets[name])
+
+        if not changes:
+            return self
+        return replace(self, version=_next_version(), **changes)
+
+
+@lru_cache(maxsize=1)
+def base_lexicon() -> Lexicon:
+    # Imported lazily: both modules import this one.
+    from Services.analysis import sentence_analyzer as analyzer_mod
+    from Services.grammar.english_rules import shared as shared_mod
+
+    return Lexicon(
+        verbs=frozenset(analyzer_mod.COMMON_VERBS),
+        base_verbs=frozenset(shared_mod.COMMON_BASE_VERBS),
+        adjectives=frozenset(shared_mod.COMMON_ADJECTIVES),
+        prepositions=frozenset(shared_mod.COMMON_PREPOSITIONS),
+        relative_nouns=frozenset(shared_mod.COMMON_NOUNS_FOR_RELATIVES),
+        passive_transitive_bases=frozenset(shared_mod.TRANSITIVE_BASES_FOR_PASSIVE),
+        reporting_verbs=frozenset(shared_mod.REPORTING_VERBS),
+        gerund_verbs=frozenset(shared_mod.GERUND_VERBS),
+        to_infinitive_verbs=frozenset(shared_mod.TO_INFINITIVE_VERBS),
+        phrasal_basic=_freeze_phrasal(shared_mod.PHRASAL_BASIC),
+        phrasal_advanced=_freeze_phrasal(shared_mod.PHRASAL_ADVANCED),
+    )
+
+
+_active_lexicon: ContextVar[Lexicon | None] = ContextVar("active_lexicon", default=None)
+
+
+def active_lexicon() -> Lexicon:
+    return _active_lexicon.get() or base_lexicon()
+
+
+@contextmanager
+def use_lexicon(lexicon: Lexicon) -> Iterator[Lexicon]:
+    token = _active_lexicon.set(lexicon)
+    try:
+        yield lexicon
+    finally:
+        _active_lexicon.reset(token)
@@ -2,6 +2,9 @@ from dataclasses import dataclass, replace
 from collections.abc import Callable
 import re
 
+from Services.analysis.analysis_cache import DEFAULT_MAX_ENTRIES, AnalysisCache
+from Services.analysis.lexicon import Lexicon, base_lexicon
+from Services.analysis.token_table import TokenFeature, TokenFeatureTable
 from Services.analysis.english_heuristics import (
     BASE_COMMON_ADJECTIVES,
     BASE_COMMON_ADVERBS,
@@ -21,6 +24,7 @@ ENGLISH_SUBJECT_PRONOUNS = {
     "they",
 }
 
+# Base verb list; dictionary verbs are merged into SentenceAnalyzer.lexicon.verbs instead.
 COMMON_VERBS = {
     "am",
     "is",
@@ -245,17 +249,190 @@ COMMON_IRREGULAR_PARTICIPLES = {
 }
 
 
-@dataclass
-class TokenFeature:
-    token: str
-    index: int
-    pos_guess: str
-    pos_candidates: list[str]
-    verb_confidence: str
-    verb_form_guess: str | None
-    noun_countability_guess: str | None
-    notes: list[str]
-    external_pos: str | None = None
+# Bump when analyzer heuristics change so persisted analysis summaries are recomputed.
+ANALYZER_REVISION = 1
+
+ADJECTIVE_SUFFIXES = ("ous", "ful", "able", "ible", "ive", "al", "ic", "ish", "less")
+UNKNOWN_TOKEN_MEMO_SIZE = 50_000
+
+
+@dataclass(frozen=True, slots=True)
+class TokenProfile:
+    """Context-free facts about a token, resolved once per lexicon version."""
+
+    lexical_pos: str
+    lexical_candidates: tuple[str, ...]
+    lexical_verb_confidence: str
+    lexical_verb_form: str | None
+    lexical_note: str | None
+    ing_shape: bool
+    ed_inflection: bool
+    s_shape: bool
+    common_verb: bool
+    ambiguous_noun_verb: bool
+    preposition: bool
+    irregular_past: bool
+    irregular_participle: bool
+    noun_like: bool
+    adjective_shape: bool
+    be_predicate_shape: bool
+    countability: str | None
+
+
+def _lexical_class(token: str) -> tuple[str, tuple[str, ...], str, str | None, str | None]:
+    # Closed-class membership, checked in priority order.
+    if token in ENGLISH_SUBJECT_PRONOUNS:
+        return "pronoun", ("pronoun",), "low", None, "subject_pronoun"
+    if token in SUBJECT_DETERMINERS:
+        return "determiner", ("determiner",), "low", None, "determiner"
+    if token in TO_BE_FORMS or token in BASE_AUXILIARIES:
+        verb_form_guess = None
+        if token in {"am", "is", "are", "do", "does", "have", "has"}:
+            verb_form_guess = "present_aux"
+        elif token in {"was", "were", "did", "had"}:
+            verb_form_guess = "past_aux"
+        return "auxiliary", ("auxiliary", "verb"), "high", verb_form_guess, "core_auxiliary"
+    if token in MODAL_VERBS:
+        return "auxiliary", ("auxiliary", "verb"), "high", "modal", "modal"
+    if token in QUESTION_AUXILIARIES:
+        return "auxiliary", ("auxiliary", "verb"), "high", "present_aux", "question_auxiliary"
+    if token in COMMON_ADVERBS:
+        return "adverb", ("adverb",), "low", None, "common_adverb"
+    if token in COMMON_ADJECTIVES:
+        return "adjective", ("adjective",), "low", None, "common_adjective"
+    return "unknown", (), "low", None, None
+
+
+def _looks_noun_like_uncached(token: str) -> bool:
+    if token in ENGLISH_SUBJECT_PRONOUNS or token in SUBJECT_DETERMINERS:
+        return False
+    if token in QUESTION_AUXILIARIES or token in MODAL_VERBS:
+        return False
+    if token in PREPOSITIONS or token in COORDINATORS:
+        return False
+    if token in COMMON_ADVERBS:
+        return False
+    if token.endswith("ly"):
+        return False
+    return token.isalpha()
+
+
+def _looks_likely_ed_inflection_uncached(token: str, verbs: frozenset[str]) -> bool:
+    if not (token.endswith("ed") and len(token) > 3):
+        return False
+    if token in {"red"}:
+        return False
+    stem_candidates = {
+        token[:-2],          # worked -> work, asked -> ask
+        f"{token[:-1]}",     # lived -> live
+        f"{token[:-3]}y" if token.endswith("ied") and len(token) > 4 else "",
+        token[:-3] if len(token) > 4 and token[-3] == token[-4] else "",  # stopped -> stop
+    }
+    stem_candidates = {s for s in stem_candidates if s}
+    if token in LIKELY_ADJECTIVAL_ED:
+        return True
+    return any(stem in verbs for stem in stem_candidates)
+
+
+def _ed_shapes(verb: str) -> tuple[str, ...]:
+    # Tokens whose stem candidates in _looks_likely_ed_inflection_uncached include `verb`.
+    shapes = [f"{verb}ed", f"{verb}d", f"{verb}{verb[-1:]}ed"]
+    if verb.endswith("y"):
+        shapes.append(f"{verb[:-1]}ied")
+    return tuple(shapes)
+
+
+def _build_token_profile(token: str, lexicon: Lexicon) -> TokenProfile:
+    lexical_pos, lexical_candidates, lexical_verb_confidence, lexical_verb_form, lexical_note = _lexical_class(token)
+    return TokenProfile(
+        lexical_pos=lexical_pos,
+        lexical_candidates=lexical_candidates,
+        lexical_verb_confidence=lexical_verb_confidence,
+        lexical_verb_form=lexical_verb_form,
+        lexical_note=lexical_note,
+        ing_shape=token.endswith("ing") and len(token) > 4,
+        ed_inflection=_looks_likely_ed_inflection_uncached(token, lexicon.verbs),
+        s_shape=token.endswith("s") and len(token) > 2 and not token.endswith("ss"),
+        common_verb=token in lexicon.verbs,
+        ambiguous_noun_verb=token in AMBIGUOUS_NOUN_VERB_BASES,
+        preposition=token in PREPOSITIONS,
+        irregular_past=token in COMMON_IRREGULAR_PAST,
+        irregular_participle=token in COMMON_IRREGULAR_PARTICIPLES,
+        noun_like=_looks_noun_like_uncached(token),
+        adjective_shape=token in COMMON_ADJECTIVES or token.endswith(ADJECTIVE_SUFFIXES),
+        be_predicate_shape=token.isalpha() and not token.endswith(("ing", "ed", "s")),
+        countability=guess_noun_countability(token),
+    )
+
+
+class TokenProfileTable:
+    """
+    token -> TokenProfile for every word known to the analyzer and its lexicon.
+
+    Built once per lexicon and patched (`for_lexicon`) when dictionary words are merged
+    later. Tokens outside the lexicon are profiled on first sight and memoized.
+    """
+
+    def __init__(self, lexicon: Lexicon, memo_size: int = UNKNOWN_TOKEN_MEMO_SIZE) -> None:
+        self.lexicon = lexicon
+        self.memo_size = memo_size
+        words = set().union(
+            ENGLISH_SUBJECT_PRONOUNS,
+            SUBJECT_DETERMINERS,
+            TO_BE_FORMS,
+            BASE_AUXILIARIES,
+            MODAL_VERBS,
+            QUESTION_AUXILIARIES,
+            COMMON_ADVERBS,
+            COMMON_ADJECTIVES,
+            lexicon.verbs,
+            AMBIGUOUS_NOUN_VERB_BASES,
+            PREPOSITIONS,
+            COORDINATORS,
+            COMMON_IRREGULAR_PAST,
+            COMMON_IRREGULAR_PARTICIPLES,
+            LIKELY_ADJECTIVAL_ING,
+            LIKELY_ADJECTIVAL_ED,
+        )
+        self.known: dict[str, TokenProfile] = {word: _build_token_profile(word, lexicon) for word in words}
+        self.unknown: dict[str, TokenProfile] = {}
+
+    def for_lexicon(self, lexicon: Lexicon) -> "TokenProfileTable":
+        """
+        Table for another lexicon, e.g. this one with dictionary words merged in.
+
+        Profiles only read `lexicon.verbs`, so only verbs added or dropped and their "-ed"
+        shapes are re-profiled; when the verbs did not change this table is returned as is.
+        """
+        if lexicon.verbs is self.lexicon.verbs:
+            return self
+        changed_verbs = lexicon.verbs ^ self.lexicon.verbs
+        table = TokenProfileTable.__new__(TokenProfileTable)
+        table.lexicon = lexicon
+        table.memo_size = self.memo_size
+        table.known = dict(self.known)
+        table.unknown = {}
+        for verb in changed_verbs:
+            table.known[verb] = _build_token_profile(verb, lexicon)
+            for token in _ed_shapes(verb):
+                if token in table.known:
+                    table.known[token] = _build_token_profile(token, lexicon)
+        return table
+
+    def profile(self, token: str) -> TokenProfile:
+        profile = self.known.get(token)
+        if profile is not None:
+            return profile
+        profile = self.unknown.get(token)
+        if profile is None:
+            if len(self.unknown) >= self.memo_size:
+                self.unknown.clear()
+            profile = _build_token_profile(token, self.lexicon)
+            self.unknown[token] = profile
+        return profile
+
+
+TOKEN_PATTERN = re.compile(r"(?P<word>[A-Za-z']+)|[.,;:?!]")
 
 
 @dataclass
@@ -296,7 +473,7 @@ class NounPhraseAnalysis:
     is_generic_candidate: bool
 
 
-@dataclass
+@dataclass(frozen=True)
 class SentenceAnalysis:
     original_text: str
     cleaned_text: str
@@ -315,7 +492,7 @@ class SentenceAnalysis:
     modal_token: str | None
     subject_number_guess: str | None
     be_form_token: str | None
-    token_features: list[TokenFeature]
+    token_features: TokenFeatureTable
     tense_guesses: list[str]
     primary_tense_guess: str | None
     raw_token_stream: list[RawTokenSpan]
@@ -326,22 +503,92 @@ class SentenceAnalysis:
     noun_phrases: list[NounPhraseAnalysis]
 
 
+@dataclass(frozen=True, slots=True)
+class _LexiconState:
+    lexicon: Lexicon
+    token_profiles: TokenProfileTable
+    cache_version: int
+
+
 class SentenceAnalyzer:
     def __init__(
         self,
         external_pos_tagger: Callable[[list[str]], list[str | None]] | None = None,
+        cache_size: int = DEFAULT_MAX_ENTRIES,
+        lexicon: Lexicon | None = None,
     ) -> None:
         # Optional support layer: external POS can refine low-confidence heuristic guesses.
         self.external_pos_tagger = external_pos_tagger
+        # Cached analyses are shared between callers and must be treated as read-only.
+        self.analysis_cache: AnalysisCache[SentenceAnalysis] = AnalysisCache(max_entries=cache_size)
+        self.set_lexicon(lexicon or base_lexicon())
+
+    @property
+    def lexicon(self) -> Lexicon:
+        return self._state.lexicon
+
+    @property
+    def token_profiles(self) -> TokenProfileTable:
+        return self._state.token_profiles
+
+    def set_lexicon(self, lexicon: Lexicon) -> None:
+        # Analyses only depend on the lexicon's verbs. Cache keys carry the version of the
+        # lexicon that last changed them, so analyses from older verbs are never reused.
+        state: _LexiconState | None = getattr(self, "_state", None)
+        if state is None:
+            self._state = _LexiconState(lexicon, TokenProfileTable(lexicon), lexicon.version)
+            return
+        token_profiles = state.token_profiles.for_lexicon(lexicon)
+        cache_version = state.cache_version if lexicon.verbs is state.lexicon.verbs else lexicon.version
+        # Other threads analyze while this runs: the finished profile table is published
+        # together with its lexicon and cache version in one assignment, so an analysis is
+        # never cached under a version whose profiles it did not see.
+        self._state = _LexiconState(lexicon, token_profiles, cache_version)
 
     def analyze_english(self, text: str) -> SentenceAnalysis:
         cleaned_text = text.strip()
-        tokens = self._tokenize(cleaned_text)
-        raw_token_stream = self._tokenize_with_punctuation(cleaned_text)
-        token_features = self._build_token_features(tokens)
+        if not self.analysis_cache.enabled:
+            return self._analyze_english_uncached(text, cleaned_text)
+
+        key = (cleaned_text, self._state.cache_version)
+        analysis = self.analysis_cache.get(key)
+        if analysis is None:
+            analysis = self._analyze_english_uncached(text, cleaned_text)
+            self.analysis_cache.put(key, analysis, weight=len(analysis.tokens) + 1)
+        elif analysis.original_text != text:
+            analysis = replace(analysis, original_text=text)
+        return analysis
+
+    def analyze_english_incremental(self, text: str, previous: SentenceAnalysis | None) -> SentenceAnalysis:
+        """
+        `analyze_english` for successive edits of one sentence (as-you-type feedback).
+
+        Token features of the unchanged token prefix are copied from `previous` instead of
+        re-classified; everything sentence-level is recomputed, so the result equals a full
+        analysis. `previous` must come from this analyzer under its current lexicon.
+        """
+        cleaned_text = text.strip()
+        key = (cleaned_text, self._state.cache_version)
+        analysis = self.analysis_cache.get(key) if self.analysis_cache.enabled else None
+        if analysis is None:
+            reuse = previous.token_features if previous is not None else None
+            analysis = self._analyze_english_uncached(text, cleaned_text, reuse)
+            self.analysis_cache.put(key, analysis, weight=len(analysis.tokens) + 1)
+        elif analysis.original_text != text:
+            analysis = replace(analysis, original_text=text)
+        return analysis
+
+    def _analyze_english_uncached(
+        self,
+        text: str,
+        cleaned_text: str,
+        reuse_features: TokenFeatureTable | None = None,
+    ) -> SentenceAnalysis:
+        tokens, raw_token_stream = self._tokenize(cleaned_text)
+        token_features = self._build_token_features(tokens, reuse_features)
 
         sentence_type = self._detect_sentence_type(cleaned_text, tokens, token_features)
-        has_explicit_subject = self._detect_explicit_subject(tokens, sentence_type)
+        has_explicit_subject = self._detect_explicit_subject(tokens, sentence_type, token_features)
         has_verb = self._detect_verb(tokens, token_features)
         polarity = self._detect_polarity(tokens)
         tense_guesses = self._detect_tense_guesses(tokens, token_features)
@@ -368,7 +615,7 @@ class SentenceAnalyzer:
             starts_with_auxiliary=bool(tokens and tokens[0] in QUESTION_AUXILIARIES),
             uses_to_be=any(token in TO_BE_FORMS for token in tokens),
             modal_token=self._detect_modal(tokens),
-            subject_number_guess=self._guess_subject_number(tokens, sentence_type),
+            subject_number_guess=self._guess_subject_number(tokens, sentence_type, token_features),
             be_form_token=self._detect_be_form_token(tokens),
             token_features=token_features,
             tense_guesses=tense_guesses,
@@ -381,30 +628,22 @@ class SentenceAnalyzer:
             noun_phrases=noun_phrases,
         )
 
-    def _tokenize(self, text: str) -> list[str]:
-        return re.findall(r"[A-Za-z']+", text.lower())
-
-    def _tokenize_with_punctuation(self, text: str) -> list[RawTokenSpan]:
+    def _tokenize(self, text: str) -> tuple[list[str], list[RawTokenSpan]]:
+        # Single pass: word tokens and the punctuation-aware span stream come from the same matches.
+        tokens: list[str] = []
         items: list[RawTokenSpan] = []
-        word_index = 0
-        for match in re.finditer(r"[A-Za-z']+|[.,;:?!]", text):
-            raw = match.group(0)
-            kind = "word" if re.fullmatch(r"[A-Za-z']+", raw) else "punct"
-            items.append(
-                RawTokenSpan(
-                    text=raw.lower() if kind == "word" else raw,
-                    kind=kind,
-                    start_char=match.start(),
-                    end_char=match.end(),
-                    word_index=(word_index if kind == "word" else None),
-                )
-            )
-            if kind == "word":
-                word_index += 1
-        return items
+        for match in TOKEN_PATTERN.finditer(text):
+            word = match.group("word")
+            if word is None:
+                items.append(RawTokenSpan(match.group(), "punct", match.start(), match.end()))
+                continue
+            word = word.lower()
+            items.append(RawTokenSpan(word, "word", match.start(), match.end(), len(tokens)))
+            tokens.append(word)
+        return tokens, items
 
     def _detect_sentence_type(
-        self, text: str, tokens: list[str], token_features: list[TokenFeature]
+        self, text: str, tokens: list[str], token_features: TokenFeatureTable
     ) -> str:
         if not tokens:
             return "fragment"
@@ -425,7 +664,7 @@ class SentenceAnalyzer:
 
         first_feature = token_features[0] if token_features else None
         if (
-            first in COMMON_VERBS
+            first in self.lexicon.verbs
             and first not in ENGLISH_SUBJECT_PRONOUNS
             and first_feature is not None
             and first_feature.pos_guess in {"verb", "auxiliary"}
@@ -434,7 +673,9 @@ class SentenceAnalyzer:
 
         return "declarative"
 
-    def _detect_explicit_subject(self, tokens: list[str], sentence_type: str) -> bool:
+    def _detect_explicit_subject(
+        self, tokens: list[str], sentence_type: str, token_features: TokenFeatureTable
+    ) -> bool:
         if not tokens:
             return False
 
@@ -452,7 +693,7 @@ class SentenceAnalyzer:
             return True
 
         # Heuristic: a noun phrase before the first verb/to-be counts as explicit subject.
-        first_verb_idx = self._find_first_verb_index(tokens)
+        first_verb_idx = self._find_first_verb_index(tokens, token_features)
         if first_verb_idx is None or first_verb_idx == 0:
             return False
 
@@ -476,7 +717,7 @@ class SentenceAnalyzer:
 
         return tokens[0] if tokens[0] in ENGLISH_SUBJECT_PRONOUNS else None
 
-    def _detect_verb(self, tokens: list[str], token_features: list[TokenFeature]) -> bool:
+    def _detect_verb(self, tokens: list[str], token_features: TokenFeatureTable) -> bool:
         if not tokens:
             return False
 
@@ -504,8 +745,7 @@ class SentenceAnalyzer:
                 return token
         return None
 
-    def _find_first_verb_index(self, tokens: list[str]) -> int | None:
-        features = self._build_token_features(tokens)
+    def _find_first_verb_index(self, tokens: list[str], features: TokenFeatureTable) -> int | None:
         for idx, token in enumerate(tokens):
             if token in MODAL_VERBS:
                 return idx
@@ -519,11 +759,13 @@ class SentenceAnalyzer:
                 return idx
         return None
 
-    def _guess_subject_number(self, tokens: list[str], sentence_type: str) -> str | None:
+    def _guess_subject_number(
+        self, tokens: list[str], sentence_type: str, token_features: TokenFeatureTable
+    ) -> str | None:
         if not tokens:
             return None
 
-        first_verb_idx = self._find_first_verb_index(tokens)
+        first_verb_idx = self._find_first_verb_index(tokens, token_features)
         subject_zone = tokens[:first_verb_idx] if first_verb_idx is not None else tokens[:6]
 
         # Coordinated subjects: "my brother and my sister are..."
@@ -589,7 +831,7 @@ class SentenceAnalyzer:
 
         # Bare noun heuristic: "students are", "teacher is"
         noun = tokens[0]
-        if noun not in COMMON_VERBS and noun not in QUESTION_AUXILIARIES:
+        if noun not in self.lexicon.verbs and noun not in QUESTION_AUXILIARIES:
             if noun.endswith("s") and not noun.endswith("ss"):
                 return "plural"
             return "singular"
@@ -626,68 +868,47 @@ class SentenceAnalyzer:
                 return token
         return None
 
-    def _build_token_features(self, tokens: list[str]) -> list[TokenFeature]:
-        features: list[TokenFeature] = []
-        for idx, token in enumerate(tokens):
+    def _build_token_features(
+        self, tokens: list[str], reuse: TokenFeatureTable | None = None
+    ) -> TokenFeatureTable:
+        features = TokenFeatureTable(tokens)
+        start = 0
+        if reuse is not None and self.external_pos_tagger is None:
+            # A row depends only on its token and both neighbours, so every row before the
+            # last token of the shared prefix is unchanged. (External tags see the whole
+            # sentence, so a tagger disables reuse.)
+            shared = 0
+            for old, new in zip(reuse.tokens, tokens):
+                if old != new:
+                    break
+                shared += 1
+            start = max(0, shared - 1)
+            features.copy_rows(reuse, start)
+        for idx in range(start, len(tokens)):
+            token = tokens[idx]
             prev_token = tokens[idx - 1] if idx > 0 else None
             next_token = tokens[idx + 1] if idx + 1 < len(tokens) else None
-            features.append(self._classify_token(token, idx, prev_token, next_token))
+            self._classify_token(features, token, idx, prev_token, next_token)
         self._apply_external_pos_support(tokens, features)
         return features
 
     def _classify_token(
         self,
+        features: TokenFeatureTable,
         token: str,
         index: int,
         prev_token: str | None,
         next_token: str | None,
-    ) -> TokenFeature:
-        candidates: set[str] = set()
-        notes: list[str] = []
-        pos_guess = "unknown"
-        verb_confidence = "low"
-        verb_form_guess: str | None = None
+    ) -> None:
+        profile = self.token_profiles.profile(token)
+        candidates: set[str] = set(profile.lexical_candidates)
+        notes: list[str] = [profile.lexical_note] if profile.lexical_note else []
+        pos_guess = profile.lexical_pos
+        verb_confidence = profile.lexical_verb_confidence
+        verb_form_guess: str | None = profile.lexical_verb_form
         noun_countability_guess: str | None = None
 
-        if token in ENGLISH_SUBJECT_PRONOUNS:
-            candidates.add("pronoun")
-            pos_guess = "pronoun"
-            notes.append("subject_pronoun")
-        elif token in SUBJECT_DETERMINERS:
-            candidates.add("determiner")
-            pos_guess = "determiner"
-            notes.append("determiner")
-        elif token in TO_BE_FORMS or token in BASE_AUXILIARIES:
-            candidates.update({"auxiliary", "verb"})
-            pos_guess = "auxiliary"
-            verb_confidence = "high"
-            if token in {"am", "is", "are", "do", "does", "have", "has"}:
-                verb_form_guess = "present_aux"
-            elif token in {"was", "were", "did", "had"}:
-                verb_form_guess = "past_aux"
-            notes.append("core_auxiliary")
-        elif token in MODAL_VERBS:
-            candidates.update({"auxiliary", "verb"})
-            pos_guess = "auxiliary"
-            verb_confidence = "high"
-            verb_form_guess = "modal"
-            notes.append("modal")
-        elif token in QUESTION_AUXILIARIES:
-            candidates.update({"auxiliary", "verb"})
-            pos_guess = "auxiliary"
-            verb_confidence = "high"
-            verb_form_guess = "present_aux"
-            notes.append("question_auxiliary")
-        elif token in COMMON_ADVERBS:
-            candidates.add("adverb")
-            pos_guess = "adverb"
-            notes.append("common_adverb")
-        elif token in COMMON_ADJECTIVES:
-            candidates.add("adjective")
-            pos_guess = "adjective"
-            notes.append("common_adjective")
-
-        if token.endswith("ing") and len(token) > 4:
+        if profile.ing_shape:
             candidates.update({"verb_participle", "adjective", "noun"})
             notes.append("suffix_ing")
             if prev_token in TO_BE_FORMS:
@@ -731,7 +952,7 @@ class SentenceAnalyzer:
                     verb_confidence = "medium"
                     verb_form_guess = "participle_ing"
 
-        if self._looks_likely_ed_inflection(token):
+        if profile.ed_inflection:
             candidates.update({"verb_participle", "adjective"})
             notes.append("suffix_ed")
             if prev_token in TO_BE_FORMS:
@@ -760,7 +981,7 @@ class SentenceAnalyzer:
                     verb_confidence = "medium"
                     verb_form_guess = "past"
 
-        if token.endswith("s") and len(token) > 2 and not token.endswith("ss"):
+        if profile.s_shape:
             candidates.update({"verb", "noun"})
             notes.append("suffix_s")
             if prev_token in ENGLISH_SUBJECT_PRONOUNS - {"i", "you", "we", "they"}:
@@ -780,10 +1001,10 @@ class SentenceAnalyzer:
             elif pos_guess == "unknown":
                 pos_guess = "noun"
 
-        if token in COMMON_VERBS:
+        if profile.common_verb:
             candidates.add("verb")
             notes.append("in_common_verbs")
-            if token in AMBIGUOUS_NOUN_VERB_BASES:
+            if profile.ambiguous_noun_verb:
                 candidates.add("noun")
                 notes.append("noun_verb_ambiguous")
                 if prev_token in SUBJECT_DETERMINERS:
@@ -819,26 +1040,28 @@ class SentenceAnalyzer:
                 if pos_guess == "unknown":
                     pos_guess = "verb"
                     verb_confidence = "high"
-                    if token in COMMON_IRREGULAR_PAST:
+                    if profile.irregular_past:
                         verb_form_guess = "past"
                     elif token.endswith("s"):
                         verb_form_guess = "v3sg"
                     else:
                         verb_form_guess = "base"
 
-        if token in PREPOSITIONS:
+        if profile.preposition:
             candidates.add("preposition")
             if pos_guess == "unknown":
                 pos_guess = "preposition"
             notes.append("preposition")
 
-        if pos_guess == "unknown" and self._looks_likely_adjective(token, prev_token):
+        if pos_guess == "unknown" and (
+            profile.adjective_shape or (prev_token in TO_BE_FORMS and profile.be_predicate_shape)
+        ):
             candidates.add("adjective")
             pos_guess = "adjective"
             notes.append("adjective_shape_or_context")
 
         if pos_guess == "unknown":
-            if self._looks_noun_like(token):
+            if profile.noun_like:
                 candidates.add("noun")
                 pos_guess = "noun"
                 notes.append("default_noun_like")
@@ -851,17 +1074,17 @@ class SentenceAnalyzer:
         if pos_guess in {"verb", "auxiliary"}:
             candidates.add("verb")
 
-        if token in COMMON_IRREGULAR_PAST and pos_guess == "verb" and verb_form_guess is None:
+        if profile.irregular_past and pos_guess == "verb" and verb_form_guess is None:
             verb_form_guess = "past"
             notes.append("irregular_past")
-        if token in COMMON_IRREGULAR_PARTICIPLES and prev_token in {"have", "has", "had"}:
+        if profile.irregular_participle and prev_token in {"have", "has", "had"}:
             if pos_guess in {"verb", "verb_participle", "unknown", "noun"}:
                 pos_guess = "verb_participle"
                 verb_confidence = "high"
                 verb_form_guess = "participle_ed"
                 notes.append("irregular_perfect_participle")
                 candidates.update({"verb_participle", "verb"})
-        if token in COMMON_IRREGULAR_PARTICIPLES and prev_token in TO_BE_FORMS and token != "been":
+        if profile.irregular_participle and prev_token in TO_BE_FORMS and token != "been":
             if pos_guess in {"unknown", "noun", "verb"}:
                 pos_guess = "verb_participle"
                 verb_confidence = "medium"
@@ -880,13 +1103,12 @@ class SentenceAnalyzer:
                 verb_form_guess = "participle_ed"
 
         if pos_guess == "noun" or "noun" in candidates:
-            noun_countability_guess = guess_noun_countability(token)
+            noun_countability_guess = profile.countability
 
-        return TokenFeature(
-            token=token,
-            index=index,
+        features.set_row(
+            index,
             pos_guess=pos_guess,
-            pos_candidates=sorted(candidates),
+            pos_candidates=candidates,
             verb_confidence=verb_confidence,
             verb_form_guess=verb_form_guess,
             noun_countability_guess=noun_countability_guess,
@@ -894,7 +1116,7 @@ class SentenceAnalyzer:
         )
 
     def _apply_external_pos_support(
-        self, tokens: list[str], features: list[TokenFeature]
+        self, tokens: list[str], features: TokenFeatureTable
     ) -> None:
         if not self.external_pos_tagger or not tokens or not features:
             return
@@ -910,13 +1132,13 @@ class SentenceAnalyzer:
             feature.external_pos = normalized
             if normalized is None:
                 continue
-            feature.pos_candidates = sorted(set(feature.pos_candidates) | {normalized})
-            feature.notes.append("external_pos_support")
+            features.add_candidate(feature.index, normalized)
+            features.add_note(feature.index, "external_pos_support")
 
             # Keep heuristics as the pedagogical base; external POS only resolves low-confidence cases.
             if feature.pos_guess in {"unknown", "noun"} and normalized in {"adjective", "adverb"}:
                 feature.pos_guess = normalized
-                feature.notes.append("external_pos_refined_guess")
+                features.add_note(feature.index, "external_pos_refined_guess")
                 continue
             if (
                 feature.verb_confidence in {"low", "medium"}
@@ -928,7 +1150,7 @@ class SentenceAnalyzer:
                     feature.verb_confidence = "medium"
                 else:
                     feature.verb_confidence = "low"
-                feature.notes.append("external_pos_refined_guess")
+                features.add_note(feature.index, "external_pos_refined_guess")
 
     @staticmethod
     def _normalize_external_pos(tag: str | None) -> str | None:
@@ -962,21 +1184,10 @@ class SentenceAnalyzer:
         }
         return mapping.get(t)
 
-    @staticmethod
-    def _looks_noun_like(token: str | None) -> bool:
+    def _looks_noun_like(self, token: str | None) -> bool:
         if not token:
             return False
-        if token in ENGLISH_SUBJECT_PRONOUNS | SUBJECT_DETERMINERS:
-            return False
-        if token in QUESTION_AUXILIARIES or token in MODAL_VERBS:
-            return False
-        if token in PREPOSITIONS or token in COORDINATORS:
-            return False
-        if token in COMMON_ADVERBS:
-            return False
-        if token.endswith("ly"):
-            return False
-        return token.isalpha()
+        return self.token_profiles.profile(token).noun_like
 
     @staticmethod
     def _looks_direct_object_after_ing(token: str | None) -> bool:
@@ -988,36 +1199,10 @@ class SentenceAnalyzer:
             return True
         return token.isalpha()
 
-    @staticmethod
-    def _looks_likely_adjective(token: str, prev_token: str | None) -> bool:
-        if token in COMMON_ADJECTIVES:
-            return True
-        if prev_token in TO_BE_FORMS and token.isalpha() and not token.endswith(("ing", "ed", "s")):
-            return True
-        adjective_suffixes = ("ous", "ful", "able", "ible", "ive", "al", "ic", "ish", "less")
-        return token.endswith(adjective_suffixes)
-
-    @staticmethod
-    def _looks_likely_ed_inflection(token: str) -> bool:
-        if not (token.endswith("ed") and len(token) > 3):
-            return False
-        if token in {"red"}:
-            return False
-        stem_candidates = {
-            token[:-2],          # worked -> work, asked -> ask
-            f"{token[:-1]}",     # lived -> live
-            f"{token[:-3]}y" if token.endswith("ied") and len(token) > 4 else "",
-            token[:-3] if len(token) > 4 and token[-3] == token[-4] else "",  # stopped -> stop
-        }
-        stem_candidates = {s for s in stem_candidates if s}
-        if token in LIKELY_ADJECTIVAL_ED:
-            return True
-        return any(stem in COMMON_VERBS for stem in stem_candidates)
-
     def _segment_clauses(
         self,
         tokens: list[str],
-        token_features: list[TokenFeature],
+        token_features: TokenFeatureTable,
         raw_text: str,
         raw_token_stream: list[RawTokenSpan],
     ) -> list[ClauseAnalysis]:
@@ -1039,10 +1224,7 @@ class SentenceAnalyzer:
             if end < start:
                 continue
             clause_tokens = tokens[start : end + 1]
-            clause_features = [
-                replace(feature, index=local_idx)
-                for local_idx, feature in enumerate(token_features[start : end + 1])
-            ]
+            clause_features = token_features.sub_table(start, end + 1)
             main_verb_idx = self._find_clause_main_verb_index(clause_features)
             subject_idx = self._find_clause_subject_index(clause_tokens, clause_features, start, main_verb_idx)
             aux_chain = self._find_clause_aux_chain(clause_features, start, main_verb_idx)
@@ -1148,7 +1330,7 @@ class SentenceAnalyzer:
         return "main"
 
     @staticmethod
-    def _find_clause_main_verb_index(clause_features: list[TokenFeature]) -> int | None:
+    def _find_clause_main_verb_index(clause_features: TokenFeatureTable) -> int | None:
         for feature in clause_features:
             if feature.pos_guess in {"verb", "verb_participle"}:
                 return feature.index
@@ -1160,7 +1342,7 @@ class SentenceAnalyzer:
     def _find_clause_subject_index(
         self,
         clause_tokens: list[str],
-        clause_features: list[TokenFeature],
+        clause_features: TokenFeatureTable,
         start_idx: int,
         main_verb_idx: int | None,
     ) -> int | None:
@@ -1183,7 +1365,7 @@ class SentenceAnalyzer:
     def _guess_clause_subject_phrase_span(
         self,
         clause_tokens: list[str],
-        clause_features: list[TokenFeature],
+        clause_features: TokenFeatureTable,
         start_idx: int,
         main_verb_idx: int | None,
     ) -> tuple[int, int] | None:
@@ -1198,7 +1380,7 @@ class SentenceAnalyzer:
 
     @staticmethod
     def _find_clause_aux_chain(
-        clause_features: list[TokenFeature], start_idx: int, main_verb_idx: int | None
+        clause_features: TokenFeatureTable, start_idx: int, main_verb_idx: int | None
     ) -> list[str]:
         if main_verb_idx is None:
             return []
@@ -1224,7 +1406,7 @@ class SentenceAnalyzer:
     def _extract_noun_phrases(
         self,
         tokens: list[str],
-        token_features: list[TokenFeature],
+        token_features: TokenFeatureTable,
         clauses: list[ClauseAnalysis],
     ) -> list[NounPhraseAnalysis]:
         if not tokens or not token_features:
@@ -1363,7 +1545,7 @@ class SentenceAnalyzer:
         return nps
 
     def _guess_np_span_at(
-        self, tokens: list[str], token_features: list[TokenFeature], idx: int
+        self, tokens: list[str], token_features: TokenFeatureTable, idx: int
     ) -> tuple[int, int] | None:
         token = tokens[idx]
         feature = token_features[idx]
@@ -1525,7 +1707,7 @@ class SentenceAnalyzer:
 
     @staticmethod
     def _guess_np_head_index(
-        tokens: list[str], token_features: list[TokenFeature], start_idx: int, end_idx: int
+        tokens: list[str], token_features: TokenFeatureTable, start_idx: int, end_idx: int
     ) -> int | None:
         for i in range(end_idx, start_idx - 1, -1):
             if token_features[i].pos_guess == "noun":
@@ -1535,7 +1717,7 @@ class SentenceAnalyzer:
     def _guess_object_np_span(
         self,
         tokens: list[str],
-        token_features: list[TokenFeature],
+        token_features: TokenFeatureTable,
         start_idx: int,
         end_limit: int,
     ) -> tuple[int, int] | None:
@@ -1549,7 +1731,7 @@ class SentenceAnalyzer:
     def _guess_predicate_nominal_np_span(
         self,
         tokens: list[str],
-        token_features: list[TokenFeature],
+        token_features: TokenFeatureTable,
         start_idx: int,
         end_limit: int,
     ) -> tuple[int, int] | None:
@@ -1562,7 +1744,7 @@ class SentenceAnalyzer:
         return span
 
     def _detect_tense_guesses(
-        self, tokens: list[str], token_features: list[TokenFeature]
+        self, tokens: list[str], token_features: TokenFeatureTable
     ) -> list[str]:
         if not tokens or not token_features:
             return []
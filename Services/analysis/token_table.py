@@ -0,0 +1,312 @@
+"""Struct-of-arrays storage for per-token analysis features.
+
+A sentence's token features live in a handful of parallel `array` columns: small integer
+codes for the POS guess, verb confidence, verb form, countability and external POS, and
+bitmasks for the POS candidates and notes. `TokenFeature` is a lightweight view over one
+row so rules can keep reading `feature.pos_guess`, `feature.notes`, etc.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+import threading
+from typing import overload
+
+
+MAX_FLAGS = 64
+
+
+class CodeTable:
+    """Append-only interning of a small string vocabulary into integer codes (0 is None)."""
+
+    def __init__(self, names: Iterable[str] = (), max_codes: int = 127) -> None:
+        self.max_codes = max_codes
+        self.names: list[str | None] = [None]
+        self.codes: dict[str | None, int] = {None: 0}
+        # Tables are module-wide and analyses run on several threads; lookups stay lock-free.
+        self._lock = threading.Lock()
+        for name in names:
+            self.code(name)
+
+    def code(self, name: str | None) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            with self._lock:
+                code = self.codes.get(name)
+                if code is None:
+                    code = len(self.names)
+                    if code > self.max_codes:
+                        raise ValueError(f"Too many distinct values to intern: {name!r}")
+                    # Name first: a reader that finds the code can always resolve it.
+                    self.names.append(name)
+                    self.codes[name] = code
+        return code
+
+    def name(self, code: int) -> str | None:
+        return self.names[code]
+
+
+class FlagTable:
+    """Append-only interning of names into single-bit flags for bitmask columns."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names: list[str] = []
+        self.flags: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for name in names:
+            self.flag(name)
+
+    def flag(self, name: str) -> int:
+        flag = self.flags.get(name)
+        if flag is None:
+            with self._lock:
+                flag = self.flags.get(name)
+                if flag is None:
+                    if len(self.names) >= MAX_FLAGS:
+                        raise ValueError(f"Too many distinct flags to intern: {name!r}")
+                    flag = 1 << len(self.names)
+                    self.names.append(name)
+                    self.flags[name] = flag
+        return flag
+
+    def mask(self, names: Iterable[str]) -> int:
+        mask = 0
+        for name in names:
+            mask |= self.flag(name)
+        return mask
+
+    def names_in(self, mask: int) -> list[str]:
+        return [name for bit, name in enumerate(self.names) if mask >> bit & 1]
+
+
+POS_CODES = CodeTable(
+    (
+        "unknown",
+        "pronoun",
+        "determiner",
+        "auxiliary",
+        "verb",
+        "verb_participle",
+        "adjective",
+        "adverb",
+        "noun",
+        "preposition",
+    )
+)
+POS_FLAGS = FlagTable(POS_CODES.names[1:])
+CONFIDENCE_CODES = CodeTable(("low", "medium", "high"))
+VERB_FORM_CODES = CodeTable(
+    ("present_aux", "past_aux", "modal", "participle_ing", "participle_ed", "past", "v3sg", "base")
+)
+COUNTABILITY_CODES = CodeTable(("countable", "uncountable", "countable_plural", "countable_singular_or_unknown"))
+# Seeded in the order the analyzer emits them so codes are stable across processes.
+NOTE_FLAGS = FlagTable(
+    (
+        "subject_pronoun",
+        "determiner",
+        "core_auxiliary",
+        "modal",
+        "question_auxiliary",
+        "common_adverb",
+        "common_adjective",
+        "suffix_ing",
+        "common_ing_predicative_adj_after_be",
+        "be_plus_ing_before_noun_adj",
+        "progressive_after_be",
+        "degree_word_before_ing",
+        "det_ing_noun_phrase_modifier",
+        "determiner_plus_gerund_noun",
+        "ing_before_noun_adj",
+        "common_ing_adjective",
+        "suffix_ed",
+        "be_plus_ed_predicative_adj",
+        "be_plus_ed_possible_passive",
+        "subject_plus_past_verb",
+        "perfect_participle",
+        "suffix_s",
+        "third_person_s_after_subject",
+        "plural_noun_after_determiner",
+        "plural_subject_before_be",
+        "s_form_after_modal_or_to_unlikely_verb",
+        "in_common_verbs",
+        "noun_verb_ambiguous",
+        "ambiguous_after_determiner_noun",
+        "ambiguous_before_be_noun_subject",
+        "ambiguous_after_modal_to_verb",
+        "ambiguous_after_subject_verb",
+        "initial_command_like_verb",
+        "default_ambiguous_to_noun",
+        "preposition",
+        "adjective_shape_or_context",
+        "default_noun_like",
+        "irregular_past",
+        "irregular_perfect_participle",
+        "irregular_be_participle",
+        "external_pos_support",
+        "external_pos_refined_guess",
+    )
+)
+
+
+class TokenFeature:
+    """Read/write view over one row of a `TokenFeatureTable`.
+
+    `pos_candidates` and `notes` are returned as fresh lists; use the table's
+    `add_candidate`/`add_note` (or assign the attribute) to change them.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: TokenFeatureTable, index: int) -> None:
+        self.table = table
+        self.index = index
+
+    def __repr__(self) -> str:
+        return (
+            f"TokenFeature(token={self.token!r}, index={self.index}, pos_guess={self.pos_guess!r}, "
+            f"pos_candidates={self.pos_candidates!r}, verb_confidence={self.verb_confidence!r}, "
+            f"verb_form_guess={self.verb_form_guess!r}, noun_countability_guess={self.noun_countability_guess!r}, "
+            f"notes={self.notes!r}, external_pos={self.external_pos!r})"
+        )
+
+    @property
+    def token(self) -> str:
+        return self.table.tokens[self.index]
+
+    @property
+    def pos_guess(self) -> str:
+        return POS_CODES.names[self.table.pos[self.index]]
+
+    @pos_guess.setter
+    def pos_guess(self, value: str) -> None:
+        self.table.pos[self.index] = POS_CODES.code(value)
+
+    @property
+    def pos_candidates(self) -> list[str]:
+        return sorted(POS_FLAGS.names_in(self.table.candidates[self.index]))
+
+    @pos_candidates.setter
+    def pos_candidates(self, values: Iterable[str]) -> None:
+        self.table.candidates[self.index] = POS_FLAGS.mask(values)
+
+    @property
+    def verb_confidence(self) -> str:
+        return CONFIDENCE_CODES.names[self.table.confidence[self.index]]
+
+    @verb_confidence.setter
+    def verb_confidence(self, value: str) -> None:
+        self.table.confidence[self.index] = CONFIDENCE_CODES.code(value)
+
+    @property
+    def verb_form_guess(self) -> str | None:
+        return VERB_FORM_CODES.names[self.table.verb_form[self.index]]
+
+    @verb_form_guess.setter
+    def verb_form_guess(self, value: str | None) -> None:
+        self.table.verb_form[self.index] = VERB_FORM_CODES.code(value)
+
+    @property
+    def noun_countability_guess(self) -> str | None:
+        return COUNTABILITY_CODES.names[self.table.countability[self.index]]
+
+    @noun_countability_guess.setter
+    def noun_countability_guess(self, value: str | None) -> None:
+        self.table.countability[self.index] = COUNTABILITY_CODES.code(value)
+
+    @property
+    def notes(self) -> list[str]:
+        return NOTE_FLAGS.names_in(self.table.notes[self.index])
+
+    @notes.setter
+    def notes(self, values: Iterable[str]) -> None:
+        self.table.notes[self.index] = NOTE_FLAGS.mask(values)
+
+    @property
+    def external_pos(self) -> str | None:
+        return POS_CODES.names[self.table.external_pos[self.index]]
+
+    @external_pos.setter
+    def external_pos(self, value: str | None) -> None:
+        self.table.external_pos[self.index] = POS_CODES.code(value)
+
+    def has_candidate(self, name: str) -> bool:
+        return bool(self.table.candidates[self.index] & POS_FLAGS.flag(name))
+
+    def has_note(self, name: str) -> bool:
+        return bool(self.table.notes[self.index] & NOTE_FLAGS.flag(name))
+
+
+class TokenFeatureTable(Sequence[TokenFeature]):
+    """Parallel columns holding the features of every token in one sentence."""
+
+    __slots__ = ("tokens", "pos", "candidates", "confidence", "verb_form", "countability", "external_pos", "notes")
+
+    def __init__(self, tokens: list[str]) -> None:
+        size = len(tokens)
+        self.tokens = tokens
+        self.pos = array("b", bytes(size))
+        self.confidence = array("b", bytes(size))
+        self.verb_form = array("b", bytes(size))
+        self.countability = array("b", bytes(size))
+        self.external_pos = array("b", bytes(size))
+        self.candidates = array("Q", bytes(8 * size))
+        self.notes = array("Q", bytes(8 * size))
+
+    def set_row(
+        self,
+        index: int,
+        pos_guess: str,
+        pos_candidates: Iterable[str],
+        verb_confidence: str,
+        verb_form_guess: str | None,
+        noun_countability_guess: str | None,
+        notes: Iterable[str],
+    ) -> None:
+        self.pos[index] = POS_CODES.code(pos_guess)
+        self.candidates[index] = POS_FLAGS.mask(pos_candidates)
+        self.confidence[index] = CONFIDENCE_CODES.code(verb_confidence)
+        self.verb_form[index] = VERB_FORM_CODES.code(verb_form_guess)
+        self.countability[index] = COUNTABILITY_CODES.code(noun_countability_guess)
+        self.notes[index] = NOTE_FLAGS.mask(notes)
+
+    def sub_table(self, start: int, stop: int) -> TokenFeatureTable:
+        """Copy of rows [start, stop) re-indexed from zero, e.g. for one clause."""
+        table = TokenFeatureTable.__new__(TokenFeatureTable)
+        for column in self.__slots__:
+            setattr(table, column, getattr(self, column)[start:stop])
+        return table
+
+    def copy_rows(self, source: TokenFeatureTable, stop: int) -> None:
+        """Overwrite rows [0, stop) with the same rows of `source`."""
+        for column in self.__slots__:
+            if column != "tokens":
+                getattr(self, column)[:stop] = getattr(source, column)[:stop]
+
+    def add_candidate(self, index: int, name: str) -> None:
+        self.candidates[index] |= POS_FLAGS.flag(name)
+
+    def add_note(self, index: int, name: str) -> None:
+        self.notes[index] |= NOTE_FLAGS.flag(name)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    @overload
+    def __getitem__(self, index: int) -> TokenFeature: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TokenFeature]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [TokenFeature(self, i) for i in range(*index.indices(len(self.tokens)))]
+        if index < 0:
+            index += len(self.tokens)
+        if not 0 <= index < len(self.tokens):
+            raise IndexError("token feature index out of range")
+        return TokenFeature(self, index)
+
+    def __iter__(self) -> Iterator[TokenFeature]:
+        for index in range(len(self.tokens)):
+            yield TokenFeature(self, index)
@@ -1,6 +1,8 @@
 from .shared import *
 
 class FuturePresentContinuousPlanRule(GrammarRule):
+    trigger_tokens = frozenset(FUTURE_TIME_MARKERS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if not _has_future_time_marker(tokens):
@@ -13,7 +15,7 @@ class FuturePresentContinuousPlanRule(GrammarRule):
             next_idx, next_token = _find_verb_after_aux(tokens, idx)
             if next_token is None:
                 continue
-            if next_token in COMMON_ADJECTIVES or next_token in COMMON_ED_PREDICATE_ADJECTIVES:
+            if next_token in active_lexicon().adjectives or next_token in COMMON_ED_PREDICATE_ADJECTIVES:
                 continue
             next_form = _verb_form_at(analysis, next_idx) if next_idx is not None else None
             if (next_form == "base") or (_looks_like_base_verb(next_token) and not _is_ing(next_token)):
@@ -26,6 +28,8 @@ class FuturePresentContinuousPlanRule(GrammarRule):
 
 
 class PresentSimpleScheduleRule(GrammarRule):
+    trigger_tokens = frozenset({"will"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if "schedule" not in analysis.cleaned_text.lower() and not any(t in {"train", "bus", "class", "flight"} for t in tokens):
@@ -40,6 +44,8 @@ class PresentSimpleScheduleRule(GrammarRule):
 
 
 class SemiModalHaveToRule(GrammarRule):
+    trigger_tokens = frozenset({"have", "has", "had"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for idx, token in enumerate(tokens[:-1]):
@@ -72,6 +78,8 @@ class SemiModalHaveToRule(GrammarRule):
 
 
 class ComparativeSuperlativeRule(GrammarRule):
+    trigger_tokens = frozenset({"more", "most", "as"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for i in range(len(tokens) - 1):
@@ -98,6 +106,8 @@ class ComparativeSuperlativeRule(GrammarRule):
 
 
 class B1ConditionalRule(GrammarRule):
+    trigger_tokens = frozenset({"if"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         clauses = _iter_clauses(analysis)
@@ -155,6 +165,8 @@ class B1ConditionalRule(GrammarRule):
 
 
 class BasicPassiveVoiceRule(GrammarRule):
+    trigger_tokens = frozenset(TO_BE_FORMS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for idx, token in enumerate(tokens[:-1]):
@@ -165,11 +177,11 @@ class BasicPassiveVoiceRule(GrammarRule):
             next_pos = _pos_at(analysis, idx + 1)
             if next_token in {"being", "going"}:
                 continue
-            if next_token in COMMON_ADJECTIVES or next_token in COMMON_ED_PREDICATE_ADJECTIVES:
+            if next_token in active_lexicon().adjectives or next_token in COMMON_ED_PREDICATE_ADJECTIVES:
                 continue
             if next_pos == "adjective":
                 continue
-            if next_token in TRANSITIVE_BASES_FOR_PASSIVE or _looks_like_base_verb(next_token):
+            if next_token in active_lexicon().passive_transitive_bases or _looks_like_base_verb(next_token):
                 if (
                     next_token not in {"be"}
                     and next_form not in {"participle_ed", "participle_ing"}
@@ -185,6 +197,9 @@ class BasicPassiveVoiceRule(GrammarRule):
 
 
 class ReportedSpeechBasicRule(GrammarRule):
+    def get_trigger_tokens(self, lexicon: Lexicon) -> frozenset[str] | None:
+        return frozenset(lexicon.reporting_verbs)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         clauses = _iter_clauses(analysis)
@@ -197,14 +212,14 @@ class ReportedSpeechBasicRule(GrammarRule):
             if idx == 0:
                 continue
             prev_tokens = _clause_tokens(analysis, clauses[idx - 1])
-            if any(t in REPORTING_VERBS for t in prev_tokens):
+            if any(t in active_lexicon().reporting_verbs for t in prev_tokens):
                 return ValidationIssue(
                     rule_id=self.rule_id,
                     severity=self.severity,
                     message="In reported/indirect questions, do not use question inversion (e.g. 'He asked where I lived').",
                 )
         for i, token in enumerate(tokens[:-2]):
-            if token not in REPORTING_VERBS:
+            if token not in active_lexicon().reporting_verbs:
                 continue
             # Indirect question inversion error: "He asked where do I live"
             if tokens[i + 1] in WH_QUESTION_WORDS and tokens[i + 2] in QUESTION_AUXILIARIES:
@@ -217,6 +232,8 @@ class ReportedSpeechBasicRule(GrammarRule):
 
 
 class RelativeClauseBasicRule(GrammarRule):
+    trigger_tokens = frozenset({"who", "which", "whose", "whom", "that", "where"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         clauses = _iter_clauses(analysis)
@@ -236,7 +253,7 @@ class RelativeClauseBasicRule(GrammarRule):
                     continue
                 if tokens[i - 1] in {"the", "a", "an"}:
                     continue
-                if token == "that" and tokens[i - 1] not in COMMON_NOUNS_FOR_RELATIVES and tokens[i - 1] not in {"all", "something", "anything"}:
+                if token == "that" and tokens[i - 1] not in active_lexicon().relative_nouns and tokens[i - 1] not in {"all", "something", "anything"}:
                     continue
                 # Common learner error: "The man who he..."
                 if i + 1 < len(tokens) and tokens[i + 1] in ENGLISH_SUBJECT_PRONOUNS:
@@ -249,18 +266,21 @@ class RelativeClauseBasicRule(GrammarRule):
 
 
 class GerundInfinitiveCommonRule(GrammarRule):
+    def get_trigger_tokens(self, lexicon: Lexicon) -> frozenset[str] | None:
+        return frozenset(lexicon.gerund_verbs | lexicon.to_infinitive_verbs)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for i, token in enumerate(tokens[:-1]):
             nxt = tokens[i + 1]
             nxt_form = _verb_form_at(analysis, i + 1)
-            if token in GERUND_VERBS and nxt == "to":
+            if token in active_lexicon().gerund_verbs and nxt == "to":
                 return ValidationIssue(
                     rule_id=self.rule_id,
                     severity=self.severity,
                     message=f"After '{token}', English commonly uses a gerund (e.g. '{token} doing').",
                 )
-            if token in TO_INFINITIVE_VERBS and (nxt_form == "participle_ing" or _is_ing(nxt)):
+            if token in active_lexicon().to_infinitive_verbs and (nxt_form == "participle_ing" or _is_ing(nxt)):
                 if _is_likely_ing_adjective(tokens, i + 1):
                     continue
                 return ValidationIssue(
@@ -272,6 +292,8 @@ class GerundInfinitiveCommonRule(GrammarRule):
 
 
 class DeterminersQuantifiersBasicRule(GrammarRule):
+    trigger_tokens = frozenset({"lot", "lots", "number", "much", "many", "few", "little"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         noun_phrases = getattr(analysis, "noun_phrases", []) or []
@@ -356,6 +378,8 @@ class DeterminersQuantifiersBasicRule(GrammarRule):
 
 
 class SomeAnyRule(GrammarRule):
+    trigger_tokens = frozenset({"some"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if analysis.sentence_type == "interrogative" and "some" in tokens and not any(t in {"would", "could"} for t in tokens):
@@ -374,14 +398,18 @@ class SomeAnyRule(GrammarRule):
 
 
 class PhrasalVerbBasicRule(GrammarRule):
+    def get_trigger_tokens(self, lexicon: Lexicon) -> frozenset[str] | None:
+        return frozenset(lexicon.phrasal_basic)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
+        lexicon = active_lexicon()
         for i in range(len(tokens) - 1):
             verb = tokens[i]
             part = tokens[i + 1]
-            if verb in PHRASAL_BASIC and part in COMMON_PREPOSITIONS | {"up", "off", "on", "out"}:
-                if part not in PHRASAL_BASIC[verb]:
-                    expected = "/".join(sorted(PHRASAL_BASIC[verb]))
+            if verb in lexicon.phrasal_basic and part in lexicon.prepositions | {"up", "off", "on", "out"}:
+                if part not in lexicon.phrasal_basic[verb]:
+                    expected = "/".join(sorted(lexicon.phrasal_basic[verb]))
                     return ValidationIssue(
                         rule_id=self.rule_id,
                         severity=self.severity,
@@ -391,9 +419,10 @@ class PhrasalVerbBasicRule(GrammarRule):
 
 
 class IndirectQuestionFormRule(GrammarRule):
+    trigger_tokens = frozenset(INDIRECT_QUESTION_TRIGGERS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
-        triggers = {"know", "wonder", "ask", "tell", "say", "explain"}
         clauses = _iter_clauses(analysis)
         for idx, clause in enumerate(clauses):
             clause_tokens = _clause_tokens(analysis, clause)
@@ -404,14 +433,14 @@ class IndirectQuestionFormRule(GrammarRule):
             if idx == 0:
                 continue
             prev_tokens = _clause_tokens(analysis, clauses[idx - 1])
-            if prev_tokens and any(t in triggers for t in prev_tokens):
+            if prev_tokens and any(t in INDIRECT_QUESTION_TRIGGERS for t in prev_tokens):
                 return ValidationIssue(
                     rule_id=self.rule_id,
                     severity=self.severity,
                     message="In indirect questions, use statement order (e.g. 'Do you know where he lives?').",
                 )
         for i in range(len(tokens) - 3):
-            if tokens[i] not in triggers:
+            if tokens[i] not in INDIRECT_QUESTION_TRIGGERS:
                 continue
             if tokens[i + 1] in WH_QUESTION_WORDS and tokens[i + 2] in QUESTION_AUXILIARIES:
                 return ValidationIssue(
@@ -1,6 +1,8 @@
 from .shared import *
 
 class PresentPerfectContinuousRule(GrammarRule):
+    trigger_tokens = frozenset({"have", "has"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for i, token in enumerate(tokens):
@@ -20,6 +22,8 @@ class PresentPerfectContinuousRule(GrammarRule):
 
 
 class PastPerfectRule(GrammarRule):
+    trigger_tokens = frozenset({"had"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for i, token in enumerate(tokens[:-1]):
@@ -39,6 +43,8 @@ class PastPerfectRule(GrammarRule):
 
 
 class PastPerfectContinuousRule(GrammarRule):
+    trigger_tokens = frozenset({"had"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         idx = _find_sequence(tokens, ["had", "been"])
@@ -55,6 +61,8 @@ class PastPerfectContinuousRule(GrammarRule):
 
 
 class FutureContinuousRule(GrammarRule):
+    trigger_tokens = frozenset({"will"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         idx = _find_sequence(tokens, ["will", "be"])
@@ -71,6 +79,8 @@ class FutureContinuousRule(GrammarRule):
 
 
 class FuturePerfectRule(GrammarRule):
+    trigger_tokens = frozenset({"will"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         idx = _find_sequence(tokens, ["will", "have"])
@@ -96,6 +106,8 @@ class FuturePerfectRule(GrammarRule):
 
 
 class FuturePerfectContinuousRule(GrammarRule):
+    trigger_tokens = frozenset({"will"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         idx = _find_sequence(tokens, ["will", "have", "been"])
@@ -112,6 +124,8 @@ class FuturePerfectContinuousRule(GrammarRule):
 
 
 class AdvancedConditionalRule(GrammarRule):
+    trigger_tokens = frozenset({"if", "unless", "provided", "long"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         clauses = _iter_clauses(analysis)
@@ -166,11 +180,12 @@ class AdvancedConditionalRule(GrammarRule):
 
 
 class AdvancedModalPerfectRule(GrammarRule):
+    trigger_tokens = frozenset(PERFECT_MODALS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
-        modal_set = {"must", "might", "may", "could", "should", "can't", "cannot"}
         for i, token in enumerate(tokens[:-1]):
-            if token not in modal_set:
+            if token not in PERFECT_MODALS:
                 continue
             if i + 1 < len(tokens) and tokens[i + 1] == "have":
                 next_form = _verb_form_at(analysis, i + 2) if i + 2 < len(tokens) else None
@@ -184,6 +199,8 @@ class AdvancedModalPerfectRule(GrammarRule):
 
 
 class AdvancedPassiveVoiceRule(GrammarRule):
+    trigger_tokens = frozenset({"been", "be", "is"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         # has been done / will be done / must be done
@@ -228,6 +245,12 @@ class AdvancedPassiveVoiceRule(GrammarRule):
 
 
 class ReportedSpeechAdvancedRule(GrammarRule):
+    # Any inflection of "suggest" normalizes to a token starting with "suggest".
+    trigger_prefixes = ("suggest",)
+
+    def get_trigger_tokens(self, lexicon: Lexicon) -> frozenset[str] | None:
+        return frozenset(lexicon.reporting_verbs | {"wonder", "wonders", "wondered"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         clauses = _iter_clauses(analysis)
@@ -266,7 +289,7 @@ class ReportedSpeechAdvancedRule(GrammarRule):
             if idx == 0:
                 continue
             prev_tokens = _clause_tokens(analysis, clauses[idx - 1])
-            if any(t in REPORTING_VERBS | {"wonder", "wonders", "wondered"} for t in prev_tokens):
+            if any(t in active_lexicon().reporting_verbs | {"wonder", "wonders", "wondered"} for t in prev_tokens):
                 return ValidationIssue(
                     rule_id=self.rule_id,
                     severity=self.severity,
@@ -276,10 +299,12 @@ class ReportedSpeechAdvancedRule(GrammarRule):
 
 
 class RelativeClauseAdvancedRule(GrammarRule):
+    trigger_tokens = frozenset({"whose", "that"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for i in range(1, len(tokens) - 1):
-            if tokens[i] in {"which", "whom"} and tokens[i - 1] in COMMON_PREPOSITIONS:
+            if tokens[i] in {"which", "whom"} and tokens[i - 1] in active_lexicon().prepositions:
                 # valid advanced pattern: "to which", "with whom"
                 continue
             if tokens[i] == "whose" and tokens[i - 1] in SUBJECT_DETERMINERS:
@@ -304,6 +329,8 @@ class RelativeClauseAdvancedRule(GrammarRule):
 
 
 class InversionEmphasisRule(GrammarRule):
+    trigger_tokens = frozenset({"never", "rarely", "seldom", "hardly", "scarcely", "not", "no"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         clauses = _iter_clauses(analysis)
@@ -354,6 +381,8 @@ class InversionEmphasisRule(GrammarRule):
 
 
 class CleftSentenceRule(GrammarRule):
+    trigger_tokens = frozenset({"what", "it"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         clauses = _iter_clauses(analysis)
@@ -375,7 +404,7 @@ class CleftSentenceRule(GrammarRule):
             # Avoid false positives in ordinary predicates: "It is important/clear/possible..."
             if focus_pos in {"adverb"}:
                 return None
-            if tokens[2] in COMMON_ADJECTIVES | {"important", "clear", "possible", "necessary"}:
+            if tokens[2] in active_lexicon().adjectives | {"important", "clear", "possible", "necessary"}:
                 return None
             if focus_pos == "adjective" and len(tokens) >= 5 and tokens[3] not in ENGLISH_SUBJECT_PRONOUNS:
                 return None
@@ -389,6 +418,8 @@ class CleftSentenceRule(GrammarRule):
 
 
 class GerundInfinitiveMeaningRule(GrammarRule):
+    trigger_tokens = frozenset({"stop", "remember"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         # Detect obvious malformed patterns in high-value pairs.
@@ -404,6 +435,8 @@ class GerundInfinitiveMeaningRule(GrammarRule):
 
 
 class NounClauseComplexRule(GrammarRule):
+    trigger_tokens = frozenset(NOUN_CLAUSE_TRIGGERS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         clauses = _iter_clauses(analysis)
@@ -471,6 +504,8 @@ class NounClauseComplexRule(GrammarRule):
 
 
 class LinkingDeviceRule(GrammarRule):
+    trigger_tokens = frozenset({"however", "therefore", "moreover", "despite", "although"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if not tokens:
@@ -506,6 +541,8 @@ class LinkingDeviceRule(GrammarRule):
 
 
 class QuantifiersDeterminersAdvancedRule(GrammarRule):
+    trigger_tokens = frozenset({"each", "every", "either", "neither", "both", "so", "such", "enough"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for np in getattr(analysis, "noun_phrases", []) or []:
@@ -557,7 +594,7 @@ class QuantifiersDeterminersAdvancedRule(GrammarRule):
                     severity=self.severity,
                     message="Use 'such + noun' (or 'so + adjective') in this pattern.",
                 )
-            if q == "such" and n in COMMON_ADJECTIVES and i + 2 < len(tokens) and _is_likely_noun(tokens[i + 2]):
+            if q == "such" and n in active_lexicon().adjectives and i + 2 < len(tokens) and _is_likely_noun(tokens[i + 2]):
                 np_from_such = _noun_phrase_starting_at(analysis, i)
                 if np_from_such is not None and np_from_such.countability_guess in {"countable_plural", "uncountable"}:
                     pass
@@ -576,9 +613,9 @@ class QuantifiersDeterminersAdvancedRule(GrammarRule):
                         message="With plural nouns, use 'such + plural noun' (not 'such a/an ...').",
                     )
         for i in range(len(tokens) - 2):
-            if tokens[i] in COMMON_ADJECTIVES and tokens[i + 1] == "enough" and tokens[i + 2] == "to":
+            if tokens[i] in active_lexicon().adjectives and tokens[i + 1] == "enough" and tokens[i + 2] == "to":
                 continue
-            if tokens[i] == "enough" and tokens[i + 1] in COMMON_ADJECTIVES and _is_likely_noun(tokens[i + 2]):
+            if tokens[i] == "enough" and tokens[i + 1] in active_lexicon().adjectives and _is_likely_noun(tokens[i + 2]):
                 return ValidationIssue(
                     rule_id=self.rule_id,
                     severity=self.severity,
@@ -590,6 +627,7 @@ class QuantifiersDeterminersAdvancedRule(GrammarRule):
 class PhrasalVerbAdvancedRule(GrammarRule):
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
+        lexicon = active_lexicon()
         for i in range(len(tokens) - 1):
             verb = tokens[i]
             part = tokens[i + 1]
@@ -597,9 +635,9 @@ class PhrasalVerbAdvancedRule(GrammarRule):
             pos = _pos_at(analysis, i)
             if pos not in {"verb", "verb_participle", "auxiliary", None}:
                 continue
-            if verb_lemma in PHRASAL_ADVANCED and part in COMMON_PREPOSITIONS | {"up", "out", "with"}:
-                if part not in PHRASAL_ADVANCED[verb_lemma]:
-                    expected = "/".join(sorted(PHRASAL_ADVANCED[verb_lemma]))
+            if verb_lemma in lexicon.phrasal_advanced and part in lexicon.prepositions | {"up", "out", "with"}:
+                if part not in lexicon.phrasal_advanced[verb_lemma]:
+                    expected = "/".join(sorted(lexicon.phrasal_advanced[verb_lemma]))
                     return ValidationIssue(
                         rule_id=self.rule_id,
                         severity=self.severity,
@@ -618,6 +656,8 @@ class PhrasalVerbAdvancedRule(GrammarRule):
 
 
 class WordFormationRule(GrammarRule):
+    trigger_tokens = frozenset({"decide", "decision", "different", "success"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         # High-frequency family: decide / decision / decisive
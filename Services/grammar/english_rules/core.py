@@ -72,6 +72,8 @@ class QuestionAuxiliaryRule(GrammarRule):
 
 
 class ToBeWithoutDoRule(GrammarRule):
+    trigger_tokens = frozenset(BASE_AUXILIARIES)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         if not analysis.tokens:
             return None
@@ -91,6 +93,8 @@ class ToBeWithoutDoRule(GrammarRule):
 
 
 class ThirdPersonSingularSRule(GrammarRule):
+    trigger_tokens = frozenset(SINGULAR_THIRD_SUBJECTS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         if analysis.sentence_type != "declarative":
             return None
@@ -117,6 +121,8 @@ class ThirdPersonSingularSRule(GrammarRule):
 
 
 class PresentSimpleDoNegationRule(GrammarRule):
+    trigger_tokens = frozenset({"not", "don't", "doesn't"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if len(tokens) < 3:
@@ -174,6 +180,8 @@ class PresentSimpleDoNegationRule(GrammarRule):
 
 
 class ArticleSoundRule(GrammarRule):
+    trigger_tokens = frozenset({"a", "an"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for idx, token in enumerate(tokens[:-1]):
@@ -193,6 +201,8 @@ class ArticleSoundRule(GrammarRule):
 
 
 class ArticleCountabilityRule(GrammarRule):
+    trigger_tokens = frozenset({"a", "an", *TO_BE_FORMS})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if not tokens:
@@ -235,7 +245,7 @@ class ArticleCountabilityRule(GrammarRule):
             if pos2 == "adjective" and countability is None:
                 adjective_like_suffixes = ("ant", "ent", "ful", "ous", "ive", "able", "ible", "al", "ic")
                 if (
-                    tokens[2] in COMMON_ADJECTIVES
+                    tokens[2] in active_lexicon().adjectives
                     or tokens[2] in COMMON_ED_PREDICATE_ADJECTIVES
                     or (len(tokens) > 3 and tokens[3] == "to")
                     or tokens[2].endswith(adjective_like_suffixes)
@@ -256,6 +266,8 @@ class ArticleCountabilityRule(GrammarRule):
 
 
 class ArticleGenericReferenceRule(GrammarRule):
+    trigger_tokens = frozenset({"the"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if len(tokens) < 4 or analysis.sentence_type != "declarative":
@@ -339,7 +351,7 @@ class ArticleBareSingularCountableRule(GrammarRule):
             return None
 
         # Skip likely names/proper nouns (very rough): not in common noun lexicon and no article-related pattern.
-        if tokens[0] not in COUNTABLE_HINT_NOUNS and tokens[0] not in COMMON_NOUNS_FOR_RELATIVES and countability != "countable":
+        if tokens[0] not in COUNTABLE_HINT_NOUNS and tokens[0] not in active_lexicon().relative_nouns and countability != "countable":
             return None
 
         # Trigger only in simple high-confidence starter patterns.
@@ -356,7 +368,7 @@ class ArticleBareSingularCountableRule(GrammarRule):
                 severity=self.severity,
                 message="A singular countable noun as subject usually needs an article/determiner (e.g. 'A student studies...').",
             )
-        if _is_likely_inflected_s_form(tokens[1]) and tokens[1] not in COMMON_PREPOSITIONS:
+        if _is_likely_inflected_s_form(tokens[1]) and tokens[1] not in active_lexicon().prepositions:
             return ValidationIssue(
                 rule_id=self.rule_id,
                 severity=self.severity,
@@ -366,33 +378,13 @@ class ArticleBareSingularCountableRule(GrammarRule):
 
 
 class ArticleBareSingularObjectRule(GrammarRule):
+    trigger_tokens = frozenset(COMMON_OBJECT_TRANSITIVES)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if len(tokens) < 3 or analysis.sentence_type != "declarative":
             return None
 
-        common_transitives = {
-            "have",
-            "has",
-            "need",
-            "want",
-            "buy",
-            "bought",
-            "find",
-            "found",
-            "see",
-            "saw",
-            "read",
-            "build",
-            "built",
-            "write",
-            "wrote",
-            "take",
-            "took",
-            "get",
-            "got",
-        }
-
         for np in getattr(analysis, "noun_phrases", []):
             if np.role_guess != "object":
                 continue
@@ -402,7 +394,7 @@ class ArticleBareSingularObjectRule(GrammarRule):
                 continue
             if np.head_idx <= 0:
                 continue
-            if tokens[np.head_idx - 1] not in common_transitives:
+            if tokens[np.head_idx - 1] not in COMMON_OBJECT_TRANSITIVES:
                 continue
             # Avoid likely compounds ("car insurance") if next token is noun.
             if np.end_idx + 1 < len(tokens) and _pos_at(analysis, np.end_idx + 1) == "noun":
@@ -414,7 +406,7 @@ class ArticleBareSingularObjectRule(GrammarRule):
             )
 
         for i in range(len(tokens) - 1):
-            if tokens[i] not in common_transitives:
+            if tokens[i] not in COMMON_OBJECT_TRANSITIVES:
                 continue
             obj_idx = i + 1
             if tokens[obj_idx] in SUBJECT_DETERMINERS | ENGLISH_SUBJECT_PRONOUNS:
@@ -435,7 +427,7 @@ class ArticleBareSingularObjectRule(GrammarRule):
                 next_pos = _pos_at(analysis, obj_idx + 1)
                 if next_pos == "noun":
                     continue
-                if tokens[obj_idx + 1] in COMMON_PREPOSITIONS:
+                if tokens[obj_idx + 1] in active_lexicon().prepositions:
                     continue
 
             return ValidationIssue(
@@ -448,6 +440,8 @@ class ArticleBareSingularObjectRule(GrammarRule):
 
 
 class ArticleUncountableGenericTheRule(GrammarRule):
+    trigger_tokens = frozenset({"the"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if len(tokens) < 4 or analysis.sentence_type != "declarative":
@@ -482,7 +476,7 @@ class ArticleUncountableGenericTheRule(GrammarRule):
         # Avoid clearly specific contexts.
         if any(t in {"here", "there", "this", "that", "these", "those"} for t in tokens[3:]):
             return None
-        if any(t in COMMON_PREPOSITIONS for t in tokens[3:6]):
+        if any(t in active_lexicon().prepositions for t in tokens[3:6]):
             return None
         if any(linker in {"which", "that", "who"} for linker in getattr(analysis, "clause_linkers_detected", [])):
             return None
@@ -495,6 +489,8 @@ class ArticleUncountableGenericTheRule(GrammarRule):
 
 
 class AdjectiveNounOrderRule(GrammarRule):
+    trigger_tokens = frozenset(SUBJECT_DETERMINERS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if len(tokens) < 3:
@@ -504,9 +500,9 @@ class AdjectiveNounOrderRule(GrammarRule):
             det, maybe_noun, maybe_adj = tokens[i], tokens[i + 1], tokens[i + 2]
             if det not in SUBJECT_DETERMINERS:
                 continue
-            if maybe_adj not in COMMON_ADJECTIVES:
+            if maybe_adj not in active_lexicon().adjectives:
                 continue
-            if maybe_noun in COMMON_ADJECTIVES or maybe_noun in TO_BE_FORMS or maybe_noun in MODAL_VERBS:
+            if maybe_noun in active_lexicon().adjectives or maybe_noun in TO_BE_FORMS or maybe_noun in MODAL_VERBS:
                 continue
             if _looks_like_base_verb(maybe_noun) and maybe_noun not in {"house", "car", "book", "apple"}:
                 continue
@@ -521,6 +517,8 @@ class AdjectiveNounOrderRule(GrammarRule):
 
 
 class BasicSVOOrderRule(GrammarRule):
+    trigger_tokens = frozenset(ENGLISH_SUBJECT_PRONOUNS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         if analysis.sentence_type != "declarative":
             return None
@@ -554,19 +552,24 @@ class BasicSVOOrderRule(GrammarRule):
 
 
 class PrepositionCollocationRule(GrammarRule):
+    trigger_tokens = frozenset(
+        {"interested", "good", "different", "reason", "answer", "solution", "problem", "interest"}
+    )
+    trigger_prefixes = ("depend",)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for idx, token in enumerate(tokens[:-1]):
             next_token = tokens[idx + 1]
 
-            if token == "interested" and next_token in COMMON_PREPOSITIONS and next_token != "in":
+            if token == "interested" and next_token in active_lexicon().prepositions and next_token != "in":
                 return ValidationIssue(
                     rule_id=self.rule_id,
                     severity=self.severity,
                     message="Use 'interested in' (e.g. 'I am interested in music').",
                 )
 
-            if token.startswith("depend") and next_token in COMMON_PREPOSITIONS and next_token not in {"on", "upon"}:
+            if token.startswith("depend") and next_token in active_lexicon().prepositions and next_token not in {"on", "upon"}:
                 return ValidationIssue(
                     rule_id=self.rule_id,
                     severity=self.severity,
@@ -585,7 +588,7 @@ class PrepositionCollocationRule(GrammarRule):
                     severity=self.severity,
                     message="Common learner-safe collocations are usually 'different from' (and sometimes 'different to', dialect-dependent), not typically 'different than' here.",
                 )
-            if token in {"reason", "answer", "solution", "problem", "interest"} and next_token in COMMON_PREPOSITIONS:
+            if token in {"reason", "answer", "solution", "problem", "interest"} and next_token in active_lexicon().prepositions:
                 expected_map = {
                     "reason": {"for"},
                     "answer": {"to"},
@@ -606,6 +609,8 @@ class PrepositionCollocationRule(GrammarRule):
 
 
 class ModalBaseVerbRule(GrammarRule):
+    trigger_tokens = frozenset(MODAL_VERBS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         if analysis.modal_token is None:
             return None
@@ -657,7 +662,7 @@ class ModalBaseVerbRule(GrammarRule):
 
         if next_idx is not None and next_idx + 1 < len(tokens):
             following = tokens[next_idx + 1]
-            if next_token in BASE_AUXILIARIES and following in COMMON_BASE_VERBS:
+            if next_token in BASE_AUXILIARIES and following in active_lexicon().base_verbs:
                 return ValidationIssue(
                     rule_id=self.rule_id,
                     severity=self.severity,
@@ -668,6 +673,8 @@ class ModalBaseVerbRule(GrammarRule):
 
 
 class ModalCombinationRule(GrammarRule):
+    trigger_tokens = frozenset(MODAL_VERBS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for i in range(len(tokens) - 1):
@@ -681,6 +688,8 @@ class ModalCombinationRule(GrammarRule):
 
 
 class SubjectBeAgreementRule(GrammarRule):
+    trigger_tokens = frozenset(TO_BE_FORMS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         if analysis.subject_number_guess is None or analysis.be_form_token is None:
             return None
@@ -1,10 +1,58 @@
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+
 from .shared import GrammarRule
 from .core import *
 from .tenses import *
 from .b1 import *
 from .b2 import *
 
+# Bump when rule behaviour changes without changing the rule list itself
+# (new heuristics inside evaluate, message tweaks, etc.).
+ENGLISH_RULESET_REVISION = 1
+
+
+@dataclass(frozen=True)
+class CompiledRuleRegistry:
+    """Immutable, process-wide handle over the English rule list."""
+
+    version: str
+    rules: tuple[GrammarRule, ...]
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @property
+    def rule_ids(self) -> tuple[str, ...]:
+        return tuple(rule.rule_id for rule in self.rules)
+
+
+def _ruleset_fingerprint(rules: tuple[GrammarRule, ...]) -> str:
+    digest = hashlib.sha1()
+    for rule in rules:
+        digest.update(f"{type(rule).__name__}|{rule.rule_id}|{rule.severity}\n".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+@lru_cache(maxsize=1)
+def get_compiled_english_rules() -> CompiledRuleRegistry:
+    rules = tuple(_build_english_rules())
+    return CompiledRuleRegistry(
+        version=f"{ENGLISH_RULESET_REVISION}-{_ruleset_fingerprint(rules)}",
+        rules=rules,
+    )
+
+
 def get_english_rules() -> list[GrammarRule]:
+    # Rules are frozen, so handing out the shared instances is safe.
+    return list(get_compiled_english_rules().rules)
+
+
+def _build_english_rules() -> list[GrammarRule]:
     return [
         RequiredVerbRule(
             rule_id="en.required_verb",
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
 from Services.analysis.english_heuristics import (
     BASE_COMMON_ADJECTIVES,
@@ -8,6 +9,7 @@ from Services.analysis.english_heuristics import (
     is_ed_form,
     is_ing_form,
 )
+from Services.analysis.lexicon import Lexicon, active_lexicon
 from Services.analysis.sentence_analyzer import (
     BASE_AUXILIARIES,
     ENGLISH_SUBJECT_PRONOUNS,
@@ -21,6 +23,8 @@ from Services.analysis.sentence_analyzer import (
 from Services.validation.validation_result import ValidationIssue
 
 
+# Base vocabulary. These sets are never mutated: dictionary words are merged into a
+# Lexicon (Services/analysis/lexicon.py) and rules read the merged sets via active_lexicon().
 NEGATIVE_TOKENS = {"not", "don't", "doesn't", "didn't", "won't", "can't"}
 COMMON_PREPOSITIONS = {
     *BASE_PREPOSITIONS,
@@ -226,6 +230,29 @@ COMMON_NOUNS_FOR_RELATIVES = {
     "teacher",
 }
 TRANSITIVE_BASES_FOR_PASSIVE = {"make", "build", "do", "write", "carry", "find", "see"}
+COMMON_OBJECT_TRANSITIVES = {
+    "have",
+    "has",
+    "need",
+    "want",
+    "buy",
+    "bought",
+    "find",
+    "found",
+    "see",
+    "saw",
+    "read",
+    "build",
+    "built",
+    "write",
+    "wrote",
+    "take",
+    "took",
+    "get",
+    "got",
+}
+INDIRECT_QUESTION_TRIGGERS = {"know", "wonder", "ask", "tell", "say", "explain"}
+PERFECT_MODALS = {"must", "might", "may", "could", "should", "can't", "cannot"}
 
 
 def _is_word(token: str) -> bool:
@@ -257,7 +284,7 @@ def _looks_like_base_verb(token: str) -> bool:
         return False
     if _is_ing(token) or _is_ed(token):
         return False
-    if token in COMMON_BASE_VERBS:
+    if token in active_lexicon().base_verbs:
         return True
     if token.endswith("s") and token not in {"is"}:
         return False
@@ -265,13 +292,13 @@ def _looks_like_base_verb(token: str) -> bool:
 
 
 def _looks_like_clear_base_verb(token: str) -> bool:
-    if token in COMMON_BASE_VERBS:
+    if token in active_lexicon().base_verbs:
         return True
     if not _is_word(token):
         return False
-    if token in COMMON_PREPOSITIONS or token in SUBJECT_DETERMINERS:
+    if token in active_lexicon().prepositions or token in SUBJECT_DETERMINERS:
         return False
-    if token in COMMON_ADJECTIVES or token in COMMON_ED_PREDICATE_ADJECTIVES:
+    if token in active_lexicon().adjectives or token in COMMON_ED_PREDICATE_ADJECTIVES:
         return False
     if token in COMMON_IRREGULAR_PAST or token in COMMON_IRREGULAR_PARTICIPLES:
         return False
@@ -425,15 +452,15 @@ def _is_likely_noun(token: str) -> bool:
         return False
     if token in ENGLISH_SUBJECT_PRONOUNS | SUBJECT_DETERMINERS | QUESTION_AUXILIARIES | MODAL_VERBS | TO_BE_FORMS:
         return False
-    if token in COMMON_PREPOSITIONS:
+    if token in active_lexicon().prepositions:
         return False
     if token in COMMON_ADVERBS:
         return False
     if _is_ing(token):
         return True
-    if token in COMMON_ADJECTIVES or token in COMMON_ED_PREDICATE_ADJECTIVES:
+    if token in active_lexicon().adjectives or token in COMMON_ED_PREDICATE_ADJECTIVES:
         return False
-    if token in COMMON_BASE_VERBS or token in COMMON_IRREGULAR_PAST or token in COMMON_IRREGULAR_PARTICIPLES:
+    if token in active_lexicon().base_verbs or token in COMMON_IRREGULAR_PAST or token in COMMON_IRREGULAR_PARTICIPLES:
         return False
     return True
 
@@ -508,13 +535,13 @@ def _classify_ing_usage(tokens: list[str], idx: int) -> str:
     next_token = tokens[idx + 1] if idx + 1 < len(tokens) else None
 
     if prev in {"am", "is", "are", "was", "were", "be", "been", "being"}:
-        if token in COMMON_ADJECTIVES:
+        if token in active_lexicon().adjectives:
             return "adjective"
         if prev in {"be", "been", "being"} and next_token and _is_likely_noun(next_token):
             return "adjective"
         return "progressive_verb"
 
-    if prev in COMMON_PREPOSITIONS | {"to"}:
+    if prev in active_lexicon().prepositions | {"to"}:
         # "to" can be infinitive marker; if preceded by be-going-to or modal contexts, keep unknown.
         if prev == "to":
             prev2 = tokens[idx - 2] if idx > 1 else None
@@ -522,7 +549,7 @@ def _classify_ing_usage(tokens: list[str], idx: int) -> str:
                 return "unknown"
         return "gerund"
 
-    if prev in GERUND_VERBS:
+    if prev in active_lexicon().gerund_verbs:
         return "gerund"
 
     if prev in SUBJECT_DETERMINERS | {"very", "so", "too", "more", "most"}:
@@ -532,7 +559,7 @@ def _classify_ing_usage(tokens: list[str], idx: int) -> str:
         return "adjective"
 
     # Sentence-initial gerund subject: "Working at night is hard."
-    if idx == 0 and next_token and next_token in COMMON_PREPOSITIONS | SUBJECT_DETERMINERS:
+    if idx == 0 and next_token and next_token in active_lexicon().prepositions | SUBJECT_DETERMINERS:
         return "gerund"
 
     return "unknown"
@@ -546,12 +573,21 @@ def _is_likely_gerund(tokens: list[str], idx: int) -> bool:
     return _classify_ing_usage(tokens, idx) == "gerund"
 
 
-@dataclass
+@dataclass(frozen=True)
 class GrammarRule:
     rule_id: str
     severity: str
     description: str
 
+    # The rule can only fire when one of these tokens (or a token starting with one of
+    # the prefixes) is present. None means "no cheap precondition": always evaluate.
+    trigger_tokens: ClassVar[frozenset[str] | None] = None
+    trigger_prefixes: ClassVar[tuple[str, ...]] = ()
+
+    def get_trigger_tokens(self, lexicon: Lexicon) -> frozenset[str] | None:
+        # Override when triggers come from lexicon words that dictionary data can extend.
+        return self.trigger_tokens
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         raise NotImplementedError
 
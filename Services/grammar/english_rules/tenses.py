@@ -1,6 +1,8 @@
 from .shared import *
 
 class PresentContinuousRule(GrammarRule):
+    trigger_tokens = frozenset({"am", "is", "are"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if not tokens:
@@ -14,7 +16,7 @@ class PresentContinuousRule(GrammarRule):
             if next_token is None:
                 continue
             next_pos = _pos_at(analysis, next_idx) if next_idx is not None else None
-            if next_token in SUBJECT_DETERMINERS or next_token in COMMON_ADJECTIVES:
+            if next_token in SUBJECT_DETERMINERS or next_token in active_lexicon().adjectives:
                 continue
             if next_token in COMMON_ED_PREDICATE_ADJECTIVES:
                 continue
@@ -40,6 +42,8 @@ class PresentContinuousRule(GrammarRule):
 
 
 class StativeVerbContinuousRule(GrammarRule):
+    trigger_tokens = frozenset(TO_BE_FORMS)
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         if analysis.primary_tense_guess not in {"present_continuous", "past_continuous"}:
             return None
@@ -79,6 +83,8 @@ class StativeVerbContinuousRule(GrammarRule):
 
 
 class PastContinuousRule(GrammarRule):
+    trigger_tokens = frozenset({"was", "were"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for idx, token in enumerate(tokens):
@@ -89,7 +95,7 @@ class PastContinuousRule(GrammarRule):
             if next_token is None:
                 continue
             next_pos = _pos_at(analysis, next_idx) if next_idx is not None else None
-            if next_token in SUBJECT_DETERMINERS or next_token in COMMON_ADJECTIVES:
+            if next_token in SUBJECT_DETERMINERS or next_token in active_lexicon().adjectives:
                 continue
             if next_token in COMMON_ED_PREDICATE_ADJECTIVES:
                 continue
@@ -112,6 +118,8 @@ class PastContinuousRule(GrammarRule):
 
 
 class PastSimpleRule(GrammarRule):
+    trigger_tokens = frozenset({"did", "didn't", *PAST_TIME_MARKERS})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if not tokens:
@@ -153,6 +161,8 @@ class PastSimpleRule(GrammarRule):
 
 
 class FutureWillRule(GrammarRule):
+    trigger_tokens = frozenset({"will"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if "will" not in tokens:
@@ -185,6 +195,8 @@ class FutureWillRule(GrammarRule):
 
 
 class GoingToFutureRule(GrammarRule):
+    trigger_tokens = frozenset({"going"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for idx in range(len(tokens) - 2):
@@ -218,6 +230,8 @@ class GoingToFutureRule(GrammarRule):
 
 
 class PresentPerfectRule(GrammarRule):
+    trigger_tokens = frozenset({"have", "has"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         for idx, token in enumerate(tokens):
@@ -256,6 +270,8 @@ class PresentPerfectRule(GrammarRule):
 
 
 class PresentSimpleStructureRule(GrammarRule):
+    trigger_tokens = frozenset({"do", "does", *WH_QUESTION_WORDS})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if not tokens:
@@ -294,6 +310,8 @@ class PresentSimpleStructureRule(GrammarRule):
 
 
 class PresentPerfectVsPastSimpleUsageRule(GrammarRule):
+    trigger_tokens = frozenset({"have", "has"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if not tokens:
@@ -315,6 +333,8 @@ class PresentPerfectVsPastSimpleUsageRule(GrammarRule):
 
 
 class PastContinuousInterruptionRule(GrammarRule):
+    trigger_tokens = frozenset({"when"})
+
     def evaluate(self, analysis: SentenceAnalysis) -> ValidationIssue | None:
         tokens = analysis.tokens
         if "when" not in tokens:
@@ -1,4 +1,8 @@
-from Services.grammar.english_rules.registry import get_english_rules
+from Services.grammar.english_rules.registry import (
+    CompiledRuleRegistry,
+    get_compiled_english_rules,
+    get_english_rules,
+)
 from Services.grammar.english_rules.shared import GrammarRule
 
-__all__ = ["GrammarRule", "get_english_rules"]
+__all__ = ["CompiledRuleRegistry", "GrammarRule", "get_compiled_english_rules", "get_english_rules"]
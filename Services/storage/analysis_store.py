@@ -0,0 +1,152 @@
+from dataclasses import dataclass, field
+import hashlib
+import json
+
+from peewee import JOIN, chunked
+
+from Models.base_model import db
+from Models.oration_analysis_model import OrationAnalysis
+from Models.oration_model import Oration
+from Models.word_model import Word
+from Services.analysis.lexicon import use_lexicon
+from Services.validation.rule_engine import RuleEngine
+from Services.validation.validation_result import ValidationResult
+
+
+SUMMARY_WRITE_CHUNK_SIZE = 500
+
+
+@dataclass
+class ExampleAnalysisSummary:
+    sentence_type: str
+    primary_tense: str | None
+    tense_guesses: list[str] = field(default_factory=list)
+    rule_hits: list[str] = field(default_factory=list)
+
+
+def hash_example_text(text: str) -> str:
+    return hashlib.sha1(text.strip().encode("utf-8")).hexdigest()
+
+
+class ExampleAnalysisStore:
+    """
+    Persists analysis summaries for saved examples in the `orationanalysis` table.
+
+    A row is reused while its text hash and engine version still match; otherwise the
+    example is analyzed again and the row rewritten.
+
+    The lexicon version is deliberately not part of the stamp: it is a per-process
+    counter, so every row would go stale on each launch. Rows are always computed with
+    the dictionary lexicon loaded; later dictionary edits only extend it with a few
+    words and are accepted as drift until the example text or the engine changes.
+    """
+
+    def __init__(self, rule_engine: RuleEngine) -> None:
+        self.rule_engine = rule_engine
+
+    def summarize(self, text: str, validation: ValidationResult | None = None) -> ExampleAnalysisSummary:
+        engine = self.rule_engine
+        # Analyze with the same (dictionary-merged) lexicon the rules see, even while the
+        # warm-up is still loading it: the stored row is not recomputed later.
+        engine.ensure_lexicon_ready()
+        with use_lexicon(engine.lexicon):
+            analysis = engine.sentence_analyzer.analyze_english(text)
+        if validation is None:
+            validation = engine.validate_sentence(text, language="english")
+        rule_hits = {
+            issue.rule_id
+            for issue in [*validation.errors, *validation.warnings, *validation.pattern_warnings]
+        }
+        return ExampleAnalysisSummary(
+            sentence_type=analysis.sentence_type,
+            primary_tense=analysis.primary_tense_guess,
+            tense_guesses=list(analysis.tense_guesses),
+            rule_hits=sorted(rule_hits),
+        )
+
+    def save(
+        self,
+        oration_id: str,
+        text: str,
+        validation: ValidationResult | None = None,
+    ) -> ExampleAnalysisSummary:
+        summary = self.summarize(text, validation)
+        self._write_rows([self._summary_row(oration_id, text, summary)])
+        return summary
+
+    def summaries_by_word(self) -> dict[str, ExampleAnalysisSummary]:
+        """
+        Return the summary of the first example of every English word.
+
+        Stale or missing rows are recomputed and written back in a single transaction.
+        """
+        engine_version = self.rule_engine.engine_version
+        query = (
+            Oration.select(
+                Oration.id,
+                Oration.word,
+                Oration.text,
+                OrationAnalysis.text_hash,
+                OrationAnalysis.engine_version,
+                OrationAnalysis.sentence_type,
+                OrationAnalysis.primary_tense,
+                OrationAnalysis.tense_guesses,
+                OrationAnalysis.rule_hits,
+            )
+            .join(Word, on=(Oration.word == Word.id))
+            .switch(Oration)
+            .join(OrationAnalysis, JOIN.LEFT_OUTER, on=(OrationAnalysis.oration == Oration.id))
+            .where(Word.language_id == "en")
+            .order_by(Oration.id.asc())
+            .tuples()
+        )
+
+        summaries: dict[str, ExampleAnalysisSummary] = {}
+        stale_rows = []
+        for (
+            oration_id,
+            word_id,
+            text,
+            text_hash,
+            row_engine_version,
+            sentence_type,
+            primary_tense,
+            tense_guesses,
+            rule_hits,
+        ) in query:
+            if word_id in summaries:
+                continue
+            text = text or ""
+            if text_hash == hash_example_text(text) and row_engine_version == engine_version:
+                summaries[word_id] = ExampleAnalysisSummary(
+                    sentence_type=sentence_type or "",
+                    primary_tense=primary_tense or None,
+                    tense_guesses=json.loads(tense_guesses or "[]"),
+                    rule_hits=json.loads(rule_hits or "[]"),
+                )
+                continue
+            summary = self.summarize(text)
+            summaries[word_id] = summary
+            stale_rows.append(self._summary_row(oration_id, text, summary))
+
+        self._write_rows(stale_rows)
+        return summaries
+
+    def _summary_row(self, oration_id: str, text: str, summary: ExampleAnalysisSummary) -> dict:
+        return {
+            "oration": oration_id,
+            "text_hash": hash_example_text(text),
+            "engine_version": self.rule_engine.engine_version,
+            "sentence_type": summary.sentence_type,
+            "primary_tense": summary.primary_tense or "",
+            "tense_guesses": json.dumps(summary.tense_guesses),
+            "rule_hits": json.dumps(summary.rule_hits),
+        }
+
+    def _write_rows(self, rows: list[dict]) -> None:
+        if not rows:
+            return
+        with db.atomic():
+            # Chunked so a full recompute (e.g. after an engine upgrade) stays under SQLite's variable limit.
+            for chunk in chunked(rows, SUMMARY_WRITE_CHUNK_SIZE):
+                OrationAnalysis.insert_many(chunk).on_conflict_replace().execute()
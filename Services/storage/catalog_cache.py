@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import islice
+
+
+DEFAULT_SUGGESTION_LIMIT = 8
+
+
+@dataclass
+class CatalogWordMatch:
+    english_word: str
+    english_word_normalized: str
+    spanish_translation: str
+    pos_normalized: str
+    source: str
+    source_detail: str = ""
+
+
+class CatalogCache:
+    """
+    In-memory catalog for exact lookups and as-you-type prefix suggestions.
+
+    Dictionary entries are kept as a sorted array of normalized headwords with a parallel
+    list of matches, so both lookups and prefix scans are a binary search. Words from the
+    `word` table only answer for headwords the dictionary lacks, mirroring
+    `VocabularyService.lookup_catalog_word`. Call `invalidate()` after a dictionary import.
+    """
+
+    def __init__(self) -> None:
+        self.loaded = False
+        self._keys: list[str] = []
+        self._matches: list[CatalogWordMatch] = []
+        self._fallback: dict[str, CatalogWordMatch] = {}
+        self._fallback_keys: list[str] = []
+
+    def load(self, dictionary_matches: Iterable[CatalogWordMatch], fallback_matches: Iterable[CatalogWordMatch]) -> None:
+        """Fill the cache; `dictionary_matches` must be sorted by key with the preferred match first."""
+        keys: list[str] = []
+        matches: list[CatalogWordMatch] = []
+        for match in dictionary_matches:
+            if keys and keys[-1] == match.english_word_normalized:
+                continue
+            keys.append(match.english_word_normalized)
+            matches.append(match)
+        self._keys, self._matches = keys, matches
+        self._fallback = {}
+        for match in fallback_matches:
+            self._fallback.setdefault(match.english_word_normalized, match)
+        self._fallback_keys = sorted(self._fallback)
+        self.loaded = True
+
+    def invalidate(self) -> None:
+        self.loaded = False
+        self._keys, self._matches = [], []
+        self._fallback, self._fallback_keys = {}, []
+
+    def set_fallback(self, english_word_normalized: str, match: CatalogWordMatch | None) -> None:
+        """Add, replace or (with `None`) drop the `word`-table match for one headword."""
+        if not self.loaded:
+            return
+        known = english_word_normalized in self._fallback
+        if match is None:
+            if known:
+                # Keys before the dict (and the dict before keys when adding): `suggest` may be
+                # reading on the UI thread while a save worker updates the cache.
+                self._fallback_keys.remove(english_word_normalized)
+                del self._fallback[english_word_normalized]
+            return
+        self._fallback[english_word_normalized] = match
+        if not known:
+            insort(self._fallback_keys, english_word_normalized)
+
+    def _find(self, english_word_normalized: str) -> CatalogWordMatch | None:
+        position = bisect_left(self._keys, english_word_normalized)
+        if position < len(self._keys) and self._keys[position] == english_word_normalized:
+            return self._matches[position]
+        return None
+
+    def get(self, english_word_normalized: str) -> CatalogWordMatch | None:
+        return self._find(english_word_normalized) or self._fallback.get(english_word_normalized)
+
+    def suggest(self, prefix: str, limit: int = DEFAULT_SUGGESTION_LIMIT) -> list[CatalogWordMatch]:
+        """Matches whose normalized headword starts with `prefix`, in key order."""
+        if not prefix or limit <= 0:
+            return []
+        dictionary_keys = islice(self._prefix_range(self._keys, prefix), limit)
+        suggestions = [self._matches[position] for position in dictionary_keys]
+        fallback_keys = (self._fallback_keys[position] for position in self._prefix_range(self._fallback_keys, prefix))
+        unshadowed = (key for key in fallback_keys if self._find(key) is None)
+        suggestions.extend(self._fallback[key] for key in islice(unshadowed, limit))
+        suggestions.sort(key=lambda match: match.english_word_normalized)
+        return suggestions[:limit]
+
+    @staticmethod
+    def _prefix_range(keys: list[str], prefix: str) -> Iterable[int]:
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and keys[position].startswith(prefix):
+            yield position
+            position += 1
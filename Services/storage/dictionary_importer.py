@@ -0,0 +1,412 @@
+"""
+Streaming importer for raw dictionary text (e.g. `pdftotext -layout` output).
+
+Expected layout, one entry per line, optionally followed by example lines:
+
+    work vt-vi trabajar, funcionar
+    • I work every day = Trabajo todos los dias
+    give up vt rendirse
+
+A form feed (`\\f`) starts a new source page. Lines that are neither entries nor examples
+(headers, page numbers, broken columns) are counted and skipped.
+
+Import runs as a pipeline: the source is read in chunks, parsed into row tuples (in
+parser processes when `workers > 1`) and written by a single writer with `executemany`.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import hashlib
+import os
+import re
+import time
+
+from Models.base_model import db
+from Models.dictionary_entry_model import DictionaryEntry
+from Models.dictionary_example_model import DictionaryExample
+from Models.dictionary_import_batch_model import DictionaryImportBatch
+from Services.storage.dictionary_pos_rules import RAW_DICT_POS_TO_NORMALIZED, normalize_dictionary_pos
+
+
+# Source lines per parsed chunk; each chunk is written in one transaction.
+DEFAULT_CHUNK_LINES = 5000
+# Parsed chunks allowed in flight per parser process before the reader waits for the writer.
+QUEUE_CHUNKS_PER_WORKER = 2
+PAGE_BREAK = "\f"
+EXAMPLE_BULLETS = ("•", "*", "~", "-")
+EXAMPLE_SEPARATOR = re.compile(r"\s+(?:=|—|\|)\s+")
+TRANSLATION_SEPARATOR = re.compile(r"\s*[,;]\s*")
+
+
+def normalize_english_key(text: str) -> str:
+    # Lowercase + collapse internal whitespace to make duplicate detection deterministic.
+    return re.sub(r"\s+", " ", text.strip().lower())
+
+
+@dataclass
+class ParsedDictionaryEntry:
+    line_no: int
+    source_page: int
+    raw_line: str
+    headword: str
+    pos_raw: str
+    translation_text: str
+    examples: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def entry_id(self, source_name: str, direction: str) -> str:
+        key = f"{source_name}\0{direction}\0{self.source_page}\0{self.raw_line}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def parse_entry_line(line: str) -> tuple[str, str, str] | None:
+    """Split 'headword pos translations' at the first known POS tag, or return None."""
+    parts = line.split()
+    for position in range(1, len(parts) - 1):
+        pos_raw = parts[position].rstrip(".")
+        if pos_raw.lower() in RAW_DICT_POS_TO_NORMALIZED:
+            return " ".join(parts[:position]), pos_raw, " ".join(parts[position + 1 :])
+    return None
+
+
+def parse_example_line(line: str) -> tuple[str, str] | None:
+    if not line.startswith(EXAMPLE_BULLETS):
+        return None
+    body = line.lstrip("".join(EXAMPLE_BULLETS)).strip()
+    if not body:
+        return None
+    english, *spanish = EXAMPLE_SEPARATOR.split(body, maxsplit=1)
+    return english.strip(), spanish[0].strip() if spanish else ""
+
+
+def iter_dictionary_entries(
+    lines: Iterable[str],
+    first_line_no: int = 0,
+    first_page: int = 1,
+) -> Iterator[ParsedDictionaryEntry | None]:
+    """
+    Yield parsed entries in source order; `None` is yielded once for every skipped line.
+
+    `first_line_no` and `first_page` locate `lines` in the whole source when parsing a chunk.
+    """
+    page = first_page
+    current: ParsedDictionaryEntry | None = None
+    for line_no, line in enumerate(lines, start=first_line_no):
+        if PAGE_BREAK in line:
+            page += line.count(PAGE_BREAK)
+            line = line.replace(PAGE_BREAK, "")
+        line = line.strip()
+        if not line:
+            continue
+
+        example = parse_example_line(line) if current is not None else None
+        if example is not None:
+            current.examples.append((*example, line))
+            continue
+
+        parsed = parse_entry_line(line)
+        if parsed is None:
+            yield None
+            continue
+        if current is not None:
+            yield current
+        headword, pos_raw, translation_text = parsed
+        current = ParsedDictionaryEntry(
+            line_no=line_no,
+            source_page=page,
+            raw_line=line,
+            headword=headword,
+            pos_raw=pos_raw,
+            translation_text=translation_text,
+        )
+    if current is not None:
+        yield current
+
+
+def iter_line_chunks(
+    lines: Iterable[str],
+    start_line: int = 0,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+) -> Iterator[tuple[int, int, list[str]]]:
+    """
+    Group source lines into (first line no, first page, lines) chunks from `start_line` on.
+
+    Chunks are only cut before a line that starts a new entry: examples attach to the
+    previous entry even across noise lines (page headers, page numbers), so cutting
+    anywhere else could separate them. Lines before `start_line` are only scanned for
+    page breaks.
+    """
+    page = 1
+    chunk: list[str] = []
+    chunk_start, chunk_page = start_line, page
+    for line_no, line in enumerate(lines):
+        if line_no < start_line:
+            page += line.count(PAGE_BREAK)
+            continue
+        stripped = line.replace(PAGE_BREAK, "").strip()
+        if (
+            len(chunk) >= chunk_lines
+            and stripped
+            and not stripped.startswith(EXAMPLE_BULLETS)
+            and parse_entry_line(stripped) is not None
+        ):
+            yield chunk_start, chunk_page, chunk
+            chunk, chunk_start, chunk_page = [], line_no, page
+        chunk.append(line)
+        page += line.count(PAGE_BREAK)
+    if chunk:
+        yield chunk_start, chunk_page, chunk
+
+
+ENTRY_COLUMNS = (
+    "id",
+    "source_name",
+    "direction",
+    "import_batch",
+    "source_page",
+    "raw_line",
+    "headword",
+    "headword_normalized",
+    "pos_raw",
+    "pos_normalized",
+    "translation_text",
+    "translation_primary",
+    "status",
+)
+EXAMPLE_COLUMNS = ("id", "entry", "example_text", "example_translation", "raw_text", "source_page")
+
+
+def _insert_sql(model, columns: tuple[str, ...]) -> str:
+    # Model defaults are applied by peewee, not SQLite, so every NOT NULL column must be listed.
+    fields = model._meta.fields
+    missing = [field.name for field in model._meta.sorted_fields if not field.null and field.name not in columns]
+    if missing:
+        raise ValueError(f"Bulk insert into {model._meta.table_name} must set: {', '.join(missing)}")
+    names = ", ".join(fields[column].column_name for column in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    # OR IGNORE: entry ids are derived from the uniqueness key, so re-imported lines are no-ops.
+    return f"INSERT OR IGNORE INTO {model._meta.table_name} ({names}) VALUES ({placeholders})"
+
+
+@dataclass
+class ParsedChunk:
+    end_line: int
+    skipped_lines: int
+    entry_rows: list[tuple]
+    example_rows: list[tuple]
+
+
+def parse_chunk(
+    first_line_no: int,
+    first_page: int,
+    lines: list[str],
+    source_name: str,
+    direction: str,
+    import_batch: str,
+) -> ParsedChunk:
+    """Parse one chunk into row tuples (ENTRY_COLUMNS / EXAMPLE_COLUMNS order). Runs in parser processes."""
+    entry_rows: list[tuple] = []
+    example_rows: list[tuple] = []
+    skipped = 0
+    for parsed in iter_dictionary_entries(lines, first_line_no, first_page):
+        if parsed is None:
+            skipped += 1
+            continue
+        entry_id = parsed.entry_id(source_name, direction)
+        translations = [t for t in TRANSLATION_SEPARATOR.split(parsed.translation_text) if t]
+        entry_rows.append(
+            (
+                entry_id,
+                source_name,
+                direction,
+                import_batch,
+                parsed.source_page,
+                parsed.raw_line,
+                parsed.headword,
+                normalize_english_key(parsed.headword),
+                parsed.pos_raw,
+                normalize_dictionary_pos(parsed.pos_raw),
+                parsed.translation_text,
+                translations[0] if translations else "",
+                "raw",
+            )
+        )
+        for position, (example_text, example_translation, raw_text) in enumerate(parsed.examples):
+            example_rows.append(
+                (f"{entry_id}:{position}", entry_id, example_text, example_translation, raw_text, parsed.source_page)
+            )
+    return ParsedChunk(first_line_no + len(lines), skipped, entry_rows, example_rows)
+
+
+@dataclass
+class DictionaryImportReport:
+    import_batch: str
+    entries: int = 0
+    examples: int = 0
+    skipped_lines: int = 0
+    resumed_from_line: int = 0
+    elapsed_seconds: float = 0.0
+    finished: bool = False
+
+    @property
+    def rows(self) -> int:
+        return self.entries + self.examples
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class DictionaryImporter:
+    """
+    Imports raw dictionary lines into `DictionaryEntry`/`DictionaryExample`.
+
+    The source is cut into chunks of about `chunk_lines` lines. With `workers > 1`, chunks
+    are parsed by a process pool while this process stays the only writer, committing
+    chunks in source order; at most `workers * QUEUE_CHUNKS_PER_WORKER` parsed chunks are
+    held in memory. Every chunk is written with `executemany` in one transaction together
+    with the batch's progress row, so an interrupted import resumes after the last
+    committed chunk.
+    """
+
+    def __init__(
+        self,
+        source_name: str = "superdiccionario",
+        direction: str = "en_es",
+        chunk_lines: int = DEFAULT_CHUNK_LINES,
+        workers: int = 1,
+    ) -> None:
+        self.source_name = source_name
+        self.direction = direction
+        self.chunk_lines = max(1, chunk_lines)
+        self.workers = max(1, workers)
+        self._entry_sql = _insert_sql(DictionaryEntry, ENTRY_COLUMNS)
+        self._example_sql = _insert_sql(DictionaryExample, EXAMPLE_COLUMNS)
+
+    def import_file(
+        self,
+        path: str,
+        import_batch: str,
+        progress: Callable[[DictionaryImportReport], None] | None = None,
+    ) -> DictionaryImportReport:
+        with open(path, encoding="utf-8", errors="replace", newline="") as handle:
+            return self.import_lines(handle, import_batch, source_path=path, progress=progress)
+
+    def import_lines(
+        self,
+        lines: Iterable[str],
+        import_batch: str,
+        source_path: str = "",
+        progress: Callable[[DictionaryImportReport], None] | None = None,
+    ) -> DictionaryImportReport:
+        state, _ = DictionaryImportBatch.get_or_create(
+            id=import_batch,
+            defaults={"source_name": self.source_name, "direction": self.direction, "source_path": source_path},
+        )
+        report = DictionaryImportReport(import_batch=import_batch, resumed_from_line=state.lines_done)
+        if state.status == "done":
+            report.finished = True
+            return report
+
+        started = time.perf_counter()
+        chunks = iter_line_chunks(lines, state.lines_done, self.chunk_lines)
+        with self._load_pragmas():
+            for parsed in self._parse_chunks(chunks, import_batch):
+                self._write_chunk(state, parsed, report)
+                report.elapsed_seconds = time.perf_counter() - started
+                if progress is not None:
+                    progress(report)
+
+            state.status = "done"
+            state.save()
+        report.elapsed_seconds = time.perf_counter() - started
+        report.finished = True
+        return report
+
+    def _parse_chunks(self, chunks: Iterator[tuple[int, int, list[str]]], import_batch: str) -> Iterator[ParsedChunk]:
+        args = (self.source_name, self.direction, import_batch)
+        if self.workers <= 1:
+            for first_line_no, first_page, lines in chunks:
+                yield parse_chunk(first_line_no, first_page, lines, *args)
+            return
+
+        # Bounded, ordered hand-off: the reader only runs ahead while the queue has room.
+        in_flight: deque[Future[ParsedChunk]] = deque()
+        max_in_flight = self.workers * QUEUE_CHUNKS_PER_WORKER
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for first_line_no, first_page, lines in chunks:
+                in_flight.append(pool.submit(parse_chunk, first_line_no, first_page, lines, *args))
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    @contextmanager
+    def _load_pragmas(self) -> Iterator[None]:
+        # Bulk-load setting for the writer connection (already in WAL mode, see
+        # Models.connection_profile); the profile's durability is restored afterwards.
+        synchronous = db.execute_sql("PRAGMA synchronous").fetchone()[0]
+        db.execute_sql("PRAGMA synchronous = OFF")
+        try:
+            yield
+        finally:
+            db.execute_sql(f"PRAGMA synchronous = {int(synchronous)}")
+
+    def _write_chunk(self, state: DictionaryImportBatch, parsed: ParsedChunk, report: DictionaryImportReport) -> None:
+        with db.atomic():
+            connection = db.connection()
+            # Counted from total_changes: OR IGNORE skips rows that are already stored.
+            changes = connection.total_changes
+            connection.executemany(self._entry_sql, parsed.entry_rows)
+            entries = connection.total_changes - changes
+            changes = connection.total_changes
+            connection.executemany(self._example_sql, parsed.example_rows)
+            examples = connection.total_changes - changes
+            state.lines_done = parsed.end_line
+            state.entries_written += entries
+            state.examples_written += examples
+            state.save()
+
+        report.entries += entries
+        report.examples += examples
+        report.skipped_lines += parsed.skipped_lines
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from Services.storage.vocabulary_service import VocabularyService
+
+    parser = argparse.ArgumentParser(description="Import a raw dictionary text dump into DictionaryEntry.")
+    parser.add_argument("path")
+    parser.add_argument("--batch", required=True, help="import_batch name; re-running the same batch resumes it")
+    parser.add_argument("--source-name", default="superdiccionario")
+    parser.add_argument("--direction", default="en_es")
+    parser.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="parser processes")
+    args = parser.parse_args()
+
+    service = VocabularyService()
+    service.initialize_database()
+
+    def print_progress(report: DictionaryImportReport) -> None:
+        print(f"{report.rows} rows ({report.entries} entries, {report.examples} examples), {report.rows_per_second:.0f} rows/s")
+
+    result = service.import_dictionary_file(
+        args.path,
+        args.batch,
+        workers=args.workers,
+        progress=print_progress,
+        source_name=args.source_name,
+        direction=args.direction,
+        chunk_lines=args.chunk_lines,
+    )
+    print(
+        f"Batch '{result.import_batch}' done from line {result.resumed_from_line}: "
+        f"{result.rows} rows, {result.skipped_lines} skipped lines, {result.rows_per_second:.0f} rows/s"
+    )
+    service.close_database()
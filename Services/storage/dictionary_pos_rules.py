@@ -36,6 +36,11 @@ RAW_DICT_POS_TO_NORMALIZED = {
 }
 
 
+def normalize_dictionary_pos(pos_raw: str) -> str:
+    """Map a raw dictionary POS tag ('vt', 'adj.', 'N') to its normalized class, or 'unknown'."""
+    return RAW_DICT_POS_TO_NORMALIZED.get((pos_raw or "").strip().lower().rstrip("."), "unknown")
+
+
 DICT_POS_RULE_EXPLANATIONS = [
     ("n", "noun", "Sustantivo", "Se guarda en WordClass 'noun'."),
     ("adj", "adjective", "Adjetivo", "Se guarda en WordClass 'adjective'."),
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Services.storage.vocabulary_service import VocabularyEntry
+
+
+# Stale heap entries tolerated (beyond one per word) before the queue is rebuilt.
+QUEUE_SLACK = 64
+
+
+@dataclass
+class GameRound:
+    entry: VocabularyEntry
+    tense_label: str
+    primary_tense: str
+
+
+def game_tense_label(primary_tense: str | None) -> str | None:
+    """Answer expected in the game ("presente" / "pasado" / "futuro") for an analyzer tense."""
+    if not primary_tense:
+        return None
+    if primary_tense.startswith("present"):
+        return "presente"
+    if primary_tense.startswith("past"):
+        return "pasado"
+    if primary_tense.startswith("future"):
+        return "futuro"
+    return None
+
+
+def make_game_round(entry: VocabularyEntry, primary_tense: str | None) -> GameRound | None:
+    """The round for `entry`, or `None` when it lacks a field or a recognizable tense."""
+    if not entry.english_word or not entry.spanish_meaning or not entry.example_english:
+        return None
+    tense_label = game_tense_label(primary_tense)
+    if tense_label is None:
+        return None
+    return GameRound(entry=entry, tense_label=tense_label, primary_tense=primary_tense)
+
+
+class GameRoundPool:
+    """
+    Playable game rounds keyed by word id, served in spaced-repetition order.
+
+    Each word has a due time (its `ReviewState.due_at`, or the time it joined the pool
+    if it was never reviewed) kept in a min-heap. Rescheduling pushes a new heap entry
+    and the superseded one is dropped lazily when it reaches the top, so both picking
+    the next round and recording an answer are O(log n).
+
+    The pool is filled once from `VocabularyService.list_game_rounds` (typically off the
+    UI thread) and then kept current by the create/update paths. Updates that arrive
+    before `load()` are replayed over the loaded rounds, since that snapshot may have
+    been read before them. Saves run on worker threads, so mutations take a lock.
+    """
+
+    def __init__(self) -> None:
+        self.loaded = False
+        self._rounds: dict[str, GameRound] = {}
+        self._due: dict[str, float] = {}
+        self._queue: list[tuple[float, str]] = []
+        self._pending: dict[str, GameRound | None] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._rounds)
+
+    def load(self, rounds: list[GameRound], due_by_word: dict[str, float], now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            self._rounds = {game_round.entry.word_id: game_round for game_round in rounds}
+            self._due = {word_id: due_by_word.get(word_id, now) for word_id in self._rounds}
+            self._rebuild_queue()
+            pending, self._pending = self._pending, {}
+            self.loaded = True
+            for word_id, game_round in pending.items():
+                self._put(word_id, game_round, now)
+
+    def update(self, entry: VocabularyEntry, primary_tense: str | None, now: float | None = None) -> None:
+        """Add, replace or drop the round for a saved entry."""
+        game_round = make_game_round(entry, primary_tense)
+        with self._lock:
+            if not self.loaded:
+                self._pending[entry.word_id] = game_round
+                return
+            self._put(entry.word_id, game_round, time.time() if now is None else now)
+
+    def reschedule(self, word_id: str, due_at: float) -> None:
+        with self._lock:
+            if word_id not in self._rounds:
+                return
+            self._due[word_id] = due_at
+            heapq.heappush(self._queue, (due_at, word_id))
+            if len(self._queue) > 2 * len(self._due) + QUEUE_SLACK:
+                self._rebuild_queue()
+
+    def get(self, word_id: str) -> GameRound | None:
+        return self._rounds.get(word_id)
+
+    def due_at(self, word_id: str) -> float | None:
+        return self._due.get(word_id)
+
+    def next_round(self, skip_word_id: str | None = None) -> GameRound | None:
+        """The round due first, or the one after it when that is `skip_word_id`."""
+        with self._lock:
+            head = self._peek()
+            if head is None or head[1] != skip_word_id:
+                return self._rounds[head[1]] if head is not None else None
+            held = heapq.heappop(self._queue)
+            following = self._peek()
+            heapq.heappush(self._queue, held)
+            return self._rounds[(following or held)[1]]
+
+    def _peek(self) -> tuple[float, str] | None:
+        while self._queue:
+            due_at, word_id = self._queue[0]
+            if self._due.get(word_id) == due_at:
+                return self._queue[0]
+            heapq.heappop(self._queue)
+        return None
+
+    def _put(self, word_id: str, game_round: GameRound | None, now: float) -> None:
+        if game_round is None:
+            self._rounds.pop(word_id, None)
+            self._due.pop(word_id, None)
+            return
+        is_new = word_id not in self._rounds
+        self._rounds[word_id] = game_round
+        if is_new:
+            self.reschedule(word_id, now)
+
+    def _rebuild_queue(self) -> None:
+        self._queue = [(due_at, word_id) for word_id, due_at in self._due.items()]
+        heapq.heapify(self._queue)
@@ -0,0 +1,70 @@
+"""
+SM-2 spaced-repetition scheduling for the game.
+
+A correct answer grows the review interval (1 day, 6 days, then interval * ease); a miss
+resets it and brings the word back after a short relearning delay. The ease factor moves
+with the answer quality and never drops below `MIN_EASE`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+SECONDS_PER_DAY = 24 * 60 * 60
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+RELEARN_DELAY_SECONDS = 10 * 60
+FIRST_INTERVAL_DAYS = 1.0
+SECOND_INTERVAL_DAYS = 6.0
+
+# SM-2 answer quality (0-5); anything below PASSING_QUALITY counts as a lapse.
+PASSING_QUALITY = 3
+
+
+@dataclass
+class ReviewSchedule:
+    due_at: float
+    interval_days: float = 0.0
+    ease: float = DEFAULT_EASE
+    repetitions: int = 0
+    lapses: int = 0
+
+
+def game_answer_quality(translation_ok: bool, tense_ok: bool) -> int:
+    """Both parts right is a pass; one right is a near miss; none right is a blackout."""
+    if translation_ok and tense_ok:
+        return 4
+    if translation_ok or tense_ok:
+        return 2
+    return 0
+
+
+def next_review_schedule(previous: ReviewSchedule | None, quality: int, now: float) -> ReviewSchedule:
+    previous = previous or ReviewSchedule(due_at=now)
+    repetitions = previous.repetitions
+    lapses = previous.lapses
+    if quality >= PASSING_QUALITY:
+        if repetitions == 0:
+            interval_days = FIRST_INTERVAL_DAYS
+        elif repetitions == 1:
+            interval_days = SECOND_INTERVAL_DAYS
+        else:
+            interval_days = previous.interval_days * previous.ease
+        repetitions += 1
+        due_at = now + interval_days * SECONDS_PER_DAY
+    else:
+        interval_days = 0.0
+        repetitions = 0
+        lapses += 1
+        due_at = now + RELEARN_DELAY_SECONDS
+
+    miss = 5 - quality
+    ease = max(MIN_EASE, previous.ease + 0.1 - miss * (0.08 + miss * 0.02))
+    return ReviewSchedule(
+        due_at=due_at,
+        interval_days=interval_days,
+        ease=ease,
+        repetitions=repetitions,
+        lapses=lapses,
+    )
@@ -1,18 +1,30 @@
-from dataclasses import dataclass
-import re
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+import threading
+import time
 from uuid import uuid4
 
-from peewee import JOIN, IntegrityError
+from peewee import JOIN, IntegrityError, Tuple, fn
 
 from Models.base_model import db
 from Models.dictionary_entry_model import DictionaryEntry
 from Models.dictionary_example_model import DictionaryExample
+from Models.dictionary_import_batch_model import DictionaryImportBatch
 from Models.language import Language
+from Models.oration_analysis_model import OrationAnalysis
 from Models.oration_model import Oration
+from Models.review_state_model import ReviewState
 from Models.word_class_model import WordClass
 from Models.word_model import Word
-from Services.storage.dictionary_pos_rules import POS_TO_WORD_CLASS, RAW_DICT_POS_TO_NORMALIZED
+from Services.storage.analysis_store import ExampleAnalysisStore, ExampleAnalysisSummary
+from Services.storage.catalog_cache import DEFAULT_SUGGESTION_LIMIT, CatalogCache, CatalogWordMatch
+from Services.storage.dictionary_importer import DictionaryImporter, DictionaryImportReport, normalize_english_key
+from Services.storage.dictionary_pos_rules import POS_TO_WORD_CLASS, normalize_dictionary_pos
+from Services.storage.game_round_pool import GameRound, GameRoundPool, make_game_round
+from Services.storage.review_scheduler import ReviewSchedule, game_answer_quality, next_review_schedule
+from Services.validation.dictionary_lexicon_support import WORD_CHANGE_LOG_TABLE
 from Services.validation.rule_engine import RuleEngine
+from Services.validation.validation_result import ValidationResult
 
 
 @dataclass
@@ -24,22 +36,18 @@ class VocabularyEntry:
     example_spanish: str
 
 
-@dataclass
-class CatalogWordMatch:
-    english_word: str
-    english_word_normalized: str
-    spanish_translation: str
-    pos_normalized: str
-    source: str
-    source_detail: str = ""
-
-
 class InvalidEnglishExampleError(ValueError):
     def __init__(self, validation_result) -> None:
         super().__init__("The English example sentence is not valid.")
         self.validation_result = validation_result
 
 
+class SaveCancelledError(Exception):
+    """Raised when a save's `is_cancelled` callback reports it was superseded before writing."""
+
+
+VOCABULARY_PAGE_SIZE = 200
+
 BLOCKING_WARNING_RULE_IDS = {
     "en.question_auxiliary",
     "en.present_simple_structure",
@@ -85,21 +93,32 @@ BLOCKING_WARNING_RULE_IDS = {
 }
 
 
-def normalize_english_key(text: str) -> str:
-    # Lowercase + collapse internal whitespace to make duplicate detection deterministic.
-    return re.sub(r"\s+", " ", text.strip().lower())
-
-
 class VocabularyService:
     def __init__(self) -> None:
-        self.rule_engine = RuleEngine()
+        # Read the dictionary lexicon from the same database the models use.
+        self.rule_engine = RuleEngine(db_path=db.database or "app.db")
+        self.analysis_store = ExampleAnalysisStore(self.rule_engine)
+        self.catalog_cache = CatalogCache()
+        # The catalog is loaded on a worker thread while saves may update it.
+        self._catalog_lock = threading.Lock()
+        self.game_round_pool = GameRoundPool()
 
     def initialize_database(self) -> None:
         if db.is_closed():
             db.connect()
 
         db.create_tables(
-            [Language, WordClass, Word, Oration, DictionaryEntry, DictionaryExample],
+            [
+                Language,
+                WordClass,
+                Word,
+                Oration,
+                OrationAnalysis,
+                DictionaryEntry,
+                DictionaryExample,
+                DictionaryImportBatch,
+                ReviewState,
+            ],
             safe=True,
         )
         self._ensure_schema_updates()
@@ -145,6 +164,22 @@ class VocabularyService:
             "WHERE word_normalized IS NULL OR word_normalized = ''"
         )
 
+        # Log edits to existing words so the rule engine can refresh its lexicon incrementally
+        # (new rows are picked up by rowid). Created after the backfill above on purpose.
+        db.execute_sql(
+            f"CREATE TABLE IF NOT EXISTS {WORD_CHANGE_LOG_TABLE} "
+            "(seq INTEGER PRIMARY KEY AUTOINCREMENT, word_rowid INTEGER NOT NULL)"
+        )
+        db.execute_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {WORD_CHANGE_LOG_TABLE}_update AFTER UPDATE ON {table_name} "
+            f"BEGIN INSERT INTO {WORD_CHANGE_LOG_TABLE} (word_rowid) VALUES (NEW.rowid); END"
+        )
+
+        # Keyset pagination of the vocabulary listing walks (word, id) in index order.
+        db.execute_sql(
+            f"CREATE INDEX IF NOT EXISTS word_language_listing ON {table_name} (language_id, word, id)"
+        )
+
         # Enforce uniqueness at DB level (best effort on existing DBs).
         try:
             db.execute_sql(
@@ -153,7 +188,11 @@ class VocabularyService:
             )
         except IntegrityError:
             # Existing duplicated rows can prevent index creation; app-level validation still runs.
-            pass
+            # Keep the lookups on (language_id, word_normalized) indexed anyway.
+            db.execute_sql(
+                f"CREATE INDEX IF NOT EXISTS word_language_normalized "
+                f"ON {table_name} (language_id, word_normalized)"
+            )
 
     def _has_blocking_warnings(self, validation_result) -> bool:
         return any(issue.rule_id in BLOCKING_WARNING_RULE_IDS for issue in validation_result.warnings)
@@ -162,60 +201,151 @@ class VocabularyService:
         pos_normalized = (pos_normalized or "").strip().lower()
         if pos_normalized:
             return pos_normalized
-        return RAW_DICT_POS_TO_NORMALIZED.get((pos_raw or "").strip().lower(), "unknown")
-
-    def lookup_catalog_word(self, english_word: str) -> CatalogWordMatch | None:
-        english_word_normalized = normalize_english_key(english_word)
-        if not english_word_normalized:
-            return None
+        return normalize_dictionary_pos(pos_raw)
 
-        entry = (
-            DictionaryEntry.select()
-            .where(
-                (DictionaryEntry.direction == "en_es")
-                & (DictionaryEntry.headword_normalized == english_word_normalized)
+    def _catalog_entry_query(self, english_word_normalized: str | None = None):
+        # Only columns carried by the `dictionaryentry_catalog_lookup` covering index, in its
+        # order, so loading the whole catalog is a single index scan without a sort and a
+        # single headword is one index search.
+        query = (
+            DictionaryEntry.select(
+                DictionaryEntry.headword_normalized,
+                DictionaryEntry.headword,
+                DictionaryEntry.translation_primary,
+                DictionaryEntry.translation_text,
+                DictionaryEntry.pos_normalized,
+                DictionaryEntry.pos_raw,
+                DictionaryEntry.source_page,
             )
+            .where(DictionaryEntry.direction == "en_es")
             .order_by(
+                DictionaryEntry.headword_normalized.asc(),
                 DictionaryEntry.translation_primary.desc(),
                 DictionaryEntry.source_page.asc(),
             )
-            .first()
         )
-        if entry is not None:
-            translation = (entry.translation_primary or entry.translation_text or "").strip()
-            return CatalogWordMatch(
-                english_word=entry.headword or english_word.strip(),
-                english_word_normalized=english_word_normalized,
-                spanish_translation=translation,
-                pos_normalized=self._normalize_catalog_pos(entry.pos_normalized, entry.pos_raw),
-                source="dictionaryentry",
-                source_detail=f"page {entry.source_page}" if entry.source_page else "",
-            )
+        if english_word_normalized is not None:
+            query = query.where(DictionaryEntry.headword_normalized == english_word_normalized)
+        return query
+
+    def _catalog_word_query(self, english_word_normalized: str):
+        # Served by the (language_id, word_normalized) index from _ensure_schema_updates.
+        return Word.select(Word.word, Word.word_normalized, Word.traduction, Word.word_class).where(
+            (Word.language_id == "en") & (Word.word_normalized == english_word_normalized)
+        )
 
-        # Fallback de compatibilidad: si el catalogo nuevo esta vacio pero cargaron el PDF en `word`.
-        fallback = (
-            Word.select()
-            .where((Word.language_id == "en") & (Word.word_normalized == english_word_normalized))
-            .first()
+    def _catalog_match_from_entry(self, entry) -> CatalogWordMatch:
+        return CatalogWordMatch(
+            english_word=entry.headword,
+            english_word_normalized=entry.headword_normalized,
+            spanish_translation=(entry.translation_primary or entry.translation_text or "").strip(),
+            pos_normalized=self._normalize_catalog_pos(entry.pos_normalized, entry.pos_raw),
+            source="dictionaryentry",
+            source_detail=f"page {entry.source_page}" if entry.source_page else "",
         )
-        if fallback is None:
-            return None
+
+    def _catalog_match_from_word(self, word) -> CatalogWordMatch:
+        # Fallback de compatibilidad: si el catalogo nuevo esta vacio pero cargaron el PDF en `word`.
         return CatalogWordMatch(
-            english_word=fallback.word,
-            english_word_normalized=english_word_normalized,
-            spanish_translation=(fallback.traduction or "").strip(),
-            pos_normalized=(fallback.word_class_id or "unknown").strip().lower() or "unknown",
+            english_word=word.word,
+            english_word_normalized=word.word_normalized,
+            spanish_translation=(word.traduction or "").strip(),
+            pos_normalized=(word.word_class_id or "unknown").strip().lower() or "unknown",
             source="word_fallback",
             source_detail="catalogo temporal desde tabla word",
         )
 
+    def load_catalog_cache(self) -> CatalogCache:
+        """
+        Load the whole catalog into memory unless it already is.
+
+        This reads every dictionary entry, so interactive callers run it on a worker
+        thread; suggestions stay empty until it has finished.
+        """
+        if self.catalog_cache.loaded:
+            return self.catalog_cache
+        with self._catalog_lock:
+            if not self.catalog_cache.loaded:
+                fallback_words = Word.select(Word.word, Word.word_normalized, Word.traduction, Word.word_class).where(
+                    Word.language_id == "en"
+                )
+                self.catalog_cache.load(
+                    (self._catalog_match_from_entry(entry) for entry in self._catalog_entry_query().iterator()),
+                    (self._catalog_match_from_word(word) for word in fallback_words.iterator()),
+                )
+        return self.catalog_cache
+
+    def invalidate_catalog_cache(self) -> None:
+        with self._catalog_lock:
+            self.catalog_cache.invalidate()
+
+    def _set_catalog_fallback(self, english_word_normalized: str, match: CatalogWordMatch | None) -> None:
+        # Waits for a load in progress, which may have read `word` before this save.
+        with self._catalog_lock:
+            self.catalog_cache.set_fallback(english_word_normalized, match)
+
+    def lookup_catalog_word(self, english_word: str) -> CatalogWordMatch | None:
+        english_word_normalized = normalize_english_key(english_word)
+        if not english_word_normalized:
+            return None
+
+        if self.catalog_cache.loaded:
+            match = self.catalog_cache.get(english_word_normalized)
+        else:
+            # Cold cache (first save, or after an import): two index searches instead of
+            # loading the whole catalog just to answer one headword.
+            entry = self._catalog_entry_query(english_word_normalized).first()
+            if entry is not None:
+                match = self._catalog_match_from_entry(entry)
+            else:
+                word = self._catalog_word_query(english_word_normalized).first()
+                match = self._catalog_match_from_word(word) if word is not None else None
+        if match is not None and not match.english_word:
+            match = replace(match, english_word=english_word.strip())
+        return match
+
+    def suggest_catalog_words(self, prefix: str, limit: int = DEFAULT_SUGGESTION_LIMIT) -> list[CatalogWordMatch]:
+        """
+        Catalog matches whose headword starts with `prefix`, for live completion.
+
+        Served from memory only: returns nothing until `load_catalog_cache` has run, so
+        typing never waits for the catalog to load.
+        """
+        prefix = normalize_english_key(prefix)
+        if not prefix or not self.catalog_cache.loaded:
+            return []
+        return self.catalog_cache.suggest(prefix, limit)
+
+    def import_dictionary_file(
+        self,
+        path: str,
+        import_batch: str,
+        workers: int = 1,
+        progress=None,
+        **importer_options,
+    ) -> DictionaryImportReport:
+        importer = DictionaryImporter(workers=workers, **importer_options)
+        try:
+            return importer.import_file(path, import_batch, progress=progress)
+        finally:
+            # Also after a partial import: committed chunks are already visible.
+            self.invalidate_catalog_cache()
+
+    @staticmethod
+    def _raise_if_cancelled(is_cancelled: Callable[[], bool] | None) -> None:
+        # Also checked right after BEGIN IMMEDIATE: once a save holds the write lock, any save
+        # that supersedes it can only commit after it, so older values never win.
+        if is_cancelled is not None and is_cancelled():
+            raise SaveCancelledError()
+
     def create_vocabulary_entry(
         self,
         english_word: str,
         spanish_meaning: str,
         example_english: str,
         example_spanish: str,
-    ):
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> tuple[VocabularyEntry, ValidationResult]:
         english_word = english_word.strip()
         english_word_normalized = normalize_english_key(english_word)
         spanish_meaning = spanish_meaning.strip()
@@ -245,6 +375,9 @@ class VocabularyService:
 
         if english_validation.errors or self._has_blocking_warnings(english_validation):
             raise InvalidEnglishExampleError(english_validation)
+        # Validation (and the first lexicon load) is the slow part; a caller that has since
+        # been superseded can still back out here, before anything is written.
+        self._raise_if_cancelled(is_cancelled)
 
         english_language = Language.get(Language.id == "en")
         word_class_id = "unknown"
@@ -252,7 +385,8 @@ class VocabularyService:
             word_class_id = POS_TO_WORD_CLASS[catalog_match.pos_normalized][0]
         selected_word_class = WordClass.get(WordClass.id == word_class_id)
 
-        with db.atomic():
+        with db.atomic("IMMEDIATE"):
+            self._raise_if_cancelled(is_cancelled)
             word = Word.create(
                 id=uuid4().hex,
                 word=english_word,
@@ -262,14 +396,19 @@ class VocabularyService:
                 traduction=spanish_meaning,
             )
 
-            Oration.create(
+            example = Oration.create(
                 id=uuid4().hex,
                 word=word,
                 text=example_english,
                 traduction=example_spanish,
             )
+            summary = self.analysis_store.save(example.id, example_english, english_validation)
 
-        return word, english_validation
+        self.rule_engine.refresh_dictionary_lexicon()
+        self._set_catalog_fallback(english_word_normalized, self._catalog_match_from_word(word))
+        entry = self._vocabulary_entry_from_rows(word, example)
+        self.game_round_pool.update(entry, summary.primary_tense)
+        return entry, english_validation
 
     def update_vocabulary_entry(
         self,
@@ -278,7 +417,8 @@ class VocabularyService:
         spanish_meaning: str,
         example_english: str,
         example_spanish: str,
-    ):
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> tuple[VocabularyEntry, ValidationResult]:
         english_word = english_word.strip()
         english_word_normalized = normalize_english_key(english_word)
         spanish_meaning = spanish_meaning.strip()
@@ -317,12 +457,15 @@ class VocabularyService:
         english_validation = self.rule_engine.validate_sentence(example_english, language="english")
         if english_validation.errors or self._has_blocking_warnings(english_validation):
             raise InvalidEnglishExampleError(english_validation)
+        self._raise_if_cancelled(is_cancelled)
 
         word_class_id = word.word_class_id or "unknown"
         if catalog_match is not None and catalog_match.pos_normalized in POS_TO_WORD_CLASS:
             word_class_id = POS_TO_WORD_CLASS[catalog_match.pos_normalized][0]
 
-        with db.atomic():
+        previous_word_normalized = word.word_normalized
+        with db.atomic("IMMEDIATE"):
+            self._raise_if_cancelled(is_cancelled)
             word.word = english_word
             word.word_normalized = english_word_normalized
             word.traduction = spanish_meaning
@@ -337,7 +480,7 @@ class VocabularyService:
                 .first()
             )
             if example is None:
-                Oration.create(
+                example = Oration.create(
                     id=uuid4().hex,
                     word=word,
                     text=example_english,
@@ -347,27 +490,126 @@ class VocabularyService:
                 example.text = example_english
                 example.traduction = example_spanish
                 example.save()
-
-        return word, english_validation
-
-    def list_vocabulary_entries(self) -> list[VocabularyEntry]:
-        query = (
-            Word.select(Word, Oration)
-            .join(Oration, JOIN.LEFT_OUTER)
+            summary = self.analysis_store.save(example.id, example_english, english_validation)
+
+        self.rule_engine.refresh_dictionary_lexicon()
+        if previous_word_normalized != english_word_normalized:
+            self._set_catalog_fallback(previous_word_normalized, None)
+        self._set_catalog_fallback(english_word_normalized, self._catalog_match_from_word(word))
+        entry = self._vocabulary_entry_from_rows(word, example)
+        self.game_round_pool.update(entry, summary.primary_tense)
+        return entry, english_validation
+
+    def get_example_analysis_summaries(self) -> dict[str, ExampleAnalysisSummary]:
+        # Keyed by word id; only examples whose text or engine version changed get re-analyzed.
+        return self.analysis_store.summaries_by_word()
+
+    def list_game_rounds(self) -> list[GameRound]:
+        """
+        Every playable game round, read fresh from the database.
+
+        Meant to fill `game_round_pool` from a worker thread; peewee gives that thread its
+        own connection, which the caller should close when done.
+        """
+        summaries = self.get_example_analysis_summaries()
+        rounds = []
+        for entry in self.list_vocabulary_entries():
+            summary = summaries.get(entry.word_id)
+            game_round = make_game_round(entry, summary.primary_tense if summary is not None else None)
+            if game_round is not None:
+                rounds.append(game_round)
+        return rounds
+
+    def list_review_due_dates(self) -> dict[str, float]:
+        # Read in due order, which SQLite serves from the reviewstate_due covering index.
+        query = ReviewState.select(ReviewState.word, ReviewState.due_at).order_by(ReviewState.due_at).tuples()
+        return {word_id: due_at for word_id, due_at in query}
+
+    def record_game_review(
+        self,
+        word_id: str,
+        translation_ok: bool,
+        tense_ok: bool,
+        now: float | None = None,
+    ) -> ReviewSchedule:
+        """Reschedule a word after a game answer and move it in `game_round_pool`'s queue."""
+        now = time.time() if now is None else now
+        state = ReviewState.get_or_none(ReviewState.word == word_id)
+        previous = None
+        if state is not None:
+            previous = ReviewSchedule(
+                due_at=state.due_at,
+                interval_days=state.interval_days,
+                ease=state.ease,
+                repetitions=state.repetitions,
+                lapses=state.lapses,
+            )
+        schedule = next_review_schedule(previous, game_answer_quality(translation_ok, tense_ok), now)
+        ReviewState.insert(
+            word=word_id,
+            due_at=schedule.due_at,
+            interval_days=schedule.interval_days,
+            ease=schedule.ease,
+            repetitions=schedule.repetitions,
+            lapses=schedule.lapses,
+            last_reviewed_at=now,
+        ).on_conflict_replace().execute()
+        self.game_round_pool.reschedule(word_id, schedule.due_at)
+        return schedule
+
+    def _vocabulary_entries_query(self):
+        # Each word joined to its first example (lowest Oration.id, the same one
+        # update_vocabulary_entry edits and the analysis summaries use). The correlated
+        # MIN() is one index probe per word, so a page only touches its own rows.
+        example = Oration.alias("example")
+        first_example_id = Oration.select(fn.MIN(Oration.id)).where(Oration.word == Word.id)
+        return (
+            Word.select(Word.id, Word.word, Word.traduction, example.text, example.traduction)
+            .join(example, JOIN.LEFT_OUTER, on=(example.id == first_example_id))
             .where(Word.language_id == "en")
-            .order_by(Word.word.asc())
+            .order_by(Word.word.asc(), Word.id.asc())
+            .tuples()
         )
 
-        entries: list[VocabularyEntry] = []
-        for word in query:
-            example = word.orations.first()
-            entries.append(
-                VocabularyEntry(
-                    word_id=word.id,
-                    english_word=word.word,
-                    spanish_meaning=word.traduction,
-                    example_english=example.text if example else "",
-                    example_spanish=example.traduction if example else "",
-                )
+    @staticmethod
+    def _vocabulary_entries_from_rows(rows) -> list[VocabularyEntry]:
+        return [
+            VocabularyEntry(
+                word_id=word_id,
+                english_word=english_word,
+                spanish_meaning=spanish_meaning,
+                example_english=example_english or "",
+                example_spanish=example_spanish or "",
             )
-        return entries
+            for word_id, english_word, spanish_meaning, example_english, example_spanish in rows
+        ]
+
+    @staticmethod
+    def _vocabulary_entry_from_rows(word: Word, example: Oration) -> VocabularyEntry:
+        # What the listing would now return for `word`, without querying it back.
+        return VocabularyEntry(
+            word_id=word.id,
+            english_word=word.word,
+            spanish_meaning=word.traduction,
+            example_english=example.text,
+            example_spanish=example.traduction,
+        )
+
+    def list_vocabulary_entries(self) -> list[VocabularyEntry]:
+        # One query returning flat tuples; see _vocabulary_entries_query.
+        return self._vocabulary_entries_from_rows(self._vocabulary_entries_query())
+
+    def list_vocabulary_page(
+        self,
+        after: VocabularyEntry | None = None,
+        limit: int = VOCABULARY_PAGE_SIZE,
+    ) -> list[VocabularyEntry]:
+        """Next `limit` entries in listing order (word, id) after `after` (keyset pagination)."""
+        query = self._vocabulary_entries_query()
+        if after is not None:
+            query = query.where(Tuple(Word.word, Word.id) > (after.english_word, after.word_id))
+        return self._vocabulary_entries_from_rows(query.limit(limit))
+
+    def get_vocabulary_entry(self, word_id: str) -> VocabularyEntry | None:
+        entries = self._vocabulary_entries_from_rows(self._vocabulary_entries_query().where(Word.id == word_id))
+        return entries[0] if entries else None
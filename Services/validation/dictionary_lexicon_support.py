@@ -3,8 +3,20 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 import sqlite3
+import threading
 from typing import Iterable
 
+from Models.connection_profile import connect_sqlite
+from Services.analysis.lexicon import Lexicon
+from Services.analysis.token_table import FlagTable
+from Services.validation.lexicon_file import (
+    PHRASAL_SECTION,
+    POS_NAMES_SECTION,
+    LexiconFileError,
+    MappedLexiconFile,
+    write_lexicon_file,
+)
+
 
 FUNCTION_WORDS = {
     "a",
@@ -85,17 +97,120 @@ FUNCTION_WORDS = {
 }
 
 
-@dataclass
+LOAD_BATCH_SIZE = 5000
+
+# Word class ids are interned into bits so each record stores one small int.
+POS_CLASS_FLAGS = FlagTable(
+    (
+        "noun",
+        "verb",
+        "adjective",
+        "adverb",
+        "preposition",
+        "pronoun",
+        "conjunction",
+        "interjection",
+        "determiner",
+        "auxiliary",
+        "abbreviation",
+        "unknown",
+    )
+)
+
+
 class DictionaryWordRecord:
-    word: str
-    normalized: str
-    pos_classes: set[str] = field(default_factory=set)
-    translations: set[str] = field(default_factory=set)
+    __slots__ = ("word", "normalized", "pos_mask", "translations")
+
+    def __init__(self, word: str, normalized: str, pos_mask: int = 0, translations: tuple[str, ...] = ()) -> None:
+        self.word = word
+        self.normalized = normalized
+        self.pos_mask = pos_mask
+        self.translations = translations
+
+    def __repr__(self) -> str:
+        return (
+            f"DictionaryWordRecord(word={self.word!r}, normalized={self.normalized!r}, "
+            f"pos_classes={sorted(self.pos_classes)!r}, translations={self.translations!r})"
+        )
+
+    @property
+    def pos_classes(self) -> frozenset[str]:
+        return frozenset(POS_CLASS_FLAGS.names_in(self.pos_mask))
+
+    def has_pos(self, *pos_classes: str) -> bool:
+        return bool(self.pos_mask & POS_CLASS_FLAGS.mask(pos_classes))
+
+    def add_pos(self, pos_class: str) -> None:
+        self.pos_mask |= POS_CLASS_FLAGS.flag(pos_class)
+
+    def add_translation(self, translation: str) -> None:
+        if translation not in self.translations:
+            self.translations = (*self.translations, translation)
+
+
+class MappedWordIndex:
+    """Word records served from a mapped lexicon file, with an in-memory overlay.
+
+    Records are decoded from the file on lookup; rows merged later (new or edited words)
+    are copied into the overlay, which takes precedence.
+    """
+
+    def __init__(self, lexicon_file: MappedLexiconFile) -> None:
+        self.lexicon_file = lexicon_file
+        self.overlay: dict[str, DictionaryWordRecord] = {}
+        self._overlay_only = 0
+
+    def _mapped(self, normalized: str) -> DictionaryWordRecord | None:
+        found = self.lexicon_file.find(normalized)
+        if found is None:
+            return None
+        word, pos_mask, translations = found
+        return DictionaryWordRecord(word=word, normalized=normalized, pos_mask=pos_mask, translations=translations)
+
+    def get(self, normalized: str, default: DictionaryWordRecord | None = None) -> DictionaryWordRecord | None:
+        rec = self.overlay.get(normalized)
+        if rec is None:
+            rec = self._mapped(normalized)
+        return default if rec is None else rec
+
+    def __contains__(self, normalized: object) -> bool:
+        if not isinstance(normalized, str):
+            return False
+        return normalized in self.overlay or self.lexicon_file.find(normalized) is not None
+
+    def __len__(self) -> int:
+        return len(self.lexicon_file) + self._overlay_only
+
+    def setdefault(self, normalized: str, default: DictionaryWordRecord) -> DictionaryWordRecord:
+        rec = self.overlay.get(normalized)
+        if rec is not None:
+            return rec
+        rec = self._mapped(normalized)
+        if rec is None:
+            rec = default
+            self._overlay_only += 1
+        self.overlay[normalized] = rec
+        return rec
+
+
+# Category sets written to (and read back from) the lexicon file.
+SNAPSHOT_WORD_LISTS = (
+    "nouns",
+    "adjectives",
+    "adverbs",
+    "verbs_base",
+    "prepositions",
+    "pronouns",
+    "determiners",
+    "conjunctions",
+    "auxiliaries",
+    "abbreviations",
+)
 
 
 @dataclass
 class DictionaryLexiconSnapshot:
-    words: dict[str, DictionaryWordRecord] = field(default_factory=dict)
+    words: dict[str, DictionaryWordRecord] | MappedWordIndex = field(default_factory=dict)
     nouns: set[str] = field(default_factory=set)
     adjectives: set[str] = field(default_factory=set)
     adverbs: set[str] = field(default_factory=set)
@@ -113,11 +228,30 @@ class DictionaryLexiconSnapshot:
         return bool(self.words)
 
 
+# Filled by triggers on `word` (see VocabularyService._ensure_schema_updates) so edits to
+# existing rows can be picked up incrementally; new rows are found by rowid. Rows a refresh
+# has read are pruned. `word` has no INTEGER PRIMARY KEY, so VACUUM may renumber its rowids:
+# after vacuuming, restart the app and rebuild the lexicon file so both load in full.
+WORD_CHANGE_LOG_TABLE = "word_change_log"
+
+WORD_ROWS_QUERY = """
+    SELECT rowid, word, word_normalized, word_class_id, traduction
+    FROM word
+    WHERE language_id = 'en'
+"""
+
+
 class DictionaryLexiconSupport:
-    def __init__(self, db_path: str = "app.db") -> None:
+    def __init__(self, db_path: str = "app.db", lexicon_path: str | None = None) -> None:
         self.db_path = db_path
+        # Compiled by `build_lexicon_file()`; used instead of a full SQLite load when present.
+        self.lexicon_path = lexicon_path or f"{db_path}.lexicon"
         self._snapshot = DictionaryLexiconSnapshot()
         self._loaded = False
+        self._row_watermark = 0
+        self._change_watermark = 0
+        # Loads, refreshes and file builds swap the snapshot and move the watermarks together.
+        self._lock = threading.RLock()
 
     @property
     def snapshot(self) -> DictionaryLexiconSnapshot:
@@ -126,79 +260,232 @@ class DictionaryLexiconSupport:
     def ensure_loaded(self) -> DictionaryLexiconSnapshot:
         if self._loaded:
             return self._snapshot
-
-        self._snapshot = self._load_snapshot()
-        self._loaded = True
-        return self._snapshot
+        with self._lock:
+            if not self._loaded:
+                self._snapshot = self._load_snapshot()
+                self._loaded = True
+            return self._snapshot
 
     def lookup(self, token: str) -> DictionaryWordRecord | None:
         snapshot = self.ensure_loaded()
         return snapshot.words.get((token or "").strip().lower())
 
-    def enrich_rule_engine_lexicons(self) -> None:
-        snapshot = self.ensure_loaded()
+    def refresh(self) -> DictionaryLexiconSnapshot:
+        """
+        Merge `word` rows added or edited since the last load into the snapshot.
+
+        Returns a snapshot holding only those rows (empty when nothing changed). Merging is
+        additive: words removed or renamed by an edit stay known until the next full load.
+        Change-log rows read here are pruned. If another process pruned rows this snapshot
+        has not read yet, the whole table is loaded again and returned instead.
+        """
+        with self._lock:
+            if not self._loaded:
+                return self.ensure_loaded()
+
+            delta = DictionaryLexiconSnapshot()
+            con = self._connect()
+            if con is None:
+                return delta
+            try:
+                change_log = self._change_log_state(con)
+                if change_log is not None and self._missed_pruned_changes(self._change_watermark, change_log):
+                    con.close()
+                    return self._reload_from_database()
+                change_watermark = change_log[0] if change_log is not None else None
+                if change_watermark is None:
+                    cur = con.execute(f"{WORD_ROWS_QUERY} AND rowid > ?", (self._row_watermark,))
+                else:
+                    cur = con.execute(
+                        f"{WORD_ROWS_QUERY} AND (rowid > ? OR rowid IN "
+                        f"(SELECT word_rowid FROM {WORD_CHANGE_LOG_TABLE} WHERE seq > ?))",
+                        (self._row_watermark, self._change_watermark),
+                    )
+                rows = cur.fetchall()
+            except sqlite3.Error:
+                con.close()
+                return delta
+
+            self._apply_rows(delta, rows)
+            self._apply_rows(self._snapshot, rows)
+            if change_watermark is not None:
+                self._change_watermark = change_watermark
+                self._prune_change_log(con)
+            con.close()
+            return delta
+
+    def merge_into_lexicon(self, lexicon: Lexicon, snapshot: DictionaryLexiconSnapshot | None = None) -> Lexicon:
+        """Return `lexicon` extended with dictionary words (copy-on-write; the input is unchanged)."""
+        if snapshot is None:
+            snapshot = self.ensure_loaded()
         if not snapshot.loaded:
-            return
+            return lexicon
+
+        return lexicon.merged(
+            phrasal_verbs=snapshot.phrasal_verbs,
+            verbs=snapshot.verbs_base | snapshot.auxiliaries,
+            base_verbs=snapshot.verbs_base,
+            adjectives=snapshot.adjectives,
+            prepositions=snapshot.prepositions,
+            relative_nouns={w for w in snapshot.nouns if " " not in w and len(w) > 1},
+            passive_transitive_bases=snapshot.verbs_base,
+            reporting_verbs={w for w in snapshot.verbs_base if w in {"say", "tell", "ask", "explain", "report"}},
+            gerund_verbs={w for w in snapshot.verbs_base if w in {"enjoy", "avoid", "mind", "finish", "suggest"}},
+            to_infinitive_verbs={
+                w for w in snapshot.verbs_base if w in {"want", "need", "decide", "hope", "plan", "learn"}
+            },
+        )
 
-        # Import lazily to avoid circular imports and keep RuleEngine usable without DB.
-        from Services.analysis import sentence_analyzer as analyzer_mod
-        from Services.grammar.english_rules import shared as shared_mod
+    def _connect(self) -> sqlite3.Connection | None:
+        db_file = Path(self.db_path)
+        if not db_file.exists():
+            return None
+        try:
+            return connect_sqlite(str(db_file))
+        except sqlite3.Error:
+            return None
 
-        analyzer_mod.COMMON_VERBS.update(snapshot.verbs_base)
-        analyzer_mod.COMMON_VERBS.update(snapshot.auxiliaries)
+    def _change_log_state(self, con: sqlite3.Connection) -> tuple[int, int | None] | None:
+        """(latest seq ever logged, oldest seq still kept), or None without a change log."""
+        # Read before the rows query: anything logged in between is simply read again next time.
+        try:
+            oldest = con.execute(f"SELECT MIN(seq) FROM {WORD_CHANGE_LOG_TABLE}").fetchone()[0]
+            # The AUTOINCREMENT high-water mark survives pruning, unlike MAX(seq).
+            row = con.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (WORD_CHANGE_LOG_TABLE,)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return (row[0] if row else 0), oldest
 
-        shared_mod.COMMON_BASE_VERBS.update(snapshot.verbs_base)
-        shared_mod.COMMON_ADJECTIVES.update(snapshot.adjectives)
-        shared_mod.COMMON_PREPOSITIONS.update(snapshot.prepositions)
-        shared_mod.COMMON_NOUNS_FOR_RELATIVES.update(
-            {w for w in snapshot.nouns if " " not in w and len(w) > 1}
-        )
-        shared_mod.TRANSITIVE_BASES_FOR_PASSIVE.update(snapshot.verbs_base)
-        shared_mod.REPORTING_VERBS.update(
-            {w for w in snapshot.verbs_base if w in {"say", "tell", "ask", "explain", "report"}}
-        )
-        shared_mod.GERUND_VERBS.update(
-            {w for w in snapshot.verbs_base if w in {"enjoy", "avoid", "mind", "finish", "suggest"}}
-        )
-        shared_mod.TO_INFINITIVE_VERBS.update(
-            {w for w in snapshot.verbs_base if w in {"want", "need", "decide", "hope", "plan", "learn"}}
-        )
+    def _current_change_watermark(self, con: sqlite3.Connection) -> int | None:
+        change_log = self._change_log_state(con)
+        return change_log[0] if change_log is not None else None
 
-        for base, particles in snapshot.phrasal_verbs.items():
-            if base in shared_mod.PHRASAL_ADVANCED:
-                shared_mod.PHRASAL_ADVANCED[base].update(particles)
-                continue
-            if base in shared_mod.PHRASAL_BASIC:
-                shared_mod.PHRASAL_BASIC[base].update(particles)
-                continue
-            # Defaults to "basic" bucket to improve detection without changing severity.
-            shared_mod.PHRASAL_BASIC[base] = set(particles)
+    @staticmethod
+    def _missed_pruned_changes(watermark: int, change_log: tuple[int, int | None]) -> bool:
+        # Entries after `watermark` were logged, but the first of them is gone.
+        latest, oldest = change_log
+        return latest > watermark and (oldest is None or oldest > watermark + 1)
+
+    def _prune_change_log(self, con: sqlite3.Connection) -> None:
+        # Best effort: rows left behind are only read again and pruned by the next refresh.
+        try:
+            with con:
+                con.execute(f"DELETE FROM {WORD_CHANGE_LOG_TABLE} WHERE seq <= ?", (self._change_watermark,))
+        except sqlite3.Error:
+            pass
+
+    def _reload_from_database(self) -> DictionaryLexiconSnapshot:
+        self._row_watermark = 0
+        self._snapshot = self._load_from_database()
+        self._loaded = True
+        return self._snapshot
+
+    def build_lexicon_file(self, path: str | None = None) -> str:
+        """Compile the `word` table into a memory-mapped lexicon file and return its path."""
+        path = path or self.lexicon_path
+        # Build from a fresh load without disturbing the watermarks of the live snapshot.
+        with self._lock:
+            watermarks = self._row_watermark, self._change_watermark
+            self._row_watermark = 0
+            try:
+                snapshot = self._load_from_database()
+                built_watermarks = self._row_watermark, self._change_watermark
+            finally:
+                self._row_watermark, self._change_watermark = watermarks
+        write_lexicon_file(
+            path,
+            ((rec.normalized, rec.word, rec.pos_mask, rec.translations) for rec in snapshot.words.values()),
+            {
+                **{name: getattr(snapshot, name) for name in SNAPSHOT_WORD_LISTS},
+                PHRASAL_SECTION: [
+                    f"{base} {particle}" for base, particles in snapshot.phrasal_verbs.items() for particle in particles
+                ],
+            },
+            POS_CLASS_FLAGS.names,
+            *built_watermarks,
+        )
+        return path
 
     def _load_snapshot(self) -> DictionaryLexiconSnapshot:
-        snapshot = DictionaryLexiconSnapshot()
-        db_file = Path(self.db_path)
-        if not db_file.exists():
-            return snapshot
+        snapshot = self._load_from_file()
+        if snapshot is None:
+            return self._load_from_database()
+        # Bring the mapped snapshot up to date with rows written after the build.
+        with self._lock:
+            self._snapshot, self._loaded = snapshot, True
+            self.refresh()
+            # Changes pruned since the file was checked make `refresh` load the table again.
+            return self._snapshot
 
+    def _load_from_file(self) -> DictionaryLexiconSnapshot | None:
+        if not Path(self.lexicon_path).exists() or not Path(self.db_path).exists():
+            return None
         try:
-            con = sqlite3.connect(str(db_file))
+            lexicon_file = MappedLexiconFile(self.lexicon_path)
+        except (OSError, LexiconFileError):
+            return None
+
+        # Bitmasks are only meaningful if the file was written with a prefix of our flag names.
+        pos_names = lexicon_file.word_list(POS_NAMES_SECTION)
+        if pos_names != POS_CLASS_FLAGS.names[: len(pos_names)] or not self._file_matches_database(lexicon_file):
+            lexicon_file.close()
+            return None
+
+        snapshot = DictionaryLexiconSnapshot(words=MappedWordIndex(lexicon_file))
+        for name in SNAPSHOT_WORD_LISTS:
+            getattr(snapshot, name).update(lexicon_file.word_list(name))
+        for line in lexicon_file.word_list(PHRASAL_SECTION):
+            base, _, particle = line.partition(" ")
+            snapshot.phrasal_verbs.setdefault(base, set()).add(particle)
+        self._row_watermark = lexicon_file.row_watermark
+        self._change_watermark = lexicon_file.change_watermark
+        return snapshot
+
+    def _file_matches_database(self, lexicon_file: MappedLexiconFile) -> bool:
+        # A file newer than the database (e.g. after the table was rebuilt) would hide rows.
+        con = self._connect()
+        if con is None:
+            return False
+        try:
+            max_rowid = con.execute("SELECT COALESCE(MAX(rowid), 0) FROM word").fetchone()[0]
+            change_log = self._change_log_state(con)
         except sqlite3.Error:
+            return False
+        finally:
+            con.close()
+        if change_log is None:
+            return lexicon_file.row_watermark <= max_rowid and lexicon_file.change_watermark == 0
+        # Edits pruned since the build would be lost, so such a file is stale too.
+        return (
+            lexicon_file.row_watermark <= max_rowid
+            and lexicon_file.change_watermark <= change_log[0]
+            and not self._missed_pruned_changes(lexicon_file.change_watermark, change_log)
+        )
+
+    def _load_from_database(self) -> DictionaryLexiconSnapshot:
+        snapshot = DictionaryLexiconSnapshot()
+        con = self._connect()
+        if con is None:
             return snapshot
 
         try:
+            change_watermark = self._current_change_watermark(con)
             cur = con.cursor()
-            cur.execute(
-                """
-                SELECT word, word_normalized, word_class_id, traduction
-                FROM word
-                WHERE language_id = 'en'
-                """
-            )
+            cur.execute(WORD_ROWS_QUERY)
+            # Stream in batches so the whole table is never materialized at once.
+            while rows := cur.fetchmany(LOAD_BATCH_SIZE):
+                self._apply_rows(snapshot, rows)
         except sqlite3.Error:
             con.close()
             return snapshot
 
-        for raw_word, raw_norm, word_class_id, traduction in cur.fetchall():
+        con.close()
+        self._change_watermark = change_watermark or 0
+        return snapshot
+
+    def _apply_rows(self, snapshot: DictionaryLexiconSnapshot, rows: Iterable[tuple]) -> None:
+        for rowid, raw_word, raw_norm, word_class_id, traduction in rows:
+            self._row_watermark = max(self._row_watermark, rowid)
             word = (raw_word or "").strip()
             normalized = (raw_norm or "").strip().lower()
             if not normalized:
@@ -209,15 +496,12 @@ class DictionaryLexiconSupport:
                 DictionaryWordRecord(word=word, normalized=normalized),
             )
             if word_class_id:
-                rec.pos_classes.add(word_class_id)
+                rec.add_pos(word_class_id)
             if traduction:
-                rec.translations.add(str(traduction).strip())
+                rec.add_translation(str(traduction).strip())
 
             self._add_pos_to_snapshot(snapshot, normalized, word_class_id or "")
 
-        con.close()
-        return snapshot
-
     def _add_pos_to_snapshot(self, snapshot: DictionaryLexiconSnapshot, normalized: str, word_class_id: str) -> None:
         pos = (word_class_id or "").strip().lower()
         if pos == "noun":
@@ -313,7 +597,7 @@ class DictionaryLexiconSupport:
             if not nxt:
                 continue
             rec = snapshot.words.get(nxt)
-            if rec and "verb" not in rec.pos_classes and "auxiliary" not in rec.pos_classes:
+            if rec and not rec.has_pos("verb", "auxiliary"):
                 hints.append(
                     f"Despues de modal ('{token}'), '{nxt}' no aparece como verbo en el diccionario (POS: {', '.join(sorted(rec.pos_classes))})."
                 )
@@ -331,7 +615,7 @@ class DictionaryLexiconSupport:
             if not nxt:
                 continue
             rec = snapshot.words.get(nxt)
-            if rec and rec.pos_classes.isdisjoint({"verb", "auxiliary"}):
+            if rec and not rec.has_pos("verb", "auxiliary"):
                 hints.append(
                     f"Despues de 'to', '{nxt}' no aparece como verbo en el diccionario (POS: {', '.join(sorted(rec.pos_classes))})."
                 )
@@ -345,7 +629,7 @@ class DictionaryLexiconSupport:
             if not nxt:
                 continue
             rec = snapshot.words.get(nxt)
-            if rec and rec.pos_classes.isdisjoint({"adjective", "adverb"}):
+            if rec and not rec.has_pos("adjective", "adverb"):
                 hints.append(
                     f"Despues de 'very', '{nxt}' no suele funcionar como adjetivo/adverbio (POS: {', '.join(sorted(rec.pos_classes))})."
                 )
@@ -361,7 +645,7 @@ class DictionaryLexiconSupport:
             rec = snapshot.words.get(nxt)
             if rec is None:
                 continue
-            if "verb" in rec.pos_classes and rec.pos_classes.isdisjoint({"adjective", "noun", "adverb"}):
+            if rec.has_pos("verb") and not rec.has_pos("adjective", "noun", "adverb"):
                 hints.append(
                     f"Despues de '{token}', '{nxt}' aparece principalmente como verbo; revisa si falta un adjetivo o forma en -ing/-ed."
                 )
@@ -375,7 +659,7 @@ class DictionaryLexiconSupport:
             if not nxt:
                 continue
             rec = snapshot.words.get(nxt)
-            if rec and rec.pos_classes.isdisjoint({"noun", "adjective", "determiner"}):
+            if rec and not rec.has_pos("noun", "adjective", "determiner"):
                 hints.append(
                     f"Despues de '{token}', '{nxt}' tiene POS poco comun para una frase nominal ({', '.join(sorted(rec.pos_classes))})."
                 )
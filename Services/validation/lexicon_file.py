@@ -0,0 +1,169 @@
+"""Read-only, memory-mapped dictionary lexicon file.
+
+Layout (little endian):
+
+    header   magic "TLEX", format version, section count, entry count,
+             row watermark and change-log watermark of the source database
+    sections (name, offset, length) for every block below
+    index    one fixed-size record per headword, sorted by UTF-8 headword:
+             headword offset/length, display word offset/length,
+             translations offset/length, POS bitmask
+    strings  UTF-8 string pool referenced by the index
+    lists    newline-separated word lists (one per POS category, phrasal verbs,
+             and the POS flag names the bitmasks were written with)
+
+Lookups binary-search the mapped index, so opening the file costs no parsing and the
+pages are shared between every process that maps it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import mmap
+import os
+from pathlib import Path
+import struct
+
+
+MAGIC = b"TLEX"
+FORMAT_VERSION = 2
+TRANSLATION_SEPARATOR = "\x1f"
+
+HEADER = struct.Struct("<4sHHQQQ")
+SECTION = struct.Struct("<16sQQ")
+INDEX_RECORD = struct.Struct("<IIIIIIQ")
+
+POS_NAMES_SECTION = "pos_names"
+PHRASAL_SECTION = "phrasal"
+
+
+class LexiconFileError(ValueError):
+    pass
+
+
+def write_lexicon_file(
+    path: str | Path,
+    entries: Iterable[tuple[str, str, int, tuple[str, ...]]],
+    word_lists: Mapping[str, Iterable[str]],
+    pos_names: Iterable[str],
+    row_watermark: int,
+    change_watermark: int,
+) -> None:
+    """Write entries of (headword, display word, POS bitmask, translations) atomically."""
+    strings = bytearray()
+    index = bytearray()
+
+    def add_string(text: str) -> tuple[int, int]:
+        data = text.encode("utf-8")
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    encoded = sorted(
+        ((headword.encode("utf-8"), headword, word, pos_mask, translations) for headword, word, pos_mask, translations in entries),
+        key=lambda item: item[0],
+    )
+    for _, headword, word, pos_mask, translations in encoded:
+        key_off, key_len = add_string(headword)
+        word_off, word_len = add_string(word)
+        trans_off, trans_len = add_string(TRANSLATION_SEPARATOR.join(translations))
+        index.extend(INDEX_RECORD.pack(key_off, key_len, word_off, word_len, trans_off, trans_len, pos_mask))
+
+    blocks: list[tuple[str, bytes]] = [("index", bytes(index)), ("strings", bytes(strings))]
+    blocks.append((POS_NAMES_SECTION, "\n".join(pos_names).encode("utf-8")))
+    for name, words in word_lists.items():
+        blocks.append((name, "\n".join(sorted(words)).encode("utf-8")))
+
+    offset = HEADER.size + SECTION.size * len(blocks)
+    section_table = bytearray()
+    for name, data in blocks:
+        section_table.extend(SECTION.pack(name.encode("ascii"), offset, len(data)))
+        offset += len(data)
+
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(blocks), len(encoded), row_watermark, change_watermark))
+        handle.write(section_table)
+        for _, data in blocks:
+            handle.write(data)
+    os.replace(tmp_path, path)
+
+
+class MappedLexiconFile:
+    def __init__(self, path: str | Path) -> None:
+        with open(path, "rb") as handle:
+            # An empty file cannot be mapped at all (e.g. left behind by a crash or a full disk).
+            if os.fstat(handle.fileno()).st_size < HEADER.size:
+                raise LexiconFileError(f"Truncated lexicon file: {path}")
+            self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, section_count, count, row_watermark, change_watermark = HEADER.unpack_from(self._buffer, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise LexiconFileError(f"Unsupported lexicon file: {path}")
+            self.count = count
+            self.row_watermark = row_watermark
+            self.change_watermark = change_watermark
+            self.sections: dict[str, tuple[int, int]] = {}
+            for position in range(section_count):
+                name, offset, length = SECTION.unpack_from(self._buffer, HEADER.size + position * SECTION.size)
+                self.sections[name.rstrip(b"\0").decode("ascii")] = (offset, length)
+            self._index_offset = self.sections["index"][0]
+            self._strings_offset = self.sections["strings"][0]
+        except (struct.error, KeyError) as exc:
+            self._buffer.close()
+            raise LexiconFileError(f"Corrupt lexicon file: {path}") from exc
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._buffer[start : start + length].decode("utf-8")
+
+    def find(self, headword: str) -> tuple[str, int, tuple[str, ...]] | None:
+        """Return (display word, POS bitmask, translations) for a headword, or None."""
+        target = headword.encode("utf-8")
+        buffer = self._buffer
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            record = INDEX_RECORD.unpack_from(buffer, self._index_offset + middle * INDEX_RECORD.size)
+            start = self._strings_offset + record[0]
+            key = buffer[start : start + record[1]]
+            if key < target:
+                low = middle + 1
+            elif key > target:
+                high = middle
+            else:
+                _, _, word_off, word_len, trans_off, trans_len, pos_mask = record
+                translations = self._string(trans_off, trans_len)
+                return (
+                    self._string(word_off, word_len),
+                    pos_mask,
+                    tuple(translations.split(TRANSLATION_SEPARATOR)) if translations else (),
+                )
+        return None
+
+    def word_list(self, name: str) -> list[str]:
+        section = self.sections.get(name)
+        if section is None or not section[1]:
+            return []
+        offset, length = section
+        return self._buffer[offset : offset + length].decode("utf-8").split("\n")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from Services.validation.dictionary_lexicon_support import DictionaryLexiconSupport
+
+    parser = argparse.ArgumentParser(description="Compile the dictionary lexicon into a memory-mapped file.")
+    parser.add_argument("db_path", nargs="?", default="app.db")
+    parser.add_argument("--output", default=None, help="Defaults to <db_path>.lexicon")
+    args = parser.parse_args()
+    output = DictionaryLexiconSupport(args.db_path).build_lexicon_file(args.output)
+    print(f"Lexicon written to {output}")
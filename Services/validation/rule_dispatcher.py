@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from Services.analysis.lexicon import Lexicon, base_lexicon
+from Services.grammar.english_ruleset import GrammarRule
+
+
+class RuleDispatcher:
+    """Token -> rules inverted index built from each rule's declared triggers.
+
+    Rules without triggers always run. Selected rules are returned in registry order so
+    results stay identical to evaluating the whole list.
+    """
+
+    def __init__(self, rules: Iterable[GrammarRule], lexicon: Lexicon | None = None) -> None:
+        self.rules = tuple(rules)
+        self.lexicon = lexicon or base_lexicon()
+        self._always: list[int] = []
+        self._by_token: dict[str, list[int]] = {}
+        self._by_prefix: list[tuple[tuple[str, ...], int]] = []
+        self._triggers: list[frozenset[str] | None] = []
+
+        for position, rule in enumerate(self.rules):
+            trigger_tokens = rule.get_trigger_tokens(self.lexicon)
+            self._triggers.append(trigger_tokens)
+            if trigger_tokens is None:
+                self._always.append(position)
+                continue
+            for token in trigger_tokens:
+                self._by_token.setdefault(token, []).append(position)
+            if rule.trigger_prefixes:
+                self._by_prefix.append((rule.trigger_prefixes, position))
+
+    def for_lexicon(self, lexicon: Lexicon) -> RuleDispatcher:
+        """Dispatcher for `lexicon`: this one unless some rule's triggers change with it."""
+        for rule, trigger_tokens in zip(self.rules, self._triggers):
+            if rule.get_trigger_tokens(lexicon) != trigger_tokens:
+                return RuleDispatcher(self.rules, lexicon)
+        return self
+
+    def rules_for_tokens(self, tokens: Iterable[str]) -> list[GrammarRule]:
+        token_set = set(tokens)
+        selected = set(self._always)
+        for token in token_set:
+            positions = self._by_token.get(token)
+            if positions:
+                selected.update(positions)
+        for prefixes, position in self._by_prefix:
+            if position in selected:
+                continue
+            if any(token.startswith(prefixes) for token in token_set):
+                selected.add(position)
+        return [self.rules[position] for position in sorted(selected)]
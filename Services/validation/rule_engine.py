@@ -1,25 +1,141 @@
-from Services.analysis.sentence_analyzer import SentenceAnalyzer, WH_QUESTION_WORDS
-from Services.grammar.english_ruleset import get_english_rules
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+import os
+import threading
+
+from Services.analysis.lexicon import Lexicon, base_lexicon, use_lexicon
+from Services.analysis.sentence_analyzer import (
+    ANALYZER_REVISION,
+    WH_QUESTION_WORDS,
+    SentenceAnalysis,
+    SentenceAnalyzer,
+)
+from Services.grammar.english_ruleset import CompiledRuleRegistry, get_compiled_english_rules
 from Services.validation.collocation_support import CollocationSupport
 from Services.validation.dictionary_lexicon_support import DictionaryLexiconSupport
+from Services.validation.rule_dispatcher import RuleDispatcher
 from Services.validation.validation_result import ValidationResult
 
 
+DEFAULT_BATCH_CHUNK_SIZE = 64
+
+# One engine per pool worker, created (and warmed) by the pool initializer.
+_worker_engine: "RuleEngine | None" = None
+
+
+def _init_batch_worker(db_path: str) -> None:
+    global _worker_engine
+    _worker_engine = RuleEngine(db_path=db_path)
+    _worker_engine.ensure_lexicon_ready()
+
+
+def _validate_batch_chunk(start: int, texts: list[str], language: str) -> tuple[int, list[ValidationResult]]:
+    return start, [_worker_engine.validate_sentence(text, language=language) for text in texts]
+
+
 class RuleEngine:
-    def __init__(self) -> None:
-        self.sentence_analyzer = SentenceAnalyzer()
-        self.dictionary_lexicon = DictionaryLexiconSupport()
+    def __init__(self, db_path: str = "app.db", lexicon: Lexicon | None = None) -> None:
+        self.lexicon = lexicon or base_lexicon()
+        self.sentence_analyzer = SentenceAnalyzer(lexicon=self.lexicon)
+        self.dictionary_lexicon = DictionaryLexiconSupport(db_path)
         self.collocation_support = CollocationSupport()
+        # Compiled on first use (the warm-up's "rules" phase), not while the UI builds the engine.
+        self._rule_registry: CompiledRuleRegistry | None = None
+        self.rule_dispatcher: RuleDispatcher | None = None
         self._lexicon_enriched = False
+        # Serializes dictionary loading/refreshing between a warm-up thread and callers.
+        self._lexicon_lock = threading.RLock()
+        self._warm_up: Future | None = None
+
+    @property
+    def dictionary_lexicon_ready(self) -> bool:
+        return self._lexicon_enriched
 
-    def _ensure_dictionary_lexicon_ready(self) -> None:
+    @property
+    def rule_registry(self) -> CompiledRuleRegistry:
+        if self._rule_registry is None:
+            self._rule_registry = get_compiled_english_rules()
+        return self._rule_registry
+
+    @property
+    def engine_version(self) -> str:
+        return f"{ANALYZER_REVISION}-{self.rule_registry.version}"
+
+    def ensure_lexicon_ready(self, progress: Callable[[str], None] | None = None) -> None:
+        """
+        Merge the dictionary lexicon into `self.lexicon` once; later calls return at once.
+
+        Callers that read `self.lexicon` directly (instead of going through validation)
+        call this first so they see the same vocabulary validation does.
+        """
         if self._lexicon_enriched:
             return
-        self.dictionary_lexicon.enrich_rule_engine_lexicons()
-        self._lexicon_enriched = True
+        # While a warm-up runs it holds the lock, so an early caller only waits for the rest of it.
+        with self._lexicon_lock:
+            if self._lexicon_enriched:
+                return
+            if progress is not None:
+                progress("dictionary")
+            lexicon = self.dictionary_lexicon.merge_into_lexicon(self.lexicon)
+            if progress is not None:
+                progress("rules")
+            # Compiles the rule registry (on first use) and indexes it, so validation finds both ready.
+            self.set_lexicon(lexicon)
+            self._lexicon_enriched = True
+
+    def start_warm_up(self, progress: Callable[[str], None] | None = None) -> Future:
+        """
+        Load the dictionary lexicon, compile the rules and build the dispatcher on a background thread.
+
+        The returned future resolves once validation has nothing left to load; later calls
+        return the same future. `progress` is called from that thread with the phase being
+        entered ("dictionary", then "rules"). If the warm-up fails, the future holds the
+        error and the next validation loads synchronously as before.
+        """
+        if self._warm_up is None:
+            future: Future = Future()
+            future.set_running_or_notify_cancel()
+
+            def run() -> None:
+                try:
+                    self.ensure_lexicon_ready(progress)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(None)
+
+            self._warm_up = future
+            threading.Thread(target=run, name="rule-engine-warm-up", daemon=True).start()
+        return self._warm_up
+
+    def refresh_dictionary_lexicon(self) -> bool:
+        """Merge dictionary words added or edited since the last load; True if the lexicon changed."""
+        with self._lexicon_lock:
+            delta = self.dictionary_lexicon.refresh()
+            if not self._lexicon_enriched or not delta.loaded:
+                # Not merged yet: the first validation merges the (now refreshed) snapshot.
+                return False
+            lexicon = self.dictionary_lexicon.merge_into_lexicon(self.lexicon, delta)
+            if lexicon is self.lexicon:
+                # Every word of the delta was already known (e.g. a new translation).
+                return False
+            self.set_lexicon(lexicon)
+            return True
+
+    def set_lexicon(self, lexicon: Lexicon) -> None:
+        # Some triggers come from lexicon words, so the index follows the lexicon.
+        if self.rule_dispatcher is None:
+            rule_dispatcher = RuleDispatcher(self.rule_registry.rules, lexicon)
+        else:
+            rule_dispatcher = self.rule_dispatcher.for_lexicon(lexicon)
+        self.sentence_analyzer.set_lexicon(lexicon)
+        # Published last: validations on other threads read `lexicon` first.
+        self.rule_dispatcher = rule_dispatcher
+        self.lexicon = lexicon
 
     def lookup_dictionary_word(self, word: str) -> dict | None:
-        record = self.dictionary_lexicon.lookup(word)
+        with self._lexicon_lock:
+            record = self.dictionary_lexicon.lookup(word)
         if record is None:
             return None
         return {
@@ -29,6 +145,57 @@ class RuleEngine:
             "translations": sorted(t for t in record.translations if t),
         }
 
+    def validate_many(
+        self,
+        texts: Iterable[str],
+        language: str = "english",
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> list[ValidationResult]:
+        """Validate many sentences, returning results in input order."""
+        texts = list(texts)
+        results: list[ValidationResult | None] = [None] * len(texts)
+        for idx, result in self.iter_validate_many(texts, language, workers, chunk_size):
+            results[idx] = result
+        return results
+
+    def iter_validate_many(
+        self,
+        texts: Iterable[str],
+        language: str = "english",
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> Iterator[tuple[int, ValidationResult]]:
+        """Yield (input_index, result) pairs as chunks finish (not in input order).
+
+        Sentences are sharded in chunks across a process pool; every worker loads the
+        dictionary lexicon once in its initializer. With one worker (or a single chunk)
+        everything runs in-process.
+        """
+        texts = list(texts)
+        if not texts:
+            return
+        chunk_size = max(1, chunk_size)
+        workers = workers or os.cpu_count() or 1
+        chunks = [(start, texts[start : start + chunk_size]) for start in range(0, len(texts), chunk_size)]
+        workers = min(workers, len(chunks))
+
+        if workers <= 1:
+            for idx, text in enumerate(texts):
+                yield idx, self.validate_sentence(text, language=language)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.dictionary_lexicon.db_path,),
+        ) as pool:
+            futures = [pool.submit(_validate_batch_chunk, start, chunk, language) for start, chunk in chunks]
+            for future in as_completed(futures):
+                start, chunk_results = future.result()
+                for offset, result in enumerate(chunk_results):
+                    yield start + offset, result
+
     def validate_sentence(self, text: str, language: str = "english") -> ValidationResult:
         if language.lower() != "english":
             result = ValidationResult(is_valid=False)
@@ -37,12 +204,18 @@ class RuleEngine:
             )
             return result
 
-        self._ensure_dictionary_lexicon_ready()
-        analysis = self.sentence_analyzer.analyze_english(text)
+        self.ensure_lexicon_ready()
+        with use_lexicon(self.lexicon):
+            return self._validate_english(text)
+
+    def _validate_english(self, text: str) -> ValidationResult:
+        return self._validate_analysis(self.sentence_analyzer.analyze_english(text))
+
+    def _validate_analysis(self, analysis: SentenceAnalysis) -> ValidationResult:
         result = ValidationResult()
         features_by_index = {f.index: f for f in analysis.token_features}
 
-        for rule in get_english_rules():
+        for rule in self.rule_dispatcher.rules_for_tokens(analysis.tokens):
             issue = rule.evaluate(analysis)
             if issue is not None:
                 result.add_issue(issue)
@@ -155,3 +328,30 @@ class RuleEngine:
             result.add_lexical_hint(hint)
 
         return result
+
+
+class LiveValidation:
+    """
+    Validates successive edits of one English sentence, e.g. feedback while typing.
+
+    Each call hands the previous analysis to `SentenceAnalyzer.analyze_english_incremental`,
+    so only tokens from the edit onwards are re-classified. Rules are then picked by the
+    engine's dispatcher from the new tokens as usual: they read sentence-level features
+    (subject, clauses, sentence type) that any edit can change, so none of their results
+    are carried over.
+    """
+
+    def __init__(self, engine: RuleEngine) -> None:
+        self.engine = engine
+        self._analysis: SentenceAnalysis | None = None
+        self._lexicon_version: int | None = None
+
+    def validate(self, text: str) -> ValidationResult:
+        engine = self.engine
+        engine.ensure_lexicon_ready()
+        previous = self._analysis if self._lexicon_version == engine.lexicon.version else None
+        with use_lexicon(engine.lexicon):
+            analysis = engine.sentence_analyzer.analyze_english_incremental(text, previous)
+            result = engine._validate_analysis(analysis)
+        self._analysis, self._lexicon_version = analysis, engine.lexicon.version
+        return result
@@ -0,0 +1,152 @@
+import os
+import tempfile
+import unittest
+
+try:
+    from Models.base_model import db
+    from Models.connection_profile import SQLITE_PRAGMAS
+    from Models.dictionary_entry_model import DictionaryEntry
+    from Models.dictionary_example_model import DictionaryExample
+    from Models.dictionary_import_batch_model import DictionaryImportBatch
+    from Services.storage.dictionary_importer import DictionaryImporter, parse_entry_line
+    from Services.storage.vocabulary_service import VocabularyService
+    PEEWEE_AVAILABLE = True
+except ModuleNotFoundError:
+    PEEWEE_AVAILABLE = False
+
+
+SAMPLE_LINES = [
+    "SUPERDICCIONARIO 12\n",
+    "work vt-vi trabajar, funcionar\n",
+    "• I work every day = Trabajo todos los dias\n",
+    "give up vt rendirse\n",
+    "\fhouse n. casa; hogar\n",
+    "• The house is big = La casa es grande\n",
+    "quickly adv rapidamente\n",
+]
+
+
+@unittest.skipUnless(PEEWEE_AVAILABLE, "peewee is not installed in this Python environment")
+class DictionaryImporterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        fd, self.db_path = tempfile.mkstemp(prefix="tle_import_", suffix=".db")
+        os.close(fd)
+        if not db.is_closed():
+            db.close()
+        db.init(self.db_path, pragmas=SQLITE_PRAGMAS)
+        self.service = VocabularyService()
+        self.service.initialize_database()
+
+    def tearDown(self) -> None:
+        if not db.is_closed():
+            db.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def test_parse_entry_line_splits_at_first_known_pos_tag(self) -> None:
+        self.assertEqual(parse_entry_line("give up vt rendirse"), ("give up", "vt", "rendirse"))
+        self.assertEqual(parse_entry_line("house n. casa; hogar"), ("house", "n", "casa; hogar"))
+        self.assertIsNone(parse_entry_line("SUPERDICCIONARIO 12"))
+
+    def test_imports_entries_examples_and_pages(self) -> None:
+        report = DictionaryImporter(chunk_lines=2).import_lines(SAMPLE_LINES, "pdf-1")
+
+        self.assertTrue(report.finished)
+        self.assertEqual((report.entries, report.examples, report.skipped_lines), (4, 2, 1))
+        house = DictionaryEntry.get(DictionaryEntry.headword_normalized == "house")
+        self.assertEqual((house.source_page, house.pos_normalized, house.translation_primary), (2, "noun", "casa"))
+        self.assertEqual([e.example_translation for e in house.examples], ["La casa es grande"])
+        work = DictionaryEntry.get(DictionaryEntry.headword_normalized == "work")
+        self.assertEqual((work.pos_normalized, work.import_batch, work.source_page), ("verb", "pdf-1", 1))
+        self.assertEqual(self.service.lookup_catalog_word("Give  Up").spanish_translation, "rendirse")
+
+    def test_interrupted_batch_resumes_after_last_committed_line(self) -> None:
+        importer = DictionaryImporter(chunk_lines=2)
+
+        def interrupt(report) -> None:
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            importer.import_lines(SAMPLE_LINES, "pdf-1", progress=interrupt)
+        self.assertEqual(DictionaryEntry.select().count(), 1)
+
+        report = importer.import_lines(SAMPLE_LINES, "pdf-1")
+        self.assertEqual(report.resumed_from_line, 3)
+        self.assertEqual((report.entries, report.examples), (3, 1))
+        self.assertEqual(DictionaryEntry.select().count(), 4)
+        self.assertEqual(DictionaryExample.select().count(), 2)
+        self.assertEqual(DictionaryImportBatch.get_by_id("pdf-1").status, "done")
+
+        again = importer.import_lines(SAMPLE_LINES, "pdf-1")
+        self.assertEqual(again.rows, 0)
+        self.assertEqual(DictionaryEntry.select().count(), 4)
+
+    def test_chunked_import_keeps_examples_after_page_noise(self) -> None:
+        lines = ["work vt trabajar\n", "12\n", "• I work = trabajo\n", "go vi ir\n", "\fSUPERDICCIONARIO\n", "• I go = voy\n"]
+        whole = DictionaryImporter(chunk_lines=len(lines)).import_lines(lines, "pdf-whole", source_path="a")
+        rows = sorted(DictionaryExample.select(DictionaryExample.id, DictionaryExample.example_text).tuples())
+        DictionaryExample.delete().execute()
+        DictionaryEntry.delete().execute()
+
+        chunked = DictionaryImporter(chunk_lines=1).import_lines(lines, "pdf-chunked", source_path="a")
+
+        self.assertEqual((chunked.entries, chunked.examples, chunked.skipped_lines), (2, 2, 2))
+        self.assertEqual((whole.entries, whole.examples, whole.skipped_lines), (2, 2, 2))
+        self.assertEqual(sorted(DictionaryExample.select(DictionaryExample.id, DictionaryExample.example_text).tuples()), rows)
+
+    def test_reimported_lines_are_not_reported_as_written(self) -> None:
+        DictionaryImporter(chunk_lines=2).import_lines(SAMPLE_LINES, "pdf-1")
+        again = DictionaryImporter(chunk_lines=2).import_lines(SAMPLE_LINES, "pdf-2")
+
+        self.assertTrue(again.finished)
+        self.assertEqual((again.entries, again.examples), (0, 0))
+        state = DictionaryImportBatch.get_by_id("pdf-2")
+        self.assertEqual((state.entries_written, state.examples_written), (0, 0))
+        self.assertEqual(DictionaryEntry.select().count(), 4)
+
+    def test_parallel_parsers_write_the_same_rows_in_source_order(self) -> None:
+        lines = []
+        for page in range(6):
+            lines.append("\f" if page else "")
+            for n in range(5):
+                lines.append(f"word{page}x{n} n palabra{n}, vocablo\n")
+                lines.append(f"• The word{page}x{n} is here = La palabra esta aqui\n")
+
+        report = DictionaryImporter(chunk_lines=7, workers=2).import_lines(lines, "pdf-par")
+
+        self.assertEqual((report.entries, report.examples, report.skipped_lines), (30, 30, 0))
+        self.assertEqual(DictionaryExample.select().count(), 30)
+        self.assertEqual(DictionaryEntry.get(DictionaryEntry.headword == "word5x4").source_page, 6)
+        self.assertEqual(DictionaryImportBatch.get_by_id("pdf-par").lines_done, len(lines))
+
+    def test_catalog_cache_serves_prefix_suggestions_and_is_invalidated_by_imports(self) -> None:
+        self.assertIsNone(self.service.lookup_catalog_word("work"))
+
+        fd, dump_path = tempfile.mkstemp(prefix="tle_dump_", suffix=".txt")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.writelines(SAMPLE_LINES + ["worker n trabajador\n"])
+        self.addCleanup(os.remove, dump_path)
+        self.service.import_dictionary_file(dump_path, "pdf-1")
+
+        # Suggestions never load the catalog themselves (the app loads it on a worker thread).
+        self.assertEqual(self.service.suggest_catalog_words("WOR"), [])
+        self.service.load_catalog_cache()
+        self.assertEqual(self.service.lookup_catalog_word("Work").spanish_translation, "trabajar")
+        self.assertEqual([m.english_word for m in self.service.suggest_catalog_words("WOR")], ["work", "worker"])
+        self.assertEqual(self.service.suggest_catalog_words("g")[0].english_word_normalized, "give up")
+
+        entry, _ = self.service.create_vocabulary_entry(
+            english_word="workshop",
+            spanish_meaning="taller",
+            example_english="The workshop is big.",
+            example_spanish="El taller es grande.",
+        )
+        self.assertEqual([m.source for m in self.service.suggest_catalog_words("work")], ["dictionaryentry", "dictionaryentry", "word_fallback"])
+
+        self.service.update_vocabulary_entry(entry.word_id, "workbench", "banco", "The workbench is big.", "El banco es grande.")
+        self.assertEqual([m.english_word for m in self.service.suggest_catalog_words("work")], ["work", "workbench", "worker"])
+        self.assertIsNone(self.service.lookup_catalog_word("workshop"))
+
+
+if __name__ == "__main__":
+    unittest.main()
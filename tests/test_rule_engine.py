@@ -1,7 +1,17 @@
+import dataclasses
+import os
+import sqlite3
+import tempfile
+import threading
 import unittest
 from unittest.mock import patch
 
-from Services.validation.rule_engine import RuleEngine
+from Services.analysis.lexicon import base_lexicon, use_lexicon
+from Services.grammar.english_ruleset import get_compiled_english_rules, get_english_rules
+from Services.validation import dictionary_lexicon_support as lexicon_support_module
+from Services.validation.dictionary_lexicon_support import DictionaryLexiconSupport
+from Services.validation.rule_dispatcher import RuleDispatcher
+from Services.validation.rule_engine import LiveValidation, RuleEngine
 
 
 class RuleEngineTests(unittest.TestCase):
@@ -93,6 +103,196 @@ class RuleEngineTests(unittest.TestCase):
         self.assertTrue(any("focused" in hint and "se usa normalmente" in hint for hint in bad.lexical_hints))
         self.assertFalse(any("focused" in hint and "se usa normalmente" in hint for hint in ok.lexical_hints))
 
+    def test_rule_registry_is_compiled_once_and_shared(self) -> None:
+        other = RuleEngine()
+        self.assertIs(self.engine.rule_registry, other.rule_registry)
+        self.assertIs(self.engine.rule_registry, get_compiled_english_rules())
+        self.assertTrue(self.engine.rule_registry.version)
+        self.assertEqual(len(set(self.engine.rule_registry.rule_ids)), len(self.engine.rule_registry))
+
+    def test_compiled_rules_are_frozen(self) -> None:
+        rule = get_english_rules()[0]
+        self.assertIs(rule, self.engine.rule_registry.rules[0])
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            rule.severity = "error"
+
+    def test_dispatcher_only_selects_rules_whose_triggers_are_present(self) -> None:
+        dispatcher = RuleDispatcher(get_english_rules())
+        selected = {rule.rule_id for rule in dispatcher.rules_for_tokens(["she", "sings", "well"])}
+        self.assertIn("en.required_verb", selected)
+        self.assertIn("en.third_person_s", selected)
+        self.assertNotIn("en.future_will", selected)
+        self.assertNotIn("en.past_perfect", selected)
+        prefixed = {rule.rule_id for rule in dispatcher.rules_for_tokens(["it", "depends", "of", "you"])}
+        self.assertIn("en.preposition_collocation", prefixed)
+
+    def test_dispatched_rules_match_full_rule_evaluation(self) -> None:
+        sentences = [
+            "I will worked tomorrow.",
+            "She suggested me to go early because the weather was getting worse.",
+            "Not only he apologized, but he also helped us with the problem.",
+            "If I had money, I will buy a car.",
+            "It depends of the weather.",
+            "Such a big houses are expensive in this city.",
+            "I wonder where does he live.",
+            "He get on early every day.",
+        ]
+        self.engine.validate_sentence("warm up")
+        with use_lexicon(self.engine.lexicon):
+            for sentence in sentences:
+                analysis = self.engine.sentence_analyzer.analyze_english(sentence)
+                expected = [
+                    issue.rule_id
+                    for rule in self.engine.rule_registry.rules
+                    if (issue := rule.evaluate(analysis)) is not None
+                ]
+                dispatched = [
+                    issue.rule_id
+                    for rule in self.engine.rule_dispatcher.rules_for_tokens(analysis.tokens)
+                    if (issue := rule.evaluate(analysis)) is not None
+                ]
+                self.assertEqual(dispatched, expected, sentence)
+
+    def _make_word_db(self, rows: list[tuple[str, str, str, str]]) -> str:
+        fd, db_path = tempfile.mkstemp(prefix="tle_lexicon_", suffix=".db")
+        os.close(fd)
+        self.addCleanup(os.remove, db_path)
+        con = sqlite3.connect(db_path)
+        con.execute(
+            "CREATE TABLE word (word TEXT, word_normalized TEXT, word_class_id TEXT, traduction TEXT, language_id TEXT)"
+        )
+        con.executemany("INSERT INTO word VALUES (?, ?, ?, ?, 'en')", rows)
+        con.commit()
+        con.close()
+        return db_path
+
+    def test_dictionary_snapshot_streams_rows_into_compact_records(self) -> None:
+        db_path = self._make_word_db(
+            [
+                ("Light", "light", "adjective", "ligero"),
+                ("light", "light", "noun", "luz"),
+                ("light", "light", "noun", "luz"),
+            ]
+        )
+        support = DictionaryLexiconSupport(db_path)
+        with patch.object(lexicon_support_module, "LOAD_BATCH_SIZE", 1):
+            record = support.lookup("light")
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual(record.pos_classes, frozenset({"adjective", "noun"}))
+        self.assertTrue(record.has_pos("verb", "noun"))
+        self.assertFalse(record.has_pos("verb"))
+        self.assertEqual(record.translations, ("ligero", "luz"))
+        self.assertEqual(support.snapshot.adjectives, {"light"})
+
+    def test_dictionary_snapshot_loads_from_mapped_lexicon_file(self) -> None:
+        db_path = self._make_word_db(
+            [("Light", "light", "adjective", "ligero"), ("light", "light", "noun", "luz"), ("to hang out", "to hang out", "verb", "")]
+        )
+        lexicon_path = f"{db_path}.lexicon"
+        self.addCleanup(os.remove, lexicon_path)
+        DictionaryLexiconSupport(db_path).build_lexicon_file()
+
+        con = sqlite3.connect(db_path)
+        con.execute("INSERT INTO word VALUES ('zorb', 'zorb', 'verb', 'zorbear', 'en')")
+        con.commit()
+        con.close()
+
+        support = DictionaryLexiconSupport(db_path)
+        snapshot = support.ensure_loaded()
+        self.assertIsInstance(snapshot.words, lexicon_support_module.MappedWordIndex)
+        self.assertEqual(support.lookup("light").translations, ("ligero", "luz"))
+        self.assertEqual(support.lookup("light").pos_classes, frozenset({"adjective", "noun"}))
+        self.assertIsNone(support.lookup("dark"))
+        self.assertEqual(support.lookup("zorb").pos_classes, frozenset({"verb"}))
+        self.assertEqual(len(snapshot.words), 3)
+        self.assertEqual(snapshot.verbs_base, {"hang", "zorb"})
+        self.assertEqual(snapshot.phrasal_verbs, {"hang": {"out"}})
+
+    def test_truncated_lexicon_file_falls_back_to_the_database(self) -> None:
+        db_path = self._make_word_db([("light", "light", "noun", "luz")])
+        lexicon_path = f"{db_path}.lexicon"
+        open(lexicon_path, "wb").close()
+        self.addCleanup(os.remove, lexicon_path)
+
+        support = DictionaryLexiconSupport(db_path)
+        self.assertEqual(support.lookup("light").translations, ("luz",))
+        self.assertIsInstance(support.snapshot.words, dict)
+
+    def test_lexicon_file_keeps_entries_longer_than_64_kib(self) -> None:
+        long_word = "x" * 70_000
+        db_path = self._make_word_db([(long_word, long_word, "noun", "equis"), ("light", "light", "noun", "luz")])
+        self.addCleanup(os.remove, f"{db_path}.lexicon")
+        DictionaryLexiconSupport(db_path).build_lexicon_file()
+
+        support = DictionaryLexiconSupport(db_path)
+        self.assertIsInstance(support.ensure_loaded().words, lexicon_support_module.MappedWordIndex)
+        self.assertEqual(support.lookup(long_word).word, long_word)
+        self.assertEqual(support.lookup("light").translations, ("luz",))
+
+    def test_engines_keep_separate_dictionary_lexicons(self) -> None:
+        db_path = self._make_word_db(
+            [("zorb", "zorb", "verb", "zorbear"), ("to hang out", "to hang out", "verb", "pasar el rato")]
+        )
+
+        custom = RuleEngine(db_path=db_path)
+        custom.validate_sentence("They zorb every day.")
+        self.engine.validate_sentence("They play every day.")
+
+        self.assertIn("zorb", custom.lexicon.verbs)
+        self.assertEqual(custom.lexicon.phrasal_basic["hang"], frozenset({"out"}))
+        self.assertNotIn("zorb", self.engine.lexicon.verbs)
+        self.assertNotIn("zorb", base_lexicon().verbs)
+        self.assertIs(custom.sentence_analyzer.lexicon, custom.lexicon)
+
+    def test_live_validation_matches_validate_sentence_on_every_keystroke(self) -> None:
+        live = LiveValidation(self.engine)
+        reference = RuleEngine()
+        text = "He can works in the house big"
+        for end in range(1, len(text) + 1):
+            self.assertEqual(live.validate(text[:end]), reference.validate_sentence(text[:end]))
+
+    def test_warm_up_loads_once_and_early_validation_waits_for_it(self) -> None:
+        entered, release = threading.Event(), threading.Event()
+        merge = self.engine.dictionary_lexicon.merge_into_lexicon
+
+        def slow_merge(lexicon, snapshot=None):
+            entered.set()
+            release.wait(5)
+            return merge(lexicon, snapshot)
+
+        phases, compiled_on = [], []
+
+        def compile_rules():
+            compiled_on.append(threading.current_thread().name)
+            return get_compiled_english_rules()
+
+        with patch.object(self.engine.dictionary_lexicon, "merge_into_lexicon", side_effect=slow_merge) as merged, patch(
+            "Services.validation.rule_engine.get_compiled_english_rules", side_effect=compile_rules
+        ):
+            warm_up = self.engine.start_warm_up(progress=phases.append)
+            self.assertTrue(entered.wait(5))
+            self.assertFalse(self.engine.dictionary_lexicon_ready)
+            threading.Timer(0.05, release.set).start()
+            result = self.engine.validate_sentence("He can works.")
+
+        self.assertIsNone(warm_up.result(timeout=5))
+        self.assertIs(self.engine.start_warm_up(), warm_up)
+        self.assertEqual((merged.call_count, phases), (1, ["dictionary", "rules"]))
+        self.assertEqual(compiled_on, ["rule-engine-warm-up"])
+        self.assertIn("en.modal_base_verb", {issue.rule_id for issue in result.warnings})
+
+    def test_validate_many_keeps_input_order_across_workers(self) -> None:
+        texts = ["He can works.", "They depend on us.", "the house big is", "Did you worked yesterday?"] * 3
+        expected = [self.engine.validate_sentence(text) for text in texts]
+        pooled = self.engine.validate_many(texts, workers=2, chunk_size=2)
+        self.assertEqual(pooled, expected)
+        self.assertEqual(self.engine.validate_many(texts, workers=1), expected)
+
+    def test_iter_validate_many_streams_every_index_once(self) -> None:
+        texts = ["I will worked tomorrow.", "She can work now.", "Where you live?"]
+        indices = [idx for idx, _ in self.engine.iter_validate_many(texts, workers=2, chunk_size=1)]
+        self.assertEqual(sorted(indices), [0, 1, 2])
+
 
 if __name__ == "__main__":
     unittest.main()
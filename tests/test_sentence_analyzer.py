@@ -1,6 +1,9 @@
+import threading
 import unittest
 
-from Services.analysis.sentence_analyzer import SentenceAnalyzer
+from Services.analysis.analysis_cache import AnalysisCache
+from Services.analysis.lexicon import base_lexicon
+from Services.analysis.sentence_analyzer import SentenceAnalyzer, TokenProfileTable
 
 
 class SentenceAnalyzerTokenFeatureTests(unittest.TestCase):
@@ -90,6 +93,21 @@ class SentenceAnalyzerTokenFeatureTests(unittest.TestCase):
         self.assertEqual(feature.external_pos, "adjective")
         self.assertEqual(feature.pos_guess, "adjective")
         self.assertIn("external_pos_support", feature.notes)
+        self.assertIn("adjective", feature.pos_candidates)
+
+    def test_token_features_are_stored_as_compact_columns(self) -> None:
+        analysis = self.analyzer.analyze_english("She is working, but they played.")
+        table = analysis.token_features
+        self.assertEqual(len(table), len(analysis.tokens))
+        self.assertEqual(table.pos.itemsize, 1)
+        self.assertEqual([f.token for f in table], analysis.tokens)
+        self.assertEqual([f.index for f in table[1:3]], [1, 2])
+        self.assertEqual(table[-1].token, "played")
+        self.assertTrue(table[2].has_note("progressive_after_be"))
+
+        clause = table.sub_table(4, 6)
+        self.assertEqual([f.index for f in clause], [0, 1])
+        self.assertEqual(clause[1].verb_form_guess, table[5].verb_form_guess)
 
     def test_verb_form_guess_present_simple_base_and_v3sg(self) -> None:
         a1 = self.analyzer.analyze_english("I work.")
@@ -144,6 +162,15 @@ class SentenceAnalyzerTokenFeatureTests(unittest.TestCase):
         self.assertIn(",", puncts)
         self.assertIn(".", puncts)
 
+    def test_raw_token_stream_word_indexes_match_tokens(self) -> None:
+        analysis = self.analyzer.analyze_english("She DOESN'T know, does she?")
+        words = [t for t in analysis.raw_token_stream if t.kind == "word"]
+        self.assertEqual([t.text for t in words], analysis.tokens)
+        self.assertEqual([t.word_index for t in words], list(range(len(analysis.tokens))))
+        self.assertEqual(analysis.tokens[1], "doesn't")
+        self.assertEqual(analysis.raw_token_stream[1].start_char, 4)
+        self.assertEqual(analysis.raw_token_stream[3].kind, "punct")
+
     def test_clause_segmentation_detects_if_clause_and_main_clause(self) -> None:
         analysis = self.analyzer.analyze_english("If it rains, we stay home.")
         self.assertGreaterEqual(len(analysis.clauses), 2)
@@ -301,5 +328,135 @@ class SentenceAnalyzerTokenFeatureTests(unittest.TestCase):
         self.assertEqual(np_the_number.pattern, "the_number_of")
 
 
+class SentenceAnalyzerCacheTests(unittest.TestCase):
+    def test_repeated_sentence_is_served_from_cache(self) -> None:
+        analyzer = SentenceAnalyzer()
+        first = analyzer.analyze_english("She works here.")
+        second = analyzer.analyze_english("  She works here.  ")
+        self.assertIs(second.token_features, first.token_features)
+        self.assertEqual(second.original_text, "  She works here.  ")
+        stats = analyzer.analysis_cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
+    def test_lexicon_change_invalidates_cached_analysis(self) -> None:
+        analyzer = SentenceAnalyzer()
+        first = analyzer.analyze_english("They play soccer.")
+        analyzer.set_lexicon(analyzer.lexicon.merged(verbs={"zorb"}))
+        second = analyzer.analyze_english("They play soccer.")
+        self.assertIsNot(second, first)
+        self.assertEqual(analyzer.analysis_cache.stats().misses, 2)
+
+    def test_lexicon_change_without_new_verbs_keeps_cached_analysis(self) -> None:
+        analyzer = SentenceAnalyzer()
+        first = analyzer.analyze_english("They play soccer.")
+        profiles = analyzer.token_profiles
+        analyzer.set_lexicon(analyzer.lexicon.merged(adjectives={"zorby"}))
+        self.assertIs(analyzer.analyze_english("They play soccer."), first)
+        self.assertIs(analyzer.token_profiles, profiles)
+
+    def test_cache_is_bounded_and_can_be_disabled(self) -> None:
+        analyzer = SentenceAnalyzer(cache_size=2)
+        for text in ("I run.", "You run.", "We run."):
+            analyzer.analyze_english(text)
+        self.assertEqual(len(analyzer.analysis_cache), 2)
+        self.assertEqual(analyzer.analysis_cache.stats().evictions, 1)
+
+        uncached = SentenceAnalyzer(cache_size=0)
+        uncached.analyze_english("I run.")
+        self.assertIsNot(uncached.analyze_english("I run."), uncached.analyze_english("I run."))
+        self.assertEqual(len(uncached.analysis_cache), 0)
+
+    def test_cache_stays_consistent_under_concurrent_puts(self) -> None:
+        cache = AnalysisCache(max_entries=8, max_tokens=40)
+
+        def churn(offset: int) -> None:
+            for i in range(2000):
+                cache.put((offset, i % 32), i, weight=i % 5 + 1)
+                cache.get((offset, (i + 1) % 32))
+
+        threads = [threading.Thread(target=churn, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertLessEqual(stats.entries, 8)
+        self.assertEqual(stats.tokens, sum(weight for _, weight in cache._entries.values()))
+
+    def test_incremental_analysis_matches_full_analysis_while_typing(self) -> None:
+        text = "Yesterday my brother and I were walking to the library, but it started raining."
+        incremental = SentenceAnalyzer(cache_size=0)
+        full = SentenceAnalyzer(cache_size=0)
+        previous = None
+        for end in [*range(1, len(text) + 1), 30, 12, len(text)]:
+            expected = full.analyze_english(text[:end])
+            previous = incremental.analyze_english_incremental(text[:end], previous)
+            self.assertEqual(previous.tokens, expected.tokens)
+            self.assertEqual(
+                [(f.pos_guess, f.pos_candidates, f.notes) for f in previous.token_features],
+                [(f.pos_guess, f.pos_candidates, f.notes) for f in expected.token_features],
+            )
+            self.assertEqual(
+                (previous.sentence_type, previous.has_explicit_subject, previous.subject_number_guess),
+                (expected.sentence_type, expected.has_explicit_subject, expected.subject_number_guess),
+            )
+
+
+class TokenProfileTableTests(unittest.TestCase):
+    def test_known_tokens_resolve_from_precomputed_table(self) -> None:
+        table = TokenProfileTable(base_lexicon())
+        profile = table.profile("they")
+        self.assertIn("they", table.known)
+        self.assertEqual((profile.lexical_pos, profile.lexical_note), ("pronoun", "subject_pronoun"))
+        self.assertEqual(table.profile("must").lexical_verb_form, "modal")
+        self.assertEqual(table.unknown, {})
+
+    def test_unknown_tokens_are_memoized(self) -> None:
+        table = TokenProfileTable(base_lexicon(), memo_size=2)
+        first = table.profile("zorbful")
+        self.assertTrue(first.adjective_shape)
+        self.assertIs(table.profile("zorbful"), first)
+
+        table.profile("blicket")
+        table.profile("wug")
+        self.assertEqual(len(table.unknown), 1)
+
+    def test_table_for_new_verbs_matches_a_fresh_build(self) -> None:
+        table = TokenProfileTable(base_lexicon())
+        lexicon = base_lexicon().merged(verbs={"zorb", "blarry", "stopp"})
+        patched = table.for_lexicon(lexicon)
+        fresh = TokenProfileTable(lexicon)
+        for token in ("zorb", "zorbed", "blarried", "stopped", "stopp", "they", "work", "worked"):
+            self.assertEqual(patched.profile(token), fresh.profile(token), token)
+        self.assertFalse(table.profile("zorbed").ed_inflection)
+        self.assertIs(patched.for_lexicon(lexicon.merged(adjectives={"zorby"})), patched)
+
+
+class LexiconTests(unittest.TestCase):
+    def test_merge_is_copy_on_write_and_versioned(self) -> None:
+        base = base_lexicon()
+        merged = base.merged(verbs={"zorb"}, phrasal_verbs={"zorb": {"up"}, "get": {"over"}})
+        self.assertNotEqual(merged.version, base.version)
+        self.assertIn("zorb", merged.verbs)
+        self.assertNotIn("zorb", base.verbs)
+        self.assertEqual(merged.phrasal_basic["get"], frozenset({"up", "over"}))
+        self.assertEqual(base.phrasal_basic["get"], frozenset({"up"}))
+        with self.assertRaises(ValueError):
+            base.merged(nouns={"x"})
+
+    def test_merge_without_new_words_returns_the_same_lexicon(self) -> None:
+        base = base_lexicon()
+        self.assertIs(base.merged(verbs={"work"}, phrasal_verbs={"get": {"up"}}), base)
+        merged = base.merged(verbs={"zorb"})
+        self.assertIs(merged.adjectives, base.adjectives)
+        self.assertIs(merged.phrasal_basic, base.phrasal_basic)
+
+    def test_analyzers_with_different_lexicons_share_a_process(self) -> None:
+        plain = SentenceAnalyzer()
+        extended = SentenceAnalyzer(lexicon=base_lexicon().merged(verbs={"zorb"}))
+        self.assertFalse(plain.token_profiles.profile("zorbed").ed_inflection)
+        self.assertTrue(extended.token_profiles.profile("zorbed").ed_inflection)
+
+
 if __name__ == "__main__":
     unittest.main()
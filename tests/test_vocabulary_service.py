@@ -6,13 +6,18 @@ from unittest.mock import patch
 try:
     from peewee import IntegrityError
     from Models.base_model import db
+    from Models.connection_profile import SQLITE_PRAGMAS, connect_sqlite
     from Models.word_model import Word
     from Models.oration_model import Oration
+    from Models.oration_analysis_model import OrationAnalysis
+    from Models.review_state_model import ReviewState
     from Services.storage.vocabulary_service import (
         InvalidEnglishExampleError,
+        SaveCancelledError,
         VocabularyService,
         normalize_english_key,
     )
+    from Services.validation.dictionary_lexicon_support import WORD_CHANGE_LOG_TABLE, DictionaryLexiconSupport
     PEEWEE_AVAILABLE = True
 except ModuleNotFoundError:
     PEEWEE_AVAILABLE = False
@@ -25,7 +30,7 @@ class VocabularyServiceTests(unittest.TestCase):
         os.close(fd)
         if not db.is_closed():
             db.close()
-        db.init(self.db_path, pragmas={"foreign_keys": 1})
+        db.init(self.db_path, pragmas=SQLITE_PRAGMAS)
         self.service = VocabularyService()
         self.service.initialize_database()
 
@@ -53,17 +58,60 @@ class VocabularyServiceTests(unittest.TestCase):
             )
 
     def test_allows_non_blocking_warning_and_saves(self) -> None:
-        word, validation = self.service.create_vocabulary_entry(
+        entry, validation = self.service.create_vocabulary_entry(
             english_word="interest",
             spanish_meaning="interes",
             example_english="I am interested on music.",
             example_spanish="Estoy interesado en la musica.",
         )
-        self.assertIsNotNone(word.id)
+        self.assertEqual(entry, self.service.get_vocabulary_entry(entry.word_id))
         self.assertTrue(any(issue.rule_id == "en.preposition_collocation" for issue in validation.warnings))
         self.assertEqual(Word.select().count(), 1)
         self.assertEqual(Oration.select().count(), 1)
 
+    def test_cancelled_save_validates_but_writes_nothing(self) -> None:
+        checks = []
+
+        def superseded() -> bool:
+            checks.append(True)
+            return True
+
+        with self.assertRaises(SaveCancelledError):
+            self.service.create_vocabulary_entry(
+                "house", "casa", "The house is big.", "La casa es grande.", is_cancelled=superseded
+            )
+        self.assertEqual(checks, [True])
+        self.assertEqual((Word.select().count(), Oration.select().count()), (0, 0))
+
+        # Invalid examples are still reported: cancellation is only checked after validating.
+        with self.assertRaises(InvalidEnglishExampleError):
+            self.service.create_vocabulary_entry(
+                "house", "casa", "the house big is", "la casa grande es", is_cancelled=superseded
+            )
+
+    def test_save_superseded_while_waiting_for_the_write_lock_writes_nothing(self) -> None:
+        checks = []
+
+        def superseded_after_validation() -> bool:
+            checks.append(True)
+            return len(checks) > 1
+
+        with self.assertRaises(SaveCancelledError):
+            self.service.create_vocabulary_entry(
+                "house", "casa", "The house is big.", "La casa es grande.", is_cancelled=superseded_after_validation
+            )
+        self.assertEqual(len(checks), 2)
+        self.assertEqual((Word.select().count(), Oration.select().count()), (0, 0))
+
+        entry, _ = self.service.create_vocabulary_entry("house", "casa", "The house is big.", "La casa es grande.")
+        checks.clear()
+        with self.assertRaises(SaveCancelledError):
+            self.service.update_vocabulary_entry(
+                entry.word_id, "home", "hogar", "The home is big.", "El hogar es grande.",
+                is_cancelled=superseded_after_validation,
+            )
+        self.assertEqual(Word.get_by_id(entry.word_id).word, "house")
+
     def test_rollback_when_oration_create_fails(self) -> None:
         def failing_create(*args, **kwargs):
             raise RuntimeError("boom")
@@ -95,6 +143,215 @@ class VocabularyServiceTests(unittest.TestCase):
                 traduction="casa",
             )
 
+    def test_saving_entry_persists_example_analysis(self) -> None:
+        entry, _ = self._create_valid_entry(english_word="house", example="I worked yesterday.")
+        row = OrationAnalysis.get()
+        self.assertEqual(row.engine_version, self.service.rule_engine.engine_version)
+        self.assertEqual(row.primary_tense, "past_simple")
+
+        summaries = self.service.get_example_analysis_summaries()
+        self.assertEqual(summaries[entry.word_id].primary_tense, "past_simple")
+
+    def test_stale_example_analysis_is_recomputed_lazily(self) -> None:
+        entry, _ = self._create_valid_entry(english_word="house", example="I worked yesterday.")
+        OrationAnalysis.update(engine_version="old", primary_tense="").execute()
+
+        summaries = self.service.get_example_analysis_summaries()
+        self.assertEqual(summaries[entry.word_id].primary_tense, "past_simple")
+        self.assertEqual(OrationAnalysis.get().engine_version, self.service.rule_engine.engine_version)
+
+        with patch.object(self.service.analysis_store, "summarize", side_effect=AssertionError("recomputed")):
+            self.assertEqual(self.service.get_example_analysis_summaries()[entry.word_id].primary_tense, "past_simple")
+
+    def test_summaries_on_a_cold_engine_use_the_dictionary_lexicon(self) -> None:
+        Word.create(id="zorbid", word="zorb", word_normalized="zorb", word_class="verb", language="en", traduction="zorbear")
+        Oration.create(id="o1", word="zorbid", text="They zorbed the box.", traduction="Zorbearon la caja.")
+
+        cold_service = VocabularyService()
+        self.assertFalse(cold_service.rule_engine.dictionary_lexicon_ready)
+        self.assertEqual(cold_service.get_example_analysis_summaries()["zorbid"].primary_tense, "past_simple")
+
+    def test_lexicon_refresh_picks_up_new_and_edited_words(self) -> None:
+        engine = self.service.rule_engine
+        engine.validate_sentence("I work.")
+        version = engine.lexicon.version
+
+        Word.create(
+            id="zorbid",
+            word="zorb",
+            word_normalized="zorb",
+            word_class="verb",
+            language="en",
+            traduction="zorbear",
+        )
+        self.assertTrue(engine.refresh_dictionary_lexicon())
+        self.assertIn("zorb", engine.lexicon.verbs)
+        self.assertNotEqual(engine.lexicon.version, version)
+        self.assertFalse(engine.refresh_dictionary_lexicon())
+
+        Word.update(traduction="zorbar").where(Word.id == "zorbid").execute()
+        self.assertFalse(engine.refresh_dictionary_lexicon())
+        self.assertEqual(engine.lookup_dictionary_word("zorb")["translations"], ["zorbar", "zorbear"])
+
+        Word.update(word_class="adjective").where(Word.id == "zorbid").execute()
+        self.assertTrue(engine.refresh_dictionary_lexicon())
+        self.assertIn("zorb", engine.lexicon.adjectives)
+        self.assertEqual(engine.lookup_dictionary_word("zorb")["pos_classes"], ["adjective", "verb"])
+
+    def test_lexicon_refresh_prunes_the_change_log(self) -> None:
+        engine = self.service.rule_engine
+        engine.validate_sentence("I work.")
+        Word.create(id="zorbid", word="zorb", word_normalized="zorb", word_class="verb", language="en", traduction="zorbear")
+        other = DictionaryLexiconSupport(self.db_path)
+        other.ensure_loaded()
+
+        Word.update(word_class="adjective").where(Word.id == "zorbid").execute()
+        self.assertTrue(engine.refresh_dictionary_lexicon())
+        self.assertEqual(db.execute_sql(f"SELECT COUNT(*) FROM {WORD_CHANGE_LOG_TABLE}").fetchone()[0], 0)
+
+        # `other` had not read the pruned edit yet, so it loads the table again.
+        self.assertIn("zorb", other.refresh().adjectives)
+        self.assertEqual(other.lookup("zorb").pos_classes, frozenset({"adjective"}))
+
+    def test_mapped_lexicon_that_missed_pruned_changes_is_replaced_by_a_full_load(self) -> None:
+        engine = self.service.rule_engine
+        engine.validate_sentence("I work.")
+        Word.create(id="zorbid", word="zorb", word_normalized="zorb", word_class="verb", language="en", traduction="zorbear")
+        self.addCleanup(os.remove, DictionaryLexiconSupport(self.db_path).build_lexicon_file())
+
+        Word.update(word_class="adjective").where(Word.id == "zorbid").execute()
+        self.assertTrue(engine.refresh_dictionary_lexicon())
+
+        # As if another process pruned the edit right after the file was checked against the database.
+        support = DictionaryLexiconSupport(self.db_path)
+        with patch.object(DictionaryLexiconSupport, "_file_matches_database", return_value=True):
+            snapshot = support.ensure_loaded()
+        self.assertIs(snapshot, support.snapshot)
+        self.assertEqual(snapshot.words.get("zorb").pos_classes, frozenset({"adjective"}))
+
+    def test_list_vocabulary_entries_uses_one_query_and_first_example(self) -> None:
+        for word_id, english in (("w2", "zebra"), ("w1", "apple"), ("w3", "mango")):
+            Word.create(id=word_id, word=english, word_normalized=english, word_class="noun", language="en", traduction=english)
+        Oration.create(id="o2", word="w1", text="Second apple.", traduction="Segunda.")
+        Oration.create(id="o1", word="w1", text="First apple.", traduction="Primera.")
+        Oration.create(id="o3", word="w2", text="A zebra.", traduction="Una cebra.")
+
+        statements = []
+        db.connection().set_trace_callback(statements.append)
+        try:
+            entries = self.service.list_vocabulary_entries()
+        finally:
+            db.connection().set_trace_callback(None)
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual([e.english_word for e in entries], ["apple", "mango", "zebra"])
+        self.assertEqual((entries[0].example_english, entries[0].example_spanish), ("First apple.", "Primera."))
+        self.assertEqual((entries[1].example_english, entries[1].example_spanish), ("", ""))
+        self.assertEqual(entries[2].example_english, "A zebra.")
+
+    def test_vocabulary_pages_follow_listing_order_without_gaps(self) -> None:
+        for index, english in enumerate(["pear", "apple", "fig", "apple", "kiwi"]):
+            Word.create(id=f"w{index}", word=english, word_normalized=f"{english}{index}", word_class="noun", language="en", traduction=english)
+        Oration.create(id="o1", word="w4", text="A kiwi.", traduction="Un kiwi.")
+
+        pages = []
+        page = self.service.list_vocabulary_page(limit=2)
+        while page:
+            pages.append([entry.word_id for entry in page])
+            page = self.service.list_vocabulary_page(after=page[-1], limit=2)
+
+        self.assertEqual(pages, [["w1", "w3"], ["w2", "w4"], ["w0"]])
+        self.assertEqual(self.service.get_vocabulary_entry("w4").example_english, "A kiwi.")
+        self.assertIsNone(self.service.get_vocabulary_entry("missing"))
+
+    def test_update_returns_the_entry_as_listed(self) -> None:
+        entry, _ = self._create_valid_entry(english_word="house", example="The house is big.")
+        Oration.create(id="z" * 32, word=entry.word_id, text="A second house.", traduction="Una segunda casa.")
+
+        updated, _ = self.service.update_vocabulary_entry(
+            entry.word_id, "home", "hogar", "The home is warm.", "El hogar es calido."
+        )
+        self.assertEqual(updated, self.service.get_vocabulary_entry(entry.word_id))
+        self.assertEqual((updated.english_word, updated.example_english), ("home", "The home is warm."))
+
+    def test_game_round_pool_is_loaded_once_and_kept_current_by_saves(self) -> None:
+        house, _ = self._create_valid_entry(english_word="house", example="I worked yesterday.")
+        pool = self.service.game_round_pool
+        rounds = self.service.list_game_rounds()
+        self.assertEqual([(r.entry.word_id, r.tense_label) for r in rounds], [(house.word_id, "pasado")])
+
+        # Saved while the snapshot above was being built: replayed over it on load.
+        book, _ = self._create_valid_entry(english_word="book", example="We will visit the library.")
+        pool.load(rounds, {})
+        self.assertEqual(pool.get(book.word_id).tense_label, "futuro")
+
+        self.service.update_vocabulary_entry(house.word_id, "house", "casa", "I live in a big house.", "Vivo en una casa grande.")
+        self.assertEqual(pool.get(house.word_id).tense_label, "presente")
+        self.service.update_vocabulary_entry(book.word_id, "book", "libro", "I will buy a book.", "Comprare un libro.")
+        self.assertIsNone(pool.get(book.word_id))
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(pool.next_round().entry.word_id, house.word_id)
+
+    def test_game_reviews_follow_sm2_and_reorder_the_due_queue(self) -> None:
+        house, _ = self._create_valid_entry(english_word="house", example="I worked yesterday.")
+        book, _ = self._create_valid_entry(english_word="book", example="We will visit the library.")
+        pool = self.service.game_round_pool
+        pool.load(self.service.list_game_rounds(), self.service.list_review_due_dates(), now=100.0)
+        first = pool.next_round().entry.word_id
+        other = book.word_id if first == house.word_id else house.word_id
+        self.assertEqual(pool.next_round(skip_word_id=first).entry.word_id, other)
+
+        day = 24 * 60 * 60
+        schedule = self.service.record_game_review(first, True, True, now=1000.0)
+        self.assertEqual((schedule.repetitions, schedule.due_at), (1, 1000.0 + day))
+        self.assertEqual(pool.next_round().entry.word_id, other)
+        schedule = self.service.record_game_review(first, True, True, now=2000.0)
+        self.assertEqual((schedule.interval_days, schedule.due_at), (6.0, 2000.0 + 6 * day))
+
+        missed = self.service.record_game_review(other, False, True, now=3000.0)
+        self.assertEqual((missed.repetitions, missed.lapses, missed.due_at), (0, 1, 3000.0 + 600))
+        self.assertLess(missed.ease, 2.5)
+        self.assertEqual(pool.next_round().entry.word_id, other)
+
+        self.assertEqual(self.service.list_review_due_dates(), {other: 3600.0, first: 2000.0 + 6 * day})
+        plan = self._query_plan(ReviewState.select(ReviewState.word, ReviewState.due_at).order_by(ReviewState.due_at))
+        self.assertIn("COVERING INDEX reviewstate_due", plan)
+
+    def _query_plan(self, query) -> str:
+        sql, params = query.sql()
+        return " | ".join(row[-1] for row in db.execute_sql(f"EXPLAIN QUERY PLAN {sql}", params))
+
+    def test_catalog_queries_use_covering_index_without_temp_sort(self) -> None:
+        for query in (self.service._catalog_entry_query(), self.service._catalog_entry_query("house").limit(1)):
+            plan = self._query_plan(query)
+            self.assertIn("COVERING INDEX dictionaryentry_catalog_lookup", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+        word_plan = self._query_plan(self.service._catalog_word_query("house").limit(1))
+        self.assertIn("SEARCH", word_plan)
+        self.assertIn("(language_id=? AND word_normalized=?)", word_plan)
+
+    def test_catalog_lookup_with_cold_cache_does_not_load_the_catalog(self) -> None:
+        Word.create(id="w1", word="House", word_normalized="house", word_class="noun", language="en", traduction="casa")
+        match = self.service.lookup_catalog_word("house")
+        self.assertEqual((match.english_word, match.source), ("House", "word_fallback"))
+        self.assertFalse(self.service.catalog_cache.loaded)
+        self.assertIsNone(self.service.lookup_catalog_word("garden"))
+
+    def test_readers_and_writer_do_not_block_each_other(self) -> None:
+        self.assertEqual(db.execute_sql("PRAGMA journal_mode").fetchone()[0], "wal")
+        self._create_valid_entry(english_word="house", example="The house is big.")
+
+        reader = connect_sqlite(self.db_path)
+        self.addCleanup(reader.close)
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM word").fetchone()
+
+        # Committing while the reader holds its snapshot would hit the busy timeout in rollback-journal mode.
+        Word.update(word_class="noun").where(Word.word == "house").execute()
+        self.assertEqual(reader.execute("SELECT word_class_id FROM word").fetchone()[0], "unknown")
+        reader.execute("COMMIT")
+        self.assertEqual(reader.execute("SELECT word_class_id FROM word").fetchone()[0], "noun")
 
 if __name__ == "__main__":
     unittest.main()